@@ -1,10 +1,27 @@
 from __future__ import annotations
-from typing import Dict, List, Union
-from multiprocessing import Process
-from multiprocessing.connection import PipeConnection
+from typing import BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple, Union
+from sys import maxsize
+from copy import copy
+from functools import partial
+from time import perf_counter, sleep
+try:
+    from os import sched_yield
+except ImportError: # Unix only, sleeping 0s yields elsewhere
+    sched_yield: Callable[[], None] = lambda: sleep(0)
+from json import dumps
+from multiprocessing import Event, Process
+try:
+    from multiprocessing.connection import PipeConnection
+except ImportError: # Windows only, pipes are plain Connections elsewhere
+    from multiprocessing.connection import Connection as PipeConnection
 from io import TextIOWrapper
 from sys import stdin, stdout
 from enum import IntEnum
+from itertools import product
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from multiprocessing.shared_memory import SharedMemory
 
     #####################
     # OPCODES CONSTANTS #
@@ -69,7 +86,1699 @@ class IO_METHOD(IntEnum):
     TIOW = 0 # TextIOWrapper expected
     LIST = 1 # List expected
     PIPE = 2 # Multiprocessing Connection expected
+    FRAMED = 3 # FramedPipe expected
+    RING = 4 # SharedRing expected
+    
+class IO_EVENT(IntEnum):
+    """Kinds of events recorded by I/O sessions"""
+    IN = 0 # A value was read
+    OUT = 1 # A value was written
+    
+SESSION_MAGIC: bytes = b"ICIOSES2" # First bytes of an I/O session file
+
+class FRAME_FLAG(IntEnum):
+    """What the sender of a frame does next, as told by the frame's header (see FramedPipe)"""
+    MORE = 0 # Keeps sending (its buffer was full)
+    WAITING = 1 # Waits for an answer (an intcom starving for input)
+    CLOSED = 2 # Stops sending (an halted intcom)
+
+FRAME_TEXT: int = 4 # Header bit of frames whose values don't all fit in int64s, sent as text instead
+DEFAULT_FRAME_SIZE: int = 4096 # Values a framed pipe buffers before sending them
+
+# Header int64 slots of shared rings, the writer's and the reader's on their own cache lines
+RING_HEAD: int = 0 # Values written so far (writer)
+RING_WRITER_WAITING: int = 1 # Whether the writer waits for room (writer)
+RING_CLOSED: int = 2 # Whether the writer said it stopped writing (writer)
+RING_TAIL: int = 8 # Values read so far (reader)
+RING_READER_WAITING: int = 9 # Whether the reader waits for a value (reader)
+RING_HEADER_SIZE: int = 16
+
+RING_BIG_MARK: int = -(1 << 63) # Slot marking a big int, followed by its signed number of limbs, then its limbs
+RING_LIMB_SHIFT: int = 63 # Big ints limbs are 63 bits, so that they fit in int64s
+RING_YIELDS: int = 64 # Times rings yield the CPU before waiting on their event
+RING_WAIT_SLICE: float = 0.01 # Seconds rings wait for their event at most, before checking again (no wake up is lost for longer)
+DEFAULT_RING_CAPACITY: int = 4096 # Slots of a shared ring
+
+    ####################
+    # ENGINE CONSTANTS #
+    ####################
+        
+class ENGINE(IntEnum):
+    """Intcom's execution engines enumeration"""
+    CYCLE = 0 # Classic CPU cycle : one FETCH->DECODE->EXECUTE per instruction
+    TABLE = 1 # Table-driven dispatch on raw opcodes, with hot state kept in locals
+    BLOCK = 2 # Straight-line basic blocks compiled to Python functions
+
+    ####################
+    # STATUS CONSTANTS #
+    ####################
+        
+class STATUS(IntEnum):
+    """Why an Intcom stopped running, as returned by run_until and step"""
+    NEEDS_INPUT = 0 # Next instruction is an input, and there is none available
+    HAS_OUTPUT = 1 # An output was just produced
+    HALTED = 2 # Program halted
+    BUDGET_EXHAUSTED = 3 # Given number of instructions was executed
+    LIMIT_REACHED = 4 # Intcom executed its maxInstructions, it won't run any further
+    TIMED_OUT = 5 # Run lasted the intcom's timeLimit, and was stopped by its watchdog
+    LOOPING = 6 # Program was proven to loop forever (see Intcom's detectLoops)
+
+# Stops that undo the input instruction they happened in, which runs again next time
+UNDONE_STATUSES: Tuple[STATUS, ...] = (STATUS.NEEDS_INPUT, STATUS.TIMED_OUT)
+
+# Engines run at most this many instructions at once, so that their counters stay small ints (way faster)
+BUDGET_CHUNK: int = 1 << 29
+WATCHDOG_CHUNK: int = 1 << 14 # Instructions engines run between two checks of the watchdog
+LOOP_HISTORY: int = 1 << 16 # States loop detection remembers at most, before forgetting them all
+
+    ###################
+    # TRACE CONSTANTS #
+    ###################
+
+TRACE_MAGIC: bytes = b"ICTRACE2" # First bytes of a trace file
+TRACE_TRANSFER_SIZE: int = 2 # int64 slots of a recorded control transfer : position of the instruction run at the target, and target
+TRACE_WRITE_SIZE: int = 2 # int64 slots of a recorded write : address and value
+TRACE_DEFINITION_SIZE: int = 6 # int64 slots of an instruction definition : position, address, raw opcode, then 3 operands
+DEFAULT_TRACE_CAPACITY: int = 1 << 20 # Instructions a flushed trace holds, and a traced run runs between two checkpoints
+
+    ####################
+    # MEMORY CONSTANTS #
+    ####################
+
+PAGE_SHIFT: int = 7 # RAM pages hold 2**PAGE_SHIFT cells
+PAGE_SIZE: int = 1 << PAGE_SHIFT
+PAGE_MASK: int = PAGE_SIZE - 1
+
+    ################
+    # MEMORY PAGES #
+    ################
+
+# Page read when reading an unmapped page, must never be written
+ZERO_PAGE: array = array('q', bytes(PAGE_SIZE * 8))
+
+
+class OverflowPage(object):
+    """Read view of a page holding values that don't fit in an int64"""
+    
+    __slots__ = ('page', 'overflow')
+    
+    def __init__(self, page: array, overflow: Dict[int, int]) -> None:
+        self.page: array = page
+        self.overflow: Dict[int, int] = overflow
+        
+    def __getitem__(self, offset: int) -> int:
+        return self.overflow.get(offset, self.page[offset])
+    
+    
+class ReadPages(dict):
+    """Page table used to read memory : missing pages are looked up in the base image's pages, and
+    read as ZERO_PAGE if they are not there either, without being allocated"""
+    
+    def __init__(self, basePages: Dict[int, memoryview]=None) -> None:
+        super().__init__()
+        self.basePages: Dict[int, memoryview] = basePages if basePages is not None else dict()
+    
+    def __missing__(self, pageNum: int) -> array:
+        if pageNum < 0:
+            raise ValueError(f"RAM ACCESS ERROR : Loading a negative address is forbidden (page:{pageNum})")
+        
+        page: memoryview = self.basePages.get(pageNum)
+        if page is None:
+            return ZERO_PAGE
+        self[pageNum] = page # Shared until the first write to it
+        return page
+    
+    ##############################
+    # SHARED PROGRAM IMAGE CLASS #
+    ##############################
+
+class ProgramImage(Mapping):
+    """Read-only image of a program, shared by every Intcom it is given to : their RAM reads its
+    pages until they write to them, then work on private copies (copy-on-write). Building an Intcom
+    from an image doesn't copy the program.
+    
+    A shared image lives in shared memory, and can be passed to other processes (as a Process
+    argument, through a Pool...) without being copied. It has to be closed by the process that
+    created it once every Intcom using it is done, so that its shared memory gets freed."""
+    
+    def __init__(self, prog: Dict[int, int], shared: bool=False) -> None:
+        """Initializes a program image
+        
+        Arguments:
+            prog {Dict[int, int]} -- The program, as given by list_to_dict
+            
+        Keyword Arguments:
+            shared {bool} -- Whether the image lives in shared memory (default: {False})
+            
+        Raises:
+            ValueError -- Programs can't have negative addresses
+        """
+        
+        self.length: int = max(prog) + 1 if len(prog) > 0 else 0
+        size: int = -(-self.length // PAGE_SIZE) * PAGE_SIZE * 8
+        
+        self.sharedMemory: SharedMemory = None
+        self.owner: bool = True # Only the creator of a shared memory frees it
+        if shared:
+            self.sharedMemory = SharedMemory(create=True, size=max(size, 1))
+            buffer: memoryview = self.sharedMemory.buf
+        else:
+            buffer = bytearray(size)
+        cells: memoryview = memoryview(buffer)[:size].cast('q')
+        
+        overflows: Dict[int, Dict[int, int]] = dict()
+        for addr, val in prog.items():
+            if addr < 0:
+                raise ValueError(f"RAM ACCESS ERROR : Programs can't have negative addresses (addr:{addr})")
+            try:
+                cells[addr] = val
+            except ValueError: # Doesn't fit in an int64
+                overflows.setdefault(addr >> PAGE_SHIFT, dict())[addr & PAGE_MASK] = val
+        
+        self._attach(cells, overflows)
+        
+    def _attach(self, cells: memoryview, overflows: Dict[int, Dict[int, int]]) -> None:
+        """Builds the image's pages from its cells
+
+        Arguments:
+            cells {memoryview} -- Cells of the image, as int64s
+            overflows {Dict[int, Dict[int, int]]} -- Overflowing values of a page, by offset
+        """
+        
+        self.cells: memoryview = cells.toreadonly()
+        self.overflows: Dict[int, Dict[int, int]] = overflows
+        self.decodeCache: Dict[int, DecodedInstruction] = dict() # Instructions decoded by Intcoms of this process, by address
+        self.pages: Dict[int, Union[memoryview, OverflowPage]] = dict()
+        
+        for pageNum in range(len(self.cells) // PAGE_SIZE):
+            page: memoryview = self.cells[pageNum * PAGE_SIZE:(pageNum + 1) * PAGE_SIZE]
+            self.pages[pageNum] = page if pageNum not in overflows else OverflowPage(page, overflows[pageNum])
+            
+    def close(self) -> None:
+        """Frees the image's shared memory, if it has some. Intcoms using it must be gone beforehand"""
+        
+        if self.sharedMemory is not None:
+            for page in self.pages.values():
+                (page.page if isinstance(page, OverflowPage) else page).release()
+            self.pages.clear()
+            self.cells.release()
+            self.sharedMemory.close()
+            if self.owner:
+                self.sharedMemory.unlink()
+            self.sharedMemory = None
+            
+    def __del__(self) -> None:
+        """Images unpickled by other processes are closed once they are not used anymore"""
+        
+        if getattr(self, 'sharedMemory', None) is not None:
+            self.close()
+            
+    def __enter__(self) -> ProgramImage:
+        return self
+    
+    def __exit__(self, *excInfos) -> None:
+        self.close()
+        
+    def __getstate__(self) -> Dict[str, object]:
+        """Shared images are pickled by the name of their shared memory, others by their cells"""
+        
+        state: Dict[str, object] = {'length': self.length, 'overflows': self.overflows}
+        if self.sharedMemory is not None:
+            state['name'] = self.sharedMemory.name
+            state['size'] = len(self.cells) * 8
+        else:
+            state['cells'] = self.cells.tobytes()
+        return state
+    
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.length = state['length']
+        self.owner = False
+        
+        if 'name' in state:
+            self.sharedMemory = SharedMemory(name=state['name'])
+            cells: memoryview = memoryview(self.sharedMemory.buf)[:state['size']].cast('q')
+        else:
+            self.sharedMemory = None
+            cells = memoryview(bytearray(state['cells'])).cast('q')
+            
+        self._attach(cells, state['overflows'])
+        
+    def __getitem__(self, addr: int) -> int:
+        if not 0 <= addr < self.length:
+            raise KeyError(addr)
+        return self.pages[addr >> PAGE_SHIFT][addr & PAGE_MASK]
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.length))
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    ######################
+    # PAGED MEMORY CLASS #
+    ######################
+
+
+class PagedMemory(object):
+    """Intcom's RAM : fixed-size pages of int64 arrays, allocated on first write. Reading a page that
+    was never written returns 0 without allocating it. Values that don't fit in an int64 are kept in
+    their page's overflow map.
+    
+    Given a ProgramImage, the memory reads its pages and only copies the ones it writes to.
+    Snapshots work the same way : snapshot() freezes private pages, which are then only copied when
+    written to, by the memory and by any memory restored from the snapshot.
+    
+    Engines access pages directly : ``readPages`` reads any page (see ReadPages and OverflowPage),
+    and ``writePages`` holds every page whose cells can be written as they are (shared pages and
+    pages with overflowing values are not in it). Anything else goes through store()."""
+    
+    def __init__(self, prog: Union[Dict[int, int], ProgramImage]=None) -> None:
+        """Initializes a memory, loading a program in it. Images are not copied.
+
+        Keyword Arguments:
+            prog {Union[Dict[int, int], ProgramImage]} -- The program to load (default: {None})
+        """
+        
+        self.image: ProgramImage = prog if isinstance(prog, ProgramImage) else None
+        self.pages: Dict[int, array] = dict() # Every private page, by page number
+        self.overflows: Dict[int, Dict[int, int]] = dict() # Overflowing values of a page, by offset
+        self.readPages: ReadPages = ReadPages(None if self.image is None else self.image.pages)
+        self.writePages: Dict[int, array] = dict()
+        self.edits: int = 0 # Stores and restores so far, to tell whether hosts changed the memory (engines only store on slow paths)
+        
+        if prog is not None and self.image is None:
+            for addr, val in prog.items():
+                self.store(addr, val)
+        
+    def _allocate(self, pageNum: int) -> array:
+        """Allocates a private page, copied from the image's page if it has one, zero-filled otherwise
+
+        Arguments:
+            pageNum {int} -- The page's number
+
+        Returns:
+            array -- The allocated page
+        """
+        
+        basePage: Union[memoryview, OverflowPage] = self.readPages.basePages.get(pageNum)
+        if basePage is None:
+            page: array = array('q', bytes(PAGE_SIZE * 8))
+        elif isinstance(basePage, OverflowPage):
+            page = array('q', basePage.page.tobytes())
+            self.overflows[pageNum] = dict(basePage.overflow)
+        else:
+            page = array('q', basePage.tobytes())
+            
+        self.pages[pageNum] = page
+        if pageNum in self.overflows:
+            self.readPages[pageNum] = OverflowPage(page, self.overflows[pageNum])
+        else:
+            self.readPages[pageNum] = page
+            self.writePages[pageNum] = page
+        return page
+        
+    def load(self, addr: int) -> int:
+        """Loads a value from memory
+
+        Arguments:
+            addr {int} -- Address to load
+
+        Returns:
+            int -- Value at given address
+            
+        Raises:
+            ValueError -- Access to a negative address is forbidden
+        """
+        
+        if addr < 0:
+            raise ValueError(f"RAM ACCESS ERROR : Loading a negative address is forbidden (addr:{addr})")
+        
+        return self.readPages[addr >> PAGE_SHIFT][addr & PAGE_MASK]
+    
+    def store(self, addr: int, val: int) -> None:
+        """Stores a value in memory
+
+        Arguments:
+            addr {int} -- The address where to store the value
+            val {int} -- The value to store
+        
+        Raises:
+            ValueError -- Access to a negative address is forbidden
+        """
+        
+        if addr < 0:
+            raise ValueError(f"RAM ACCESS ERROR : Writing to a negative address is forbidden (addr:{addr})")
+        
+        self.edits += 1
+        pageNum: int = addr >> PAGE_SHIFT
+        offset: int = addr & PAGE_MASK
+        page: array = self.pages.get(pageNum)
+        if page is None:
+            if val == 0 and pageNum not in self.readPages.basePages: # Unmapped pages already read as 0
+                return
+            page = self._allocate(pageNum)
+        
+        overflow: Dict[int, int] = self.overflows.get(pageNum)
+        try:
+            page[offset] = val
+        except OverflowError: # Page leaves the fast tables until its last big value is overwritten
+            page[offset] = 0
+            if overflow is None:
+                overflow = self.overflows[pageNum] = dict()
+                self.readPages[pageNum] = OverflowPage(page, overflow)
+                del self.writePages[pageNum]
+            overflow[offset] = val
+            return
+        
+        if overflow is not None and overflow.pop(offset, None) is not None and len(overflow) == 0:
+            del self.overflows[pageNum]
+            self.readPages[pageNum] = page
+            self.writePages[pageNum] = page
+            
+    def snapshot(self) -> Dict[int, Union[array, memoryview, OverflowPage]]:
+        """Freezes the memory's content : private pages stop being written, and become base pages the
+        memory copies on its next write to them. Taking a snapshot copies no page.
+
+        Returns:
+            Dict[int, Union[array, memoryview, OverflowPage]] -- The frozen pages, to give to restore(). They must never be written.
+        """
+        
+        frozen: Dict[int, Union[array, memoryview, OverflowPage]] = dict(self.readPages.basePages)
+        for pageNum, page in self.pages.items():
+            frozen[pageNum] = page if pageNum not in self.overflows else OverflowPage(page, self.overflows[pageNum])
+        
+        self.restore(frozen)
+        return frozen
+    
+    def restore(self, frozen: Dict[int, Union[array, memoryview, OverflowPage]]) -> None:
+        """Brings the memory back to a snapshot's content. Pages are copied on their first write.
+
+        Arguments:
+            frozen {Dict[int, Union[array, memoryview, OverflowPage]]} -- The frozen pages, as returned by snapshot()
+        """
+        
+        self.pages.clear()
+        self.overflows.clear()
+        self.writePages.clear()
+        self.readPages.clear()
+        self.readPages.basePages = frozen
+        self.edits += 1
+        
+    def shares(self, start: int, end: int) -> bool:
+        """Tells whether cells are all still read from the image (none of their pages was written)
+
+        Arguments:
+            start {int} -- Address of the first cell
+            end {int} -- Address right after the last cell
+        """
+        
+        if self.image is None:
+            return False
+        basePages: Dict[int, Union[memoryview, OverflowPage]] = self.readPages.basePages
+        imagePages: Dict[int, Union[memoryview, OverflowPage]] = self.image.pages
+        return all(pageNum not in self.pages and basePages.get(pageNum) is imagePages.get(pageNum)
+                   for pageNum in range(start >> PAGE_SHIFT, ((end - 1) >> PAGE_SHIFT) + 1))
+            
+    def usage(self) -> Dict[str, int]:
+        """Returns the memory's usage report : resident (private) pages, pages still shared with the
+        image or snapshots, page size (in cells), resident bytes and overflowing cells"""
+        
+        return {'residentPages': len(self.pages),
+                'sharedPages': len(self.readPages.basePages.keys() - self.pages.keys()),
+                'pageSize': PAGE_SIZE,
+                'residentBytes': len(self.pages) * PAGE_SIZE * 8,
+                'overflowCells': sum(len(overflow) for overflow in self.overflows.values())}
+            
+    def items(self) -> Iterator[Tuple[int, int]]:
+        """Iterates over every non-zero cell, by address order"""
+        
+        for pageNum in sorted(self.pages.keys() | self.readPages.basePages.keys()):
+            page: Union[array, memoryview, OverflowPage] = self.readPages[pageNum]
+            for offset in range(PAGE_SIZE):
+                if page[offset] != 0:
+                    yield (pageNum << PAGE_SHIFT) | offset, page[offset]
+                    
+    def get(self, addr: int, default: int=0) -> int:
+        """Loads a value from memory, as memory cells always exist the default is never used"""
+        
+        return self.load(addr)
+    
+    def __getitem__(self, addr: int) -> int:
+        return self.load(addr)
+    
+    def __setitem__(self, addr: int, val: int) -> None:
+        self.store(addr, val)
+        
+    def __eq__(self, other: object) -> bool:
+        """Memories are equal to memories and dicts holding the same values, missing cells being 0s"""
+        
+        if isinstance(other, PagedMemory):
+            return dict(self.items()) == dict(other.items())
+        elif isinstance(other, dict):
+            return dict(self.items()) == {addr: val for addr, val in other.items() if val != 0}
+        else:
+            return NotImplemented
+        
+    def __repr__(self) -> str:
+        return f"PagedMemory({dict(self.items())})"
+
+    ###########################
+    # ARGUMENT PLAN CONSTANTS #
+    ###########################
+
+class ARG_PLAN(IntEnum):
+    """How a pre-decoded argument is resolved at DECODE stage (argument type and mode, merged)"""
+    IMM_VALUE   = 0 # Argument is the value itself
+    POS_VALUE   = 1 # Value is loaded from argument's address
+    REL_VALUE   = 2 # Value is loaded from argument's address, offset by relative base
+    POS_ADDRESS = 3 # Argument is the destination itself
+    REL_ADDRESS = 4 # Destination is argument offset by relative base
+
+# Plan of each valid argument type and mode pair
+ARG_PLANS: Dict[Tuple[ARG_TYPE, ARG_MODE], ARG_PLAN] = {
+    (ARG_TYPE.VALUE, ARG_MODE.IMM):   ARG_PLAN.IMM_VALUE,
+    (ARG_TYPE.VALUE, ARG_MODE.POS):   ARG_PLAN.POS_VALUE,
+    (ARG_TYPE.VALUE, ARG_MODE.REL):   ARG_PLAN.REL_VALUE,
+    (ARG_TYPE.ADDRESS, ARG_MODE.POS): ARG_PLAN.POS_ADDRESS,
+    (ARG_TYPE.ADDRESS, ARG_MODE.REL): ARG_PLAN.REL_ADDRESS
+}
+
+# Plain int copies, Enum members lookups are way too slow for the DECODE stage
+_POS_VALUE: int = int(ARG_PLAN.POS_VALUE)
+_REL_VALUE: int = int(ARG_PLAN.REL_VALUE)
+_REL_ADDRESS: int = int(ARG_PLAN.REL_ADDRESS)
+
+    #############################
+    # DECODED INSTRUCTION CLASS #
+    #############################
+
+def decode_opcode(rawOpcode: int, addr: int) -> Tuple[OPCODE, Tuple[ARG_PLAN, ...]]:
+    """Decodes a raw opcode into its opcode and the plan of its arguments
+
+    Arguments:
+        rawOpcode {int} -- The raw opcode, argument modes included
+        addr {int} -- Address of the opcode, for error messages
+
+    Returns:
+        Tuple[OPCODE, Tuple[ARG_PLAN, ...]] -- The opcode, and how each of its arguments has to be resolved
+        
+    Raises:
+        ValueError -- Address arguments can't be in immediate mode
+        NotImplementedError -- Opcode or argument mode is not implemented
+    """
+    
+    try:
+        opcode: OPCODE = OPCODE(rawOpcode % 100) # Ones and Tens digits are the actual opcode.
+    except ValueError:
+        raise NotImplementedError(f"OPCODE ERROR : opcode is undefined (opcode : {rawOpcode} / ptr : {addr})")
+    shape: List[ARG_TYPE] = INSTR_ARG_SHAPE[opcode]
+    
+    plan: List[ARG_PLAN] = []
+    rawModes: int = rawOpcode // 100 # All the other digits (even implicit 0s) are argument modes
+    for argType in shape[1:]:
+        mode: int = rawModes % 10
+        rawModes //= 10
+        if argType == ARG_TYPE.VALUE:
+            if mode == ARG_MODE.IMM: # - --> Immediate mode doesn't change the value
+                plan.append(ARG_PLAN.IMM_VALUE)
+            elif mode == ARG_MODE.POS: # --> Positional mode loads given value
+                plan.append(ARG_PLAN.POS_VALUE)
+            elif mode == ARG_MODE.REL: # --> Relative mode loads given value with relative base's offset
+                plan.append(ARG_PLAN.REL_VALUE)
+            else:
+                raise NotImplementedError(f"ARGMODE ERROR : Argument mode {mode} is not implemented (@ {addr})")
+        else:
+            if mode == ARG_MODE.IMM: # - --> Immediate mode raises an error
+                raise ValueError(f"ARGMODE ERROR : Address arguments can't be in immediate mode (@ {addr})")
+            elif mode == ARG_MODE.POS: # --> Positional mode doesn't change anything
+                plan.append(ARG_PLAN.POS_ADDRESS)
+            elif mode == ARG_MODE.REL: # --> Relative mode just adds the offset to the value
+                plan.append(ARG_PLAN.REL_ADDRESS)
+            else:
+                raise NotImplementedError(f"ARGMODE ERROR : Argument mode {mode} is not implemented (@ {addr})")
+    
+    return opcode, tuple(plan)
+
+
+class DecodedInstruction(object):
+    """An instruction as stored in an Intcom's decode cache. Everything in there only depends on
+    the instruction's own cells, so it stays valid until one of these cells is written."""
+
+    __slots__ = ('opcode', 'executor', 'operands', 'plan', 'length', 'kind', 'handler', 'a', 'b', 'c')
+
+    def __init__(self, opcode: OPCODE, executor: Callable[[Intcom], None],
+                 operands: Tuple[int, ...], plan: Tuple[ARG_PLAN, ...],
+                 handler: Callable[..., int]=None) -> None:
+        """Initializes a decoded instruction
+
+        Arguments:
+            opcode {OPCODE} -- The instruction's opcode
+            executor {Callable[[Intcom], None]} -- Intcom's method executing the opcode
+            operands {Tuple[int, ...]} -- Raw arguments, as read in RAM
+            plan {Tuple[ARG_PLAN, ...]} -- How each argument has to be resolved
+            
+        Keyword Arguments:
+            handler {Callable[..., int]} -- Table engine's handler, from DISPATCH (default: {None})
+        """
+
+        self.opcode: OPCODE = opcode
+        self.executor: Callable[[Intcom], None] = executor
+        self.operands: Tuple[int, ...] = operands
+        self.plan: Tuple[ARG_PLAN, ...] = plan
+        self.length: int = len(operands) + 1 # Opcode's cell + arguments' cells
+        
+        self.kind: int = int(OPCODE_KIND[opcode]) if handler is not None else int(OP_KIND.CYCLE)
+        self.handler: Callable[..., int] = handler
+        
+        # Fixed-size operand registers, unused ones stay at 0
+        self.a: int = operands[0] if len(operands) > 0 else 0
+        self.b: int = operands[1] if len(operands) > 1 else 0
+        self.c: int = operands[2] if len(operands) > 2 else 0
+
+
+# Argument mode each plan comes from
+PLAN_MODE: Dict[ARG_PLAN, ARG_MODE] = {
+    ARG_PLAN.IMM_VALUE:   ARG_MODE.IMM,
+    ARG_PLAN.POS_VALUE:   ARG_MODE.POS,
+    ARG_PLAN.REL_VALUE:   ARG_MODE.REL,
+    ARG_PLAN.POS_ADDRESS: ARG_MODE.POS,
+    ARG_PLAN.REL_ADDRESS: ARG_MODE.REL
+}
+
+
+def disassemble_instruction(instr: DecodedInstruction) -> str:
+    """Returns a decoded instruction's assembly : its opcode's name, then its arguments. Immediate
+    values are written as they are, positional cells as ``[addr]`` and relative ones as ``[rb+offset]``."""
+    
+    args: List[str] = []
+    for operand, plan in zip(instr.operands, instr.plan):
+        if plan == ARG_PLAN.IMM_VALUE:
+            args.append(str(operand))
+        elif PLAN_MODE[plan] == ARG_MODE.POS:
+            args.append(f"[{operand}]")
+        else:
+            args.append(f"[rb{operand:+d}]")
+    
+    return f"{instr.opcode.name} {', '.join(args)}".rstrip()
+
+    ##################
+    # DISPATCH TABLE #
+    ##################
+
+class OP_KIND(IntEnum):
+    """What the table engine does with a handler's return value"""
+    WRITE = 0 # Handler writes in RAM and returns the written address
+    JUMP  = 1 # Handler returns the jump's target, or None if the jump is not taken
+    BASE  = 2 # Handler returns the new relative base
+    CYCLE = 3 # No handler (I/O and halt) : instruction goes through a classic CPU cycle
+    FUSED = 4 # Handler runs a fused pseudo-instruction (see optimizer.py) like a compiled block, and returns (ptr, rb, written)
+    
+OPCODE_KIND: Dict[OPCODE, OP_KIND] = {
+    OPCODE.ADD: OP_KIND.WRITE,
+    OPCODE.MUL: OP_KIND.WRITE,
+    OPCODE.IN:  OP_KIND.CYCLE,
+    OPCODE.OUT: OP_KIND.CYCLE,
+    OPCODE.JIT: OP_KIND.JUMP,
+    OPCODE.JIF: OP_KIND.JUMP,
+    OPCODE.LT:  OP_KIND.WRITE,
+    OPCODE.EQ:  OP_KIND.WRITE,
+    OPCODE.URB: OP_KIND.BASE,
+    OPCODE.HLT: OP_KIND.CYCLE
+}
+
+# What each opcode computes, {a} and {b} being replaced by their arguments' resolved expressions.
+# WRITE opcodes store it at {c}, JUMP opcodes jump to {b} if it is true, BASE opcodes make it the new relative base.
+# Jump targets are resolved whether the jump is taken or not, as in a classic cycle, so that bad addresses always raise.
+OPCODE_EXPRESSIONS: Dict[OPCODE, str] = {
+    OPCODE.ADD: "{a} + {b}",
+    OPCODE.MUL: "{a} * {b}",
+    OPCODE.JIT: "{a} != 0",
+    OPCODE.JIF: "{a} == 0",
+    OPCODE.LT:  "1 if {a} < {b} else 0",
+    OPCODE.EQ:  "1 if {a} == {b} else 0",
+    OPCODE.URB: "rb + {a}"
+}
+
+# Table engine's handlers' bodies, by kind
+HANDLER_TEMPLATES: Dict[OP_KIND, str] = {
+    OP_KIND.WRITE: "w = {c}\n{store}\n    return w",
+    OP_KIND.JUMP:  "t = {b}\n    return t if {expr} else None",
+    OP_KIND.BASE:  "return {expr}"
+}
+
+
+def _is_literal(name: str) -> bool:
+    """Tells whether an argument's expression is an int literal"""
+    
+    return name.lstrip('-').isdigit()
+
+
+def arg_source(plan: ARG_PLAN, name: str, temp: str="_r") -> str:
+    """Returns a Python expression resolving an argument following its plan. Expects the memory as
+    ``mem``, its page tables as ``rd`` and ``wr``, and the relative base as ``rb``. Negative addresses
+    fall in negative pages, which raise the error.
+
+    Arguments:
+        plan {ARG_PLAN} -- How the argument has to be resolved
+        name {str} -- Expression of the raw argument, pages and offsets are folded for int literals
+        
+    Keyword Arguments:
+        temp {str} -- Local used to hold relative addresses (default: {"_r"})
+    """
+    
+    if plan == ARG_PLAN.POS_VALUE and _is_literal(name):
+        return f"rd[{int(name) >> PAGE_SHIFT}][{int(name) & PAGE_MASK}]"
+    elif plan == ARG_PLAN.POS_VALUE:
+        return f"rd[{name} >> {PAGE_SHIFT}][{name} & {PAGE_MASK}]"
+    elif plan == ARG_PLAN.REL_VALUE:
+        return f"rd[({temp} := {name} + rb) >> {PAGE_SHIFT}][{temp} & {PAGE_MASK}]"
+    elif plan == ARG_PLAN.REL_ADDRESS:
+        return f"({name} + rb)"
+    else: # Immediate values and positional addresses are used as they are
+        return name
+    
+    
+def store_source(dest: str, value: str, indent: str="    ") -> str:
+    """Returns Python statements storing a value in memory. Same expectations as arg_source's.
+
+    Arguments:
+        dest {str} -- Name or int literal of the address
+        value {str} -- Name of the value
+        
+    Keyword Arguments:
+        indent {str} -- Indentation of the statements (default: {"    "})
+    """
+    
+    if _is_literal(dest):
+        page: str = f"wr[{int(dest) >> PAGE_SHIFT}][{int(dest) & PAGE_MASK}]"
+    else:
+        page = f"wr[{dest} >> {PAGE_SHIFT}][{dest} & {PAGE_MASK}]"
+    
+    return (f"{indent}try:\n"
+            f"{indent}    {page} = {value}\n"
+            f"{indent}except (KeyError, OverflowError): # Unmapped page, overflowing value or negative address\n"
+            f"{indent}    mem.store({dest}, {value})")
+
+
+def opcode_source(opcode: OPCODE, args: Dict[str, str]) -> str:
+    """Returns the Python expression of what an opcode computes
+
+    Arguments:
+        opcode {OPCODE} -- The opcode
+        args {Dict[str, str]} -- Arguments' resolved expressions, by name ("a", "b" and "c")
+    """
+    
+    return OPCODE_EXPRESSIONS[opcode].format(**args)
+
+
+def _build_dispatch_table() -> Dict[int, Callable[..., int]]:
+    """Generates a specialized handler for every valid raw opcode (modes included)"""
+    
+    table: Dict[int, Callable[..., int]] = dict()
+    
+    for opcode in OPCODE_EXPRESSIONS:
+        argTypes: List[ARG_TYPE] = INSTR_ARG_SHAPE[opcode][1:]
+        
+        for modes in product(ARG_MODE, repeat=len(argTypes)):
+            if (ARG_TYPE.ADDRESS, ARG_MODE.IMM) in zip(argTypes, modes): # Address arguments can't be in immediate mode
+                continue
+            
+            rawOpcode: int = opcode + sum(mode * 10**(i+2) for i, mode in enumerate(modes))
+            args: Dict[str, str] = {name: arg_source(ARG_PLANS[argType, mode], name)
+                                    for name, argType, mode in zip("abc", argTypes, modes)}
+            expr: str = opcode_source(opcode, args)
+            body: str = HANDLER_TEMPLATES[OPCODE_KIND[opcode]].format(expr=expr, store=f"    v = {expr}\n" + store_source("w", "v"), **args)
+            namespace: Dict[str, object] = dict()
+            exec(f"def _op_{rawOpcode}(rd, wr, mem, rb, a, b, c):\n    {body}\n", namespace)
+            table[rawOpcode] = namespace[f"_op_{rawOpcode}"]
+        
+    return table
+
+
+# Table engine's handlers, indexed by raw opcode (modes included, without useless mode digits)
+DISPATCH: Dict[int, Callable[..., int]] = _build_dispatch_table()
+
+
+    ##################
+    # BLOCK COMPILER #
+    ##################
+    
+BLOCK_MAX_LENGTH: int = 64 # Maximum number of instructions in a compiled block
+
+class CompiledBlock(object):
+    """A straight-line run of instructions compiled to a single Python function, as stored in an
+    Intcom's block cache. The function takes (readPages, writePages, ram, rb, cachedCells) and returns (ptr, rb, written) :
+    if it writes to a cached cell, it stops right after the write and returns its address as
+    ``written`` (None otherwise). A block without function means its entry instruction has to go
+    through a classic cycle (I/O, halt, volatile cells, errors)."""
+
+    __slots__ = ('entry', 'end', 'function', 'source', 'ends', 'count')
+
+    def __init__(self, entry: int, end: int, source: str=None,
+                 function: Callable[..., Tuple[int, int, int]]=None, ends: Tuple[int, ...]=()) -> None:
+        """Initializes a compiled block, compiling its source
+
+        Arguments:
+            entry {int} -- Address of the block's first instruction
+            end {int} -- Address right after the block's last instruction
+
+        Keyword Arguments:
+            source {str} -- Python source of the block's function, named ``block`` (default: {None})
+            function {Callable} -- Already compiled function, the source is then not compiled (default: {None})
+            ends {Tuple[int, ...]} -- Address right after each of the block's instructions (default: {()})
+        """
+        
+        self.entry: int = entry
+        self.end: int = end
+        self.source: str = source
+        self.function: Callable[..., Tuple[int, int, int]] = function
+        self.ends: Tuple[int, ...] = ends
+        self.count: int = len(ends) # Number of instructions a complete run of the block executes
+        
+        if source is not None and function is None:
+            namespace: Dict[str, object] = dict()
+            exec(compile(source, f"<intcom block @{entry}>", "exec"), namespace)
+            self.function = namespace['block']
+
+
+def block_source(instrs: List[Tuple[int, DecodedInstruction]], name: str="block",
+                 uncheckedCells: Set[int]=frozenset()) -> str:
+    """Generates the Python source of a function running a straight-line run of instructions, every
+    argument being resolved to a constant, a local or a RAM access. Only its last instruction may be
+    a jump. See CompiledBlock for the function's signature.
+
+    Arguments:
+        instrs {List[Tuple[int, DecodedInstruction]]} -- The instructions, with their address
+
+    Keyword Arguments:
+        name {str} -- The generated function's name (default: {"block"})
+        uncheckedCells {Set[int]} -- Cells positional writes don't check against cached cells (default: {frozenset()})
+    """
+    
+    lines: List[str] = [f"def {name}(rd, wr, mem, rb, cells):"]
+    
+    for addr, instr in instrs:
+        nextAddr: int = addr + instr.length
+        args: Dict[str, str] = {argName: arg_source(plan, repr(arg))
+                                for argName, plan, arg in zip("abc", instr.plan, instr.operands)}
+        expr: str = opcode_source(instr.opcode, args)
+        kind: OP_KIND = OPCODE_KIND[instr.opcode]
+        
+        if kind == OP_KIND.WRITE:
+            lines.append(f"    v = {expr}")
+            if instr.plan[2] == ARG_PLAN.POS_ADDRESS:
+                lines.append(store_source(args['c'], "v"))
+                if instr.c not in uncheckedCells:
+                    lines.append(f"    if {instr.c} in cells:")
+                    lines.append(f"        return {nextAddr}, rb, {instr.c}")
+            else:
+                lines.append(f"    w = {args['c']}")
+                lines.append(store_source("w", "v"))
+                lines.append(f"    if w in cells:")
+                lines.append(f"        return {nextAddr}, rb, w")
+        elif kind == OP_KIND.BASE:
+            lines.append(f"    rb = {expr}")
+        elif kind == OP_KIND.JUMP:
+            lines.append(f"    t = {args['b']}") # Resolved even if the jump is not taken, as in a classic cycle
+            lines.append(f"    return (t if {expr} else {nextAddr}), rb, None")
+            return "\n".join(lines) + "\n"
+        else:
+            raise ValueError(f"BLOCK ERROR : {instr.opcode.name} instructions can't be compiled (@ {addr})")
+    
+    lines.append(f"    return {nextAddr}, rb, None")
+    return "\n".join(lines) + "\n"
+
+    ##################
+    # PROFILER CLASS #
+    ##################
+
+class IntcomProfiler(object):
+    """Execution profile of an Intcom, filled while it runs with profiling on (see
+    Intcom.start_profiling) : how many times each instruction ran, by address, and how long the
+    Intcom ran and waited for inputs. Opcode and argument mode counts are derived from it."""
+    
+    def __init__(self) -> None:
+        self.counts: Dict[Tuple[int, DecodedInstruction], int] = dict() # Executions of each decoded instruction, by (address, instruction)
+        self.seconds: float = 0. # Time spent running
+        self.inputSeconds: float = 0. # Part of it spent in input instructions, waiting for a value
+        
+    def instructions(self) -> int:
+        """Returns the number of instructions executed while profiling"""
+        
+        return sum(self.counts.values())
+        
+    def by_address(self) -> Dict[int, int]:
+        """Returns the number of instructions executed at each address"""
+        
+        addresses: Dict[int, int] = dict()
+        for (addr, _), count in self.counts.items():
+            addresses[addr] = addresses.get(addr, 0) + count
+        return addresses
+    
+    def by_opcode(self) -> Dict[OPCODE, int]:
+        """Returns the number of executions of each opcode"""
+        
+        opcodes: Dict[OPCODE, int] = dict()
+        for (_, instr), count in self.counts.items():
+            opcodes[instr.opcode] = opcodes.get(instr.opcode, 0) + count
+        return opcodes
+    
+    def by_mode(self) -> Dict[ARG_MODE, int]:
+        """Returns the number of arguments resolved with each mode"""
+        
+        modes: Dict[ARG_MODE, int] = dict()
+        for (_, instr), count in self.counts.items():
+            for plan in instr.plan:
+                modes[PLAN_MODE[plan]] = modes.get(PLAN_MODE[plan], 0) + count
+        return modes
+    
+    def by_form(self) -> Dict[str, int]:
+        """Returns the number of executions of each opcode and argument modes combination, as
+        ``"ADD POS,IMM,POS"``"""
+        
+        forms: Dict[str, int] = dict()
+        for (_, instr), count in self.counts.items():
+            form: str = f"{instr.opcode.name} {','.join(PLAN_MODE[plan].name for plan in instr.plan)}".rstrip()
+            forms[form] = forms.get(form, 0) + count
+        return forms
+    
+    def report(self) -> Dict[str, object]:
+        """Returns the whole profile, ready to be dumped as JSON"""
+        
+        return {'instructions': self.instructions(),
+                'seconds': self.seconds,
+                'computeSeconds': self.seconds - self.inputSeconds,
+                'inputSeconds': self.inputSeconds,
+                'opcodes': {opcode.name: count for opcode, count in sorted(self.by_opcode().items())},
+                'modes': {mode.name: count for mode, count in sorted(self.by_mode().items())},
+                'forms': dict(sorted(self.by_form().items(), key=lambda form: -form[1])),
+                'addresses': {str(addr): count for addr, count in sorted(self.by_address().items())}}
+    
+    def to_json(self, filePath: str=None) -> str:
+        """Returns the profile's report as JSON, also writing it to a file if given one
+
+        Keyword Arguments:
+            filePath {str} -- Where to write the report (default: {None})
+        """
+        
+        report: str = dumps(self.report(), indent=2)
+        if filePath is not None:
+            with open(filePath, "w") as reportFile:
+                reportFile.write(report)
+        return report
+    
+    def hot_listing(self, limit: int=20) -> str:
+        """Returns a listing of the most executed instructions, hottest first : address, executions,
+        share of every execution, and disassembly
+
+        Keyword Arguments:
+            limit {int} -- Number of instructions listed (default: {20})
+        """
+        
+        total: int = max(1, self.instructions())
+        lines: List[str] = [f"{'ADDR':>8} {'COUNT':>12} {'SHARE':>7}  INSTRUCTION"]
+        for (addr, instr), count in sorted(self.counts.items(), key=lambda item: (-item[1], item[0][0]))[:limit]:
+            lines.append(f"{addr:>8} {count:>12} {100 * count / total:>6.2f}%  {disassemble_instruction(instr)}")
+        return "\n".join(lines)
+        
+    ########################
+    # TRACE RECORDER CLASS #
+    ########################
+
+class TraceRecorder(object):
+    """Execution trace recorded instruction by instruction, while an Intcom replays a traced run (see
+    IntcomTracer.flush). Only what the program alone can't tell is recorded, in preallocated ring
+    buffers of ``capacity`` entries each : control transfers in ``transfers`` (the target of every
+    taken jump, and where a run resumes if the intcom's pointer was moved since the last one), and
+    the address and value written by every instruction that writes (arithmetic, comparisons and
+    inputs) in ``writes``. Values that don't fit in an int64 are recorded as 0. Any other
+    instruction runs right after the previous one, so readers rebuild the addresses of straight-line
+    code instead of recording them.
+    
+    Opcodes and operands are not recorded for every instruction either : every time an instruction
+    gets decoded, its definition (raw opcode and operands, and the position of the first instruction
+    executing it) is recorded instead, so the trace tells which instruction ran at any position even
+    if the program modifies itself. Readers can always rebuild the last ``capacity`` instructions."""
+    
+    def __init__(self, capacity: int=DEFAULT_TRACE_CAPACITY) -> None:
+        """Initializes an empty trace
+
+        Keyword Arguments:
+            capacity {int} -- Number of entries each ring buffer holds (default: {DEFAULT_TRACE_CAPACITY})
+            
+        Raises:
+            ValueError -- Capacity must be positive
+        """
+        
+        if capacity <= 0:
+            raise ValueError(f"TRACE ERROR : Capacity must be positive (capacity:{capacity})")
+        
+        self.capacity: int = capacity
+        self.transfers: array = array('q', bytes(capacity * TRACE_TRANSFER_SIZE * 8))
+        self.writes: array = array('q', bytes(capacity * TRACE_WRITE_SIZE * 8))
+        self.transferCursor: int = 0 # Slot of the next control transfer
+        self.writeCursor: int = 0 # Slot of the next write
+        self.transfersWrapped: bool = False # Whether control transfers went around their ring buffer
+        self.writesWrapped: bool = False # Whether writes went around their ring buffer
+        self.recorded: int = 0 # Position of the next instruction, the ones that can't be rebuilt anymore included
+        self.resumeAddr: int = None # Where the last recorded run stopped, None before the first one
+        self.definitions: array = array('q') # Definitions of the decoded instructions, oldest first (TRACE_DEFINITION_SIZE slots each)
+        
+    def define(self, position: int, addr: int, rawOpcode: int, instr: DecodedInstruction) -> None:
+        """Records an instruction's definition
+
+        Arguments:
+            position {int} -- Position of the first instruction executing it
+            addr {int} -- Address of the instruction
+            rawOpcode {int} -- Its raw opcode
+            instr {DecodedInstruction} -- The instruction, as decoded
+        """
+        
+        operands: Tuple[int, ...] = instr.operands + (0,) * (3 - len(instr.operands))
+        self.definitions.extend((position, addr, rawOpcode) + operands)
+        
+    def transfer(self, position: int, addr: int) -> None:
+        """Records a control transfer. Engines record taken jumps themselves.
+
+        Arguments:
+            position {int} -- Position of the instruction run at the target
+            addr {int} -- The target
+        """
+        
+        self.transfers[self.transferCursor] = position
+        self.transfers[self.transferCursor + 1] = addr
+        self.transferCursor += TRACE_TRANSFER_SIZE
+        if self.transferCursor == len(self.transfers):
+            self.transferCursor = 0
+            self.transfersWrapped = True
+        
+    def flush(self, filePath: str) -> None:
+        """Writes the trace to a file, in a binary format (native byte order) : TRACE_MAGIC, then as
+        int64s the number of instructions recorded, the capacity, the number of control transfers,
+        writes and definitions in the file, then the definitions, the control transfers and the
+        writes, all oldest first. See tracing.py to read it.
+
+        Arguments:
+            filePath {str} -- Where to write the trace
+        """
+        
+        if self.transfersWrapped:
+            transfers: array = self.transfers[self.transferCursor:] + self.transfers[:self.transferCursor]
+        else:
+            transfers = self.transfers[:self.transferCursor]
+        if self.writesWrapped:
+            writes: array = self.writes[self.writeCursor:] + self.writes[:self.writeCursor]
+        else:
+            writes = self.writes[:self.writeCursor]
+            
+        header: array = array('q', (self.recorded, self.capacity, len(transfers) // TRACE_TRANSFER_SIZE,
+                                    len(writes) // TRACE_WRITE_SIZE, len(self.definitions) // TRACE_DEFINITION_SIZE))
+        
+        with open(filePath, "wb") as traceFile:
+            traceFile.write(TRACE_MAGIC)
+            header.tofile(traceFile)
+            self.definitions.tofile(traceFile)
+            transfers.tofile(traceFile)
+            writes.tofile(traceFile)
+        
+    ##########################
+    # TRACE CHECKPOINT CLASS #
+    ##########################
+
+class TraceCheckpoint(object):
+    """State of a traced Intcom at some position of its trace, and the inputs it read from there"""
+    
+    __slots__ = ('position', 'instPtr', 'relBase', 'pages', 'inputs')
+    
+    def __init__(self, position: int, instPtr: int, relBase: int, pages: Dict[int, Union[array, memoryview, OverflowPage]]) -> None:
+        """Initializes a checkpoint, with no input read yet
+
+        Arguments:
+            position {int} -- Position of the next instruction in the trace
+            instPtr {int} -- The intcom's instruction pointer
+            relBase {int} -- Its relative base
+            pages {Dict[int, Union[array, memoryview, OverflowPage]]} -- Its RAM, frozen (see PagedMemory.snapshot)
+        """
+        
+        self.position: int = position
+        self.instPtr: int = instPtr
+        self.relBase: int = relBase
+        self.pages: Dict[int, Union[array, memoryview, OverflowPage]] = pages
+        self.inputs: List[int] = [] # Values read by input instructions since the checkpoint, oldest first
+    
+    ################
+    # TRACER CLASS #
+    ################
+
+class IntcomTracer(object):
+    """Execution trace of an Intcom, kept while it runs with tracing on (see Intcom.start_tracing).
+    Recording every instruction costs at least a quarter of an engine's speed, so traced runs only
+    record what replaying them needs : the intcom's state at checkpoints, taken every ``capacity``
+    instructions and whenever its state was changed between two runs, and every value its input
+    instructions read. Checkpoints freeze the RAM's pages as snapshots do, without copying them.
+    
+    flush() replays the last ``capacity`` instructions, from the last checkpoint before them, with a
+    TraceRecorder recording them instruction by instruction. Only the checkpoints that replay still
+    needs are kept. Host writes to the RAM must go through it (``ram[addr] = value``) to be seen."""
+    
+    def __init__(self, capacity: int=DEFAULT_TRACE_CAPACITY) -> None:
+        """Initializes an empty trace
+
+        Keyword Arguments:
+            capacity {int} -- Number of instructions flushed traces hold, and between two checkpoints (default: {DEFAULT_TRACE_CAPACITY})
+            
+        Raises:
+            ValueError -- Capacity must be positive
+        """
+        
+        if capacity <= 0:
+            raise ValueError(f"TRACE ERROR : Capacity must be positive (capacity:{capacity})")
+        
+        self.capacity: int = capacity
+        self.recorded: int = 0 # Instructions run while tracing, including the ones that can't be replayed anymore
+        self.checkpoints: List[TraceCheckpoint] = [] # Checkpoints replays can start from, oldest first
+        self.inputs: List[int] = None # Inputs read since the last checkpoint, None before the first one
+        self.resumed: Tuple[int, int, int] = None # Pointer, relative base and RAM edits when the last traced run stopped
+        
+    def checkpoint(self, intcom: Intcom) -> None:
+        """Records a checkpoint of an Intcom's current state, dropping the ones replays don't need anymore
+
+        Arguments:
+            intcom {Intcom} -- The traced intcom
+        """
+        
+        checkpoint: TraceCheckpoint = TraceCheckpoint(self.recorded, intcom.instPtr, intcom.relBase, intcom.ram.snapshot())
+        self.checkpoints.append(checkpoint)
+        self.inputs = checkpoint.inputs
+        while len(self.checkpoints) > 1 and self.checkpoints[1].position <= self.recorded - self.capacity:
+            del self.checkpoints[0]
+            
+    def flush(self, filePath: str) -> None:
+        """Replays the last ``capacity`` instructions, and writes their trace to a file (see
+        TraceRecorder.flush). Replays run on plain Intcoms, whatever the intcom's engine : each
+        checkpoint's state is restored, and its inputs fed, in turn.
+
+        Arguments:
+            filePath {str} -- Where to write the trace
+            
+        Raises:
+            ValueError -- The replay must run exactly as many instructions as the traced run
+        """
+        
+        recorder: TraceRecorder = TraceRecorder(self.capacity)
+        if len(self.checkpoints) > 0:
+            recorder.recorded = self.checkpoints[0].position
+        
+        for index, checkpoint in enumerate(self.checkpoints):
+            end: int = self.checkpoints[index + 1].position if index + 1 < len(self.checkpoints) else self.recorded
+            replay: Intcom = Intcom(dict(), "Trace replay", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                    inputSrc=IntcomChannel(reversed(checkpoint.inputs)), outputDest=IntcomChannel())
+            replay.ram.restore(checkpoint.pages)
+            replay.instPtr = checkpoint.instPtr
+            replay.relBase = checkpoint.relBase
+            replay.recorder = recorder
+            replay.run_until(STATUS.HALTED, end - checkpoint.position)
+            if recorder.recorded != end:
+                raise ValueError(f"TRACE ERROR : Replay stopped after {recorder.recorded - checkpoint.position} instructions instead of {end - checkpoint.position} ({replay.status.name})")
+            
+        recorder.flush(filePath)
+        
+    #################
+    # CHANNEL CLASS #
+    #################
+
+class IntcomChannel(deque):
+    """A LIST channel whose both ends are O(1) : lists insert outputs at their start, which copies
+    the whole list, so big output bursts (a screen dump) take quadratic time. Channels keep the
+    order of LIST channels, newest value first : Intcoms pop inputs from their end, and insert
+    outputs at their start. Hosts feed and read them oldest first. Built from values, a channel
+    holds them in the order given, as a list channel would (IntcomChannel(someList) converts one)."""
+    
+    def feed(self, value: int) -> None:
+        """Queues a value after the others"""
+        
+        self.appendleft(value)
+        
+    def feed_many(self, values: Iterable[int]) -> None:
+        """Queues values after the others, oldest first"""
+        
+        self.extendleft(values)
+        
+    def drain(self) -> List[int]:
+        """Empties the channel
+
+        Returns:
+            List[int] -- Its values, oldest first
+        """
+        
+        values: List[int] = list(reversed(self))
+        self.clear()
+        return values
+    
+    def read_records(self, size: int) -> List[Tuple[int, ...]]:
+        """Reads every complete record of a given size, such as the (x, y, tile) triples of the
+        arcade. Values of an incomplete last record are left in the channel.
+
+        Arguments:
+            size {int} -- Number of values of a record
+
+        Returns:
+            List[Tuple[int, ...]] -- The records, oldest first
+        
+        Raises:
+            ValueError -- Records must have at least one value
+        """
+        
+        if size < 1:
+            raise ValueError(f"CHANNEL ERROR : Records must have at least one value, not {size}")
+        pop: Callable[[], int] = self.pop
+        return [tuple(pop() for _ in range(size)) for _ in range(len(self) // size)]
+    
+    #####################
+    # FRAMED PIPE CLASS #
+    #####################
+
+class FramedPipe(object):
+    """A pipe end sending values in frames instead of one by one : sent values are buffered, then
+    sent at once, as an int64 array, when the buffer is full or the sender flushes it. Received
+    frames are unpacked in a local buffer values are read from. Each frame costs a single pickle-free
+    message, where pipes send a pickled message per value.
+    
+    Frames are int64s (native byte order) : a header, the FRAME_FLAG telling what the sender does
+    next (plus FRAME_TEXT if values are sent as comma separated text, as they don't fit in int64s),
+    then the values. Intcoms with FRAMED outputs flush them when they want input (WAITING, see
+    Intcom._answer), halt (CLOSED) or stop running, so hosts get a whole turn in one frame (see
+    recv_turn). Framed intcoms answer before reading their first input frame : hosts get an empty
+    turn first if the intcom outputs nothing before its first input."""
+    
+    def __init__(self, connection: Connection, frameSize: int=DEFAULT_FRAME_SIZE) -> None:
+        """Wraps a pipe end
+
+        Arguments:
+            connection {Connection} -- The pipe end, as given by multiprocessing.Pipe
+
+        Keyword Arguments:
+            frameSize {int} -- Values buffered before sending them without a flush (default: {DEFAULT_FRAME_SIZE})
+            
+        Raises:
+            ValueError -- Frames must hold at least one value
+        """
+        
+        if frameSize < 1:
+            raise ValueError(f"FRAME ERROR : Frames must hold at least one value (frameSize:{frameSize})")
+        self.connection: Connection = connection
+        self.frameSize: int = frameSize
+        self.outBuffer: List[int] = [] # Values not sent yet, oldest first
+        self.inBuffer: deque = deque() # Values received but not read yet, oldest first
+        self.peerFlag: FRAME_FLAG = FRAME_FLAG.MORE # Flag of the last frame received
+        self.framesSent: int = 0
+        self.framesReceived: int = 0
+        
+    def send(self, value: int) -> None:
+        """Buffers a value, sending the buffer if it is full"""
+        
+        self.outBuffer.append(value)
+        if len(self.outBuffer) >= self.frameSize:
+            self.flush()
+            
+    def send_many(self, values: Iterable[int], flag: FRAME_FLAG=FRAME_FLAG.WAITING) -> None:
+        """Sends values, oldest first, in a single frame along with the buffered ones
+
+        Keyword Arguments:
+            flag {FRAME_FLAG} -- What the sender does next (default: {FRAME_FLAG.WAITING})
+        """
+        
+        self.outBuffer.extend(values)
+        self.flush(flag)
+            
+    def flush(self, flag: FRAME_FLAG=FRAME_FLAG.MORE) -> None:
+        """Sends the buffered values in a frame. Frames telling that the sender keeps sending are not
+        sent empty, others always are, so that the receiver knows.
+
+        Keyword Arguments:
+            flag {FRAME_FLAG} -- What the sender does next (default: {FRAME_FLAG.MORE})
+        """
+        
+        if len(self.outBuffer) == 0 and flag == FRAME_FLAG.MORE:
+            return
+        try:
+            frame: bytes = array('q', [flag] + self.outBuffer).tobytes()
+        except OverflowError: # Big ints
+            frame = array('q', [flag | FRAME_TEXT]).tobytes() + ",".join(map(str, self.outBuffer)).encode()
+        self.connection.send_bytes(frame)
+        self.outBuffer.clear()
+        self.framesSent += 1
+        
+    def _receive(self) -> FRAME_FLAG:
+        """Waits for a frame and unpacks its values in the local buffer
+
+        Returns:
+            FRAME_FLAG -- The frame's flag
+
+        Raises:
+            EOFError -- The other end was closed
+        """
+        
+        frame: bytes = self.connection.recv_bytes()
+        header: int = array('q', frame[:8])[0]
+        if header & FRAME_TEXT:
+            if len(frame) > 8:
+                self.inBuffer.extend(int(value) for value in frame[8:].decode().split(","))
+        else:
+            self.inBuffer.extend(array('q', frame[8:]))
+        self.peerFlag = FRAME_FLAG(header & ~FRAME_TEXT)
+        self.framesReceived += 1
+        return self.peerFlag
+        
+    def poll(self, timeout: float=0.0) -> bool:
+        """Tells whether a value can be read, waiting at most timeout seconds for a frame holding one"""
+        
+        while len(self.inBuffer) == 0:
+            if not self.connection.poll(timeout):
+                return False
+            self._receive()
+        return True
+        
+    def recv(self) -> int:
+        """Reads a value, waiting for a frame if none is buffered
+
+        Raises:
+            EOFError -- The other end was closed
+        """
+        
+        while len(self.inBuffer) == 0:
+            self._receive()
+        return self.inBuffer.popleft()
+    
+    def recv_turn(self) -> List[int]:
+        """Reads every value the other end sends until it waits for an answer or stops sending :
+        values of frames already received, then of frames to come until a WAITING or CLOSED one.
+
+        Returns:
+            List[int] -- The values, oldest first
+            
+        Raises:
+            EOFError -- The other end was closed before the turn ended
+        """
+        
+        values: List[int] = list(self.inBuffer)
+        self.inBuffer.clear()
+        while self.peerFlag == FRAME_FLAG.MORE:
+            self._receive()
+            values.extend(self.inBuffer)
+            self.inBuffer.clear()
+        if self.peerFlag == FRAME_FLAG.WAITING: # Next turn
+            self.peerFlag = FRAME_FLAG.MORE
+        return values
+    
+    def closed(self) -> bool:
+        """Tells whether the other end said it stopped sending, and everything it sent was read"""
+        
+        return self.peerFlag == FRAME_FLAG.CLOSED and len(self.inBuffer) == 0
+    
+def _int64_slots(value: int) -> List[int]:
+    """Returns the int64 slots a value takes in shared rings and session files : the value itself
+    if it fits, else RING_BIG_MARK, its signed number of limbs, then its limbs (lowest first)"""
+    
+    if RING_BIG_MARK < value < -RING_BIG_MARK:
+        return [value]
+    limbs: List[int] = []
+    magnitude: int = abs(value)
+    while magnitude > 0:
+        limbs.append(magnitude & ((1 << RING_LIMB_SHIFT) - 1))
+        magnitude >>= RING_LIMB_SHIFT
+    return [RING_BIG_MARK, len(limbs) if value > 0 else -len(limbs)] + limbs
+
+
+def _int_from_slots(slots: array, index: int) -> Tuple[int, int]:
+    """Reads a value written by _int64_slots, returns it along with the index of the slot after it"""
+    
+    value: int = slots[index]
+    if value != RING_BIG_MARK:
+        return value, index + 1
+    count: int = slots[index + 1]
+    value = 0
+    for limb in reversed(slots[index + 2:index + 2 + abs(count)]):
+        value = (value << RING_LIMB_SHIFT) | limb
+    return (-value if count < 0 else value), index + 2 + abs(count)
+
+
+    #####################
+    # SHARED RING CLASS #
+    #####################
+
+class SharedRing(object):
+    """A single-producer single-consumer ring buffer of int64 values, in shared memory : a process
+    writes to it, another one reads from it, without pickling nor pipe syscalls. Neither end locks :
+    the writer publishes values by moving the ring's head once they are written, the reader frees
+    their slots by moving its tail once they are read.
+    
+    An end only makes syscalls when it has to wait (empty or full ring) : it first yields the CPU a
+    few times, as the other end may be about to read or write, then says so in the ring's header,
+    and waits on an event the other end sets (once) when it sees it waiting. Ints that don't fit
+    in an int64 take several slots (RING_BIG_MARK, their number of limbs, then their limbs).
+    
+    Rings are passed to other processes as Process arguments. They have to be closed by the process
+    that created them once both ends are done, so that their shared memory gets freed."""
+    
+    def __init__(self, capacity: int=DEFAULT_RING_CAPACITY) -> None:
+        """Initializes a shared ring
+
+        Keyword Arguments:
+            capacity {int} -- Number of int64 slots of the ring (default: {DEFAULT_RING_CAPACITY})
+            
+        Raises:
+            ValueError -- Rings must have at least one slot
+        """
+        
+        if capacity < 1:
+            raise ValueError(f"RING ERROR : Rings must have at least one slot (capacity:{capacity})")
+        self.capacity: int = capacity
+        self.sharedMemory: SharedMemory = SharedMemory(create=True, size=(RING_HEADER_SIZE + capacity) * 8)
+        self.owner: bool = True # Only the creator of a shared memory frees it
+        self.cells: memoryview = memoryview(self.sharedMemory.buf)[:(RING_HEADER_SIZE + capacity) * 8].cast('q')
+        self.notEmpty: Event = Event() # Set by the writer when the reader waits
+        self.notFull: Event = Event() # Set by the reader when the writer waits
+        
+    def send(self, value: int) -> None:
+        """Writes a value, waiting for room if the ring is full
+
+        Raises:
+            ValueError -- The value is too big for the ring
+        """
+        
+        cells: memoryview = self.cells
+        head: int = cells[RING_HEAD]
+        if RING_BIG_MARK < value < -RING_BIG_MARK:
+            if head - cells[RING_TAIL] >= self.capacity:
+                self._wait_room(1)
+            cells[RING_HEADER_SIZE + head % self.capacity] = value
+            cells[RING_HEAD] = head + 1
+        else:
+            slots: List[int] = _int64_slots(value)
+            if len(slots) > self.capacity:
+                raise ValueError(f"RING ERROR : Value needs {len(slots)} slots, the ring only has {self.capacity}")
+            if head + len(slots) - cells[RING_TAIL] > self.capacity:
+                self._wait_room(len(slots))
+            for i, slot in enumerate(slots):
+                cells[RING_HEADER_SIZE + (head + i) % self.capacity] = slot
+            cells[RING_HEAD] = head + len(slots)
+            
+        if cells[RING_READER_WAITING]: # Woken up once
+            cells[RING_READER_WAITING] = 0
+            self.notEmpty.set()
+            
+    def _wait_room(self, slots: int) -> None:
+        """Waits until the reader freed enough slots"""
+        
+        cells: memoryview = self.cells
+        for _ in range(RING_YIELDS): # Lets the reader run first, it may read soon
+            sched_yield()
+            if cells[RING_HEAD] + slots - cells[RING_TAIL] <= self.capacity:
+                return
+        while cells[RING_HEAD] + slots - cells[RING_TAIL] > self.capacity:
+            cells[RING_WRITER_WAITING] = 1
+            if cells[RING_HEAD] + slots - cells[RING_TAIL] > self.capacity: # The reader may have missed the flag
+                self.notFull.wait(RING_WAIT_SLICE)
+            self.notFull.clear()
+        cells[RING_WRITER_WAITING] = 0
+        
+    def finish(self) -> None:
+        """Tells the reader nothing will be written anymore : reading from the ring once it is empty
+        raises an EOFError"""
+        
+        self.cells[RING_CLOSED] = 1
+        self.notEmpty.set()
+        
+    def poll(self, timeout: float=0.0) -> bool:
+        """Tells whether a value can be read, waiting at most timeout seconds for one (None to wait
+        without limit). Once the writer finished, an empty ring is said to be readable, as reading
+        from it doesn't wait (it fails)."""
+        
+        cells: memoryview = self.cells
+        if cells[RING_HEAD] != cells[RING_TAIL] or cells[RING_CLOSED]:
+            return True
+        elif timeout is not None and timeout <= 0:
+            return False
+        
+        deadline: float = None if timeout is None else perf_counter() + timeout
+        for _ in range(RING_YIELDS): # Lets the writer run first, it may write soon
+            sched_yield()
+            if cells[RING_HEAD] != cells[RING_TAIL] or cells[RING_CLOSED]:
+                return True
+        while cells[RING_HEAD] == cells[RING_TAIL] and not cells[RING_CLOSED]:
+            if deadline is not None and perf_counter() >= deadline:
+                break
+            cells[RING_READER_WAITING] = 1
+            if cells[RING_HEAD] == cells[RING_TAIL]: # The writer may have missed the flag
+                self.notEmpty.wait(RING_WAIT_SLICE if deadline is None else min(RING_WAIT_SLICE, max(0.0, deadline - perf_counter())))
+            self.notEmpty.clear()
+        cells[RING_READER_WAITING] = 0
+        return cells[RING_HEAD] != cells[RING_TAIL] or cells[RING_CLOSED] == 1
+    
+    def recv(self) -> int:
+        """Reads a value, waiting for one if the ring is empty
+
+        Raises:
+            EOFError -- The ring is empty, and the writer finished
+        """
+        
+        cells: memoryview = self.cells
+        tail: int = cells[RING_TAIL]
+        if cells[RING_HEAD] == tail:
+            self.poll(None)
+            if cells[RING_HEAD] == tail:
+                raise EOFError("RING ERROR : The writer finished, and every value was read")
+            
+        value: int = cells[RING_HEADER_SIZE + tail % self.capacity]
+        if value != RING_BIG_MARK:
+            cells[RING_TAIL] = tail + 1
+        else:
+            count: int = cells[RING_HEADER_SIZE + (tail + 1) % self.capacity]
+            value = 0
+            for i in reversed(range(abs(count))):
+                value = (value << RING_LIMB_SHIFT) | cells[RING_HEADER_SIZE + (tail + 2 + i) % self.capacity]
+            if count < 0:
+                value = -value
+            cells[RING_TAIL] = tail + 2 + abs(count)
+            
+        if cells[RING_WRITER_WAITING]: # Woken up once
+            cells[RING_WRITER_WAITING] = 0
+            self.notFull.set()
+        return value
+    
+    def closed(self) -> bool:
+        """Tells whether the writer finished, and every value was read"""
+        
+        return self.cells[RING_CLOSED] == 1 and self.cells[RING_HEAD] == self.cells[RING_TAIL]
+    
+    def close(self) -> None:
+        """Frees the ring's shared memory. Both ends must be done beforehand"""
+        
+        if self.sharedMemory is not None:
+            self.cells.release()
+            self.sharedMemory.close()
+            if self.owner:
+                self.sharedMemory.unlink()
+            self.sharedMemory = None
+            
+    def __del__(self) -> None:
+        """Rings are closed once they are not used anymore"""
+        
+        if getattr(self, 'sharedMemory', None) is not None:
+            self.close()
+            
+    def __enter__(self) -> SharedRing:
+        return self
+    
+    def __exit__(self, *excInfos) -> None:
+        self.close()
+        
+    def __getstate__(self) -> Dict[str, object]:
+        """Rings are pickled by the name of their shared memory"""
+        
+        return {'name': self.sharedMemory.name, 'capacity': self.capacity,
+                'notEmpty': self.notEmpty, 'notFull': self.notFull}
+    
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        self.capacity = state['capacity']
+        self.owner = False
+        self.sharedMemory = SharedMemory(name=state['name'])
+        self.cells = memoryview(self.sharedMemory.buf)[:(RING_HEADER_SIZE + self.capacity) * 8].cast('q')
+        self.notEmpty = state['notEmpty']
+        self.notFull = state['notFull']
+    
+    ####################
+    # IO SESSION CLASS #
+    ####################
+
+class IOSession(object):
+    """Every input and output of an Intcom session, in order, along with the Intcom's state when
+    the session started (see Intcom.start_recording). Replaying a session runs it again without any
+    host, feeding it the recorded inputs, so that runs can be compared on identical instructions.
+    
+    Session files are int64s (native byte order) : SESSION_MAGIC, the instruction pointer, relative
+    base and number of memory cells, the (address, value) of every non-zero cell, then the (IO_EVENT,
+    value) of every event until the end of the file. Events are appended to the file as they occur,
+    so sessions of intcoms that get killed are kept. Ints that don't fit in an int64 take several
+    slots, as in shared rings (RING_BIG_MARK, their number of limbs, then their limbs)."""
+    
+    def __init__(self, memory: Dict[int, int], instPtr: int=0, relBase: int=0,
+                 events: List[Tuple[IO_EVENT, int]]=None, filePath: str=None) -> None:
+        """Initializes a session
+
+        Arguments:
+            memory {Dict[int, int]} -- Memory when the session starts
+
+        Keyword Arguments:
+            instPtr {int} -- Instruction pointer when the session starts (default: {0})
+            relBase {int} -- Relative base when the session starts (default: {0})
+            events {List[Tuple[IO_EVENT, int]]} -- Events that already occured (default: {None})
+            filePath {str} -- File to record the session to, as it goes (default: {None})
+        """
+        
+        self.memory: Dict[int, int] = {addr: val for addr, val in memory.items() if val != 0}
+        self.instPtr: int = instPtr
+        self.relBase: int = relBase
+        self.events: List[Tuple[IO_EVENT, int]] = list(events) if events is not None else []
+        
+        self.file: BinaryIO = None # File events are appended to, None if the session is not being saved
+        if filePath is not None:
+            self.save(filePath)
+            self.file = open(filePath, "ab")
+            
+    def record(self, event: IO_EVENT, value: int) -> None:
+        """Records an event, appending it to the session's file if there is one"""
+        
+        self.events.append((event, value))
+        if self.file is not None:
+            array('q', [event] + _int64_slots(value)).tofile(self.file)
+            self.file.flush()
+            
+    def close(self) -> None:
+        """Stops appending events to the session's file"""
+        
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            
+    def inputs(self) -> List[int]:
+        """Returns every recorded input, oldest first"""
+        
+        return [value for event, value in self.events if event == IO_EVENT.IN]
+    
+    def outputs(self) -> List[int]:
+        """Returns every recorded output, oldest first"""
+        
+        return [value for event, value in self.events if event == IO_EVENT.OUT]
+    
+    def save(self, filePath: str) -> None:
+        """Writes the session to a file"""
+        
+        with open(filePath, "wb") as sessionFile:
+            sessionFile.write(SESSION_MAGIC)
+            array('q', [slot for value in (self.instPtr, self.relBase, len(self.memory))
+                         for slot in _int64_slots(value)]).tofile(sessionFile)
+            array('q', [slot for item in sorted(self.memory.items()) for value in item
+                         for slot in _int64_slots(value)]).tofile(sessionFile)
+            array('q', [slot for event, value in self.events
+                         for slot in [event] + _int64_slots(value)]).tofile(sessionFile)
+    
+    @classmethod
+    def load(cls, filePath: str) -> IOSession:
+        """Reads a session from a file
+
+        Raises:
+            ValueError -- The file is not a session
+        """
+        
+        with open(filePath, "rb") as sessionFile:
+            if sessionFile.read(len(SESSION_MAGIC)) != SESSION_MAGIC:
+                raise ValueError(f"SESSION ERROR : Not a session file ({filePath})")
+            content: array = array('q', sessionFile.read())
+            
+        index: int = 0
+        header: List[int] = []
+        for _ in range(3): # Instruction pointer, relative base, number of cells
+            value, index = _int_from_slots(content, index)
+            header.append(value)
+        instPtr, relBase, cellCount = header
+        
+        memory: Dict[int, int] = {}
+        for _ in range(cellCount):
+            addr, index = _int_from_slots(content, index)
+            memory[addr], index = _int_from_slots(content, index)
+            
+        events: List[Tuple[IO_EVENT, int]] = []
+        while index + 1 < len(content):
+            event: IO_EVENT = IO_EVENT(content[index])
+            value, end = _int_from_slots(content, index + 1)
+            if end > len(content): # Cut while being appended
+                break
+            events.append((event, value))
+            index = end
+        return cls(memory, instPtr, relBase, events)
+    
+    def replay(self, engine: ENGINE=ENGINE.TABLE) -> Intcom:
+        """Runs the session again, in the current process : the intcom starts from the recorded
+        state, and is fed the recorded inputs one at a time, as it asks for them. It runs until it
+        halts, or needs more inputs than recorded.
+
+        Keyword Arguments:
+            engine {ENGINE} -- The intcom's engine (default: {ENGINE.TABLE})
+
+        Returns:
+            Intcom -- The replayed intcom, its outputs in its output channel
+        """
+        
+        ic: Intcom = Intcom(self.memory, "Replayed Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=engine)
+        ic.instPtr = self.instPtr
+        ic.relBase = self.relBase
+        
+        inputs: Iterator[int] = iter(self.inputs())
+        while ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT:
+            nextInput: int = next(inputs, None)
+            if nextInput is None:
+                break
+            ic.inputSrc.feed(nextInput)
+        return ic
+    
+    def matches(self, ic: Intcom) -> bool:
+        """Tells whether a replayed intcom's outputs are byte-identical to the recorded ones"""
+        
+        return (array('q', [slot for value in reversed(ic.outputDest) for slot in _int64_slots(value)]).tobytes()
+                == array('q', [slot for value in self.outputs() for slot in _int64_slots(value)]).tobytes())
+    
+    ##################
+    # SNAPSHOT CLASS #
+    ##################
+
+class IntcomSnapshot(object):
+    """Frozen state of an Intcom, as taken by Intcom.snapshot() : RAM pages (shared copy-on-write),
+    pointers, run state, caches and pending I/O of list channels. Restoring a snapshot never alters
+    it, so it can be restored any number of times, by any Intcom running the same program."""
+    
+    __slots__ = ('pages', 'instPtr', 'relBase', 'halt', 'status', 'instructionCount', 'inputs', 'outputs', 'caches')
+    
+    def __init__(self, ic: Intcom) -> None:
+        """Takes a snapshot of an Intcom, freezing its RAM
 
+        Arguments:
+            ic {Intcom} -- The Intcom, which must not be running
+        """
+        
+        self.pages: Dict[int, Union[array, memoryview, OverflowPage]] = ic.ram.snapshot()
+        self.instPtr: int = ic.instPtr
+        self.relBase: int = ic.relBase
+        self.halt: bool = ic.halt
+        self.status: STATUS = ic.status
+        self.instructionCount: int = ic.instructionCount
+        self.inputs: List[int] = list(ic.inputSrc) if ic.inputMethod == IO_METHOD.LIST else None # None for other channels, which are not copied
+        self.outputs: List[int] = list(ic.outputDest) if ic.outputMethod == IO_METHOD.LIST else None
+        self.caches: Dict[str, object] = {name: copy(getattr(ic, name)) for name in ic._SNAPSHOT_CACHES}
+        
     ################
     # INTCOM CLASS #
     ################
@@ -81,58 +1790,107 @@ class Intcom(object):
         # CONSTRUCTOR #
         ###############
 
-    def __init__(self, prog:Dict[int, int], name: str="Default Intcom", *,
+    def __init__(self, prog:Union[Dict[int, int], ProgramImage], name: str="Default Intcom", *,
                  inputMethod: IO_METHOD=IO_METHOD.TIOW, outputMethod: IO_METHOD=IO_METHOD.TIOW,
-                 inputSrc: Union[TextIOWrapper, Connection, List]=stdin,
-                 outputDest: Union[TextIOWrapper, Connection, List]=stdout) -> None:
+                 inputSrc: Union[TextIOWrapper, Connection, FramedPipe, SharedRing, List]=stdin,
+                 outputDest: Union[TextIOWrapper, Connection, FramedPipe, SharedRing, List]=stdout,
+                 engine: ENGINE=ENGINE.TABLE, maxInstructions: int=None, timeLimit: float=None,
+                 detectLoops: bool=False) -> None:
         """Initializes an Intcom
 
         Arguments:
-            prog {Dict[int, int]} -- The AOC2019Intcode program to run
+            prog {Union[Dict[int, int], ProgramImage]} -- The AOC2019Intcode program to run. Images are shared instead of copied
 
         Keyword Arguments:
             inputMethod {IO_METHOD} -- The Input method. See Intcom's class constants for more infos (default: {IO_METHOD.TIOW})
             outputMethod {IO_METHOD} -- The output method. See Intcom's class constants for more infos (default: {IO_METHOD.TIOW})
             name {str} -- The name of the computer (default: {"Default Intcom"})
-            inputSrc {Union[TextIOWrapper, Connection, List]} -- The input source for the Intcom (default: {sys.stdin})
-            outputDest {Union[TextIOWrapper, Connection, List]} -- The output destination for the Intcom (default: {sys.stdout})
+            inputSrc {Union[TextIOWrapper, Connection, FramedPipe, SharedRing, List]} -- The input source for the Intcom (default: {sys.stdin})
+            outputDest {Union[TextIOWrapper, Connection, FramedPipe, SharedRing, List]} -- The output destination for the Intcom (default: {sys.stdout})
+            engine {ENGINE} -- The execution engine. See Intcom's engine constants for more infos (default: {ENGINE.TABLE})
+            maxInstructions {int} -- Instructions the Intcom executes in its whole life at most, unlimited if None (default: {None})
+            timeLimit {float} -- Seconds a single run lasts at most, waiting for inputs included, unlimited if None (default: {None})
+            detectLoops {bool} -- Whether to stop programs proven to loop forever (default: {False})
+        
+        Raises:
+            ValueError -- Limits must be positive
         """
         
-        self.ram: Dict[int, int] = dict(prog) # Intcom's RAM is initialized with a deepcopy of parameter-given program
+        self.ram: PagedMemory = PagedMemory(prog) # Intcom's RAM is initialized with a copy (or a copy-on-write view) of parameter-given program
         self.name: str = name
         self.inputMethod: IO_METHOD = inputMethod
         self.outputMethod: IO_METHOD = outputMethod
         
         if inputMethod == IO_METHOD.TIOW and not isinstance(inputSrc, type(stdin)) and not isinstance(inputSrc, TextIOWrapper):
             raise TypeError(f"CONSTRUCTION ERROR : Provided input method is 0 (TIOW) but input source type is not an instance of {type(stdin)}.")
-        elif inputMethod == IO_METHOD.LIST and not isinstance(inputSrc, list):
-            raise TypeError(f"CONSTRUCTION ERROR : Provided input method is 1 (LIST) but input source type is not an instance of list.")
+        elif inputMethod == IO_METHOD.LIST and not isinstance(inputSrc, (list, deque)):
+            raise TypeError(f"CONSTRUCTION ERROR : Provided input method is 1 (LIST) but input source type is not an instance of list or IntcomChannel.")
         elif inputMethod == IO_METHOD.PIPE and not isinstance(inputSrc, PipeConnection):
             raise TypeError(f"CONSTRUCTION ERROR : Provided input method is 2 (PIPE) but input source type is not an instance of multiprocessing.Connection.")
-        elif inputMethod != IO_METHOD.TIOW and inputMethod != IO_METHOD.LIST and inputMethod != IO_METHOD.PIPE:
+        elif inputMethod == IO_METHOD.FRAMED and not isinstance(inputSrc, FramedPipe):
+            raise TypeError(f"CONSTRUCTION ERROR : Provided input method is 3 (FRAMED) but input source type is not an instance of FramedPipe.")
+        elif inputMethod == IO_METHOD.RING and not isinstance(inputSrc, SharedRing):
+            raise TypeError(f"CONSTRUCTION ERROR : Provided input method is 4 (RING) but input source type is not an instance of SharedRing.")
+        elif inputMethod not in tuple(IO_METHOD):
             raise NotImplementedError(f"CONSTRUCTION ERROR : Provided input method is invalid : {inputMethod}")
         else:
-            self.inputSrc: {Union[TextIOWrapper, Connection, List]} = inputSrc
+            self.inputSrc: {Union[TextIOWrapper, Connection, FramedPipe, SharedRing, List]} = inputSrc
             
         if outputMethod == IO_METHOD.TIOW and not isinstance(outputDest, type(stdout)) and not isinstance(outputDest, TextIOWrapper):
             raise TypeError(f"CONSTRUCTION ERROR : Provided output method is 0 (TIOW) but output destination type is not an instance of {type(stdout)}.")
-        elif outputMethod == IO_METHOD.LIST and not isinstance(outputDest, list):
-            raise TypeError(f"CONSTRUCTION ERROR : Provided output method is 1 (LIST) but output destination type is not an instance of list.")
+        elif outputMethod == IO_METHOD.LIST and not isinstance(outputDest, (list, deque)):
+            raise TypeError(f"CONSTRUCTION ERROR : Provided output method is 1 (LIST) but output destination type is not an instance of list or IntcomChannel.")
         elif outputMethod == IO_METHOD.PIPE and not isinstance(outputDest, PipeConnection):
             raise TypeError(f"CONSTRUCTION ERROR : Provided output method is 2 (PIPE) but output destination type is not an instance of multiprocessing.Connection.")
-        elif outputMethod != IO_METHOD.TIOW and outputMethod != IO_METHOD.LIST and outputMethod != IO_METHOD.PIPE:
+        elif outputMethod == IO_METHOD.FRAMED and not isinstance(outputDest, FramedPipe):
+            raise TypeError(f"CONSTRUCTION ERROR : Provided output method is 3 (FRAMED) but output destination type is not an instance of FramedPipe.")
+        elif outputMethod == IO_METHOD.RING and not isinstance(outputDest, SharedRing):
+            raise TypeError(f"CONSTRUCTION ERROR : Provided output method is 4 (RING) but output destination type is not an instance of SharedRing.")
+        elif outputMethod not in tuple(IO_METHOD):
             raise NotImplementedError(f"CONSTRUCTION ERROR : Provided output method is invalid : {outputMethod}")
         else:
-            self.outputDest: {Union[TextIOWrapper, Connection, List]} = outputDest
+            self.outputDest: {Union[TextIOWrapper, Connection, FramedPipe, SharedRing, List]} = outputDest
+            
+        if engine not in tuple(ENGINE):
+            raise NotImplementedError(f"CONSTRUCTION ERROR : Provided engine is invalid : {engine}")
+        else:
+            self.engine: ENGINE = engine
+            
+        if maxInstructions is not None and maxInstructions <= 0:
+            raise ValueError(f"CONSTRUCTION ERROR : Provided instructions limit must be positive : {maxInstructions}")
+        elif timeLimit is not None and timeLimit <= 0:
+            raise ValueError(f"CONSTRUCTION ERROR : Provided time limit must be positive : {timeLimit}")
+        self.maxInstructions: int = maxInstructions # Instructions the Intcom executes at most, None if unlimited
+        self.timeLimit: float = timeLimit # Seconds a run lasts at most, None if unlimited
+        self.detectLoops: bool = detectLoops # Whether programs proven to loop forever are stopped, with LOOPING status
             
         self.instPtr: int = 0 # Points to current instruction's Opcode's address
         self.relBase: int = 0 # Points to current "relative arg mode"'s base address
         
         self.args: Dict[int, int] = dict() # Contains current instruction's arguments's values
-        self.argModes: Dict[int, ARG_MODE] = dict() # Contains current instruction's argument's modes
         self.opcode: OPCODE = None # Contains current opcode
+        self.instr: DecodedInstruction = None # Contains current pre-decoded instruction
+        
+        self.decodeCache: Dict[int, DecodedInstruction] = dict() # Pre-decoded instructions, by opcode's address
+        self.blockCache: Dict[int, CompiledBlock] = dict() # Compiled blocks, by entry address
+        self.cachedCells: Dict[int, FrozenSet[int]] = dict() # For each cell, addresses of the cached instructions and blocks covering it (frozen, so snapshots can share them)
+        self.volatileCells: Set[int] = set() # Cells whose writes already invalidated a compiled block
         
         self.halt: bool = True # Tells wether or not the Intcom is currently halted
+        self.status: STATUS = None # Why the Intcom stopped running, None while it runs
+        self.event: STATUS = STATUS.HALTED # Event the Intcom is currently running until
+        self.blocking: bool = True # Whether inputs wait for a value, or stop the Intcom when there is none
+        self.answeredFrames: int = -1 # Input frames received when framed outputs were last flushed for want of input
+        self.instructionCount: int = 0 # Number of instructions executed so far
+        self.profiler: IntcomProfiler = None # Profile being filled, None when profiling is off
+        self.tracer: IntcomTracer = None # Trace being kept, None when tracing is off
+        self.recorder: TraceRecorder = None # Trace recording a replay instruction by instruction (see IntcomTracer.flush), None otherwise
+        self.session: IOSession = None # I/O session being recorded, None when recording is off
+        self.deadline: float = None # When the current run's watchdog stops it (perf_counter), None if it has no time limit
+        self.dirtyCells: Set[int] = set() # Cells written since loop detection started
+        self.stateHash: int = 0 # Hash of the written cells' values
+        self.loopStates: Set[Tuple[int, int, int]] = set() # Hashed states met at backward jumps since the last input
+        self.fullStates: Dict[Tuple[int, int, int], Tuple[Tuple[int, int], ...]] = dict() # Written cells' values of states met twice, by hashed state
 
         ###############
         # CPU METHODS #
@@ -153,14 +1911,12 @@ class Intcom(object):
         
         if addr < 0:
             raise ValueError(f"RAM ACCESS ERROR : Loading a negative address is forbidden (addr:{addr} / ptr:{self.instPtr})")
-        elif addr not in self.ram:
-            self.ram[addr] = 0
-            return 0
         else:
-            return self.ram[addr]
+            return self.ram.load(addr)
         
     def _write(self, addr:int, val:int) -> None:
-        """Writes a given value to a given address in the RAM
+        """Writes a given value to a given address in the RAM. Drops every cached instruction
+        covering this address, so self-modifying programs get re-decoded.
         
         Arguments:
             addr {int} -- The address where to write the value
@@ -173,82 +1929,176 @@ class Intcom(object):
         if addr < 0:
             raise ValueError(f"RAM ACCESS ERROR : Writing to a negative address is forbidden (addr:{addr} / ptr:{self.instPtr})")
         else:
-            self.ram[addr] = val            
+            self.ram.store(addr, val)
+            if addr in self.cachedCells:
+                self._invalidate(addr)
                 
-    def _fetch(self) -> None:
-        """Implementation of a classic CPU's cycle's FETCH stage. Fills Intcom's properties
-        with current instruction's value, and increment instPtr"""
+    def _invalidate(self, addr:int) -> None:
+        """Removes every cached instruction and compiled block covering a given address from the caches
+
+        Arguments:
+            addr {int} -- The address that got written
+        """
+        
+        for owner in self.cachedCells.pop(addr):
+            self._uncache(owner, addr)
+                    
+    def _uncache(self, owner:int, written:int=None) -> None:
+        """Removes the cached instruction and compiled block at a given address from the caches.
+        If they are removed because of a write in a compiled block, the written cell becomes volatile.
+
+        Arguments:
+            owner {int} -- Address of the cached instruction and block
+
+        Keyword Arguments:
+            written {int} -- The written address, already removed from the cached cells (default: {None})
+        """
+        
+        ownedCells: Set[int] = set()
+        
+        instr: DecodedInstruction = self.decodeCache.pop(owner, None)
+        if instr is not None:
+            ownedCells.update(range(owner, owner + instr.length))
+        block: CompiledBlock = self.blockCache.pop(owner, None)
+        if block is not None:
+            ownedCells.update(range(owner, block.end))
+            if written is not None:
+                self.volatileCells.add(written)
+            
+        ownedCells.discard(written)
+        for cell in ownedCells:
+            owners: FrozenSet[int] = self.cachedCells[cell] - {owner}
+            if owners:
+                self.cachedCells[cell] = owners
+            else:
+                del self.cachedCells[cell]
+                    
+    def _cache_cells(self, owner:int, end:int) -> None:
+        """Marks cells as covered by a cached instruction or block
+
+        Arguments:
+            owner {int} -- Address of the cached instruction or block
+            end {int} -- Address right after the last covered cell
+        """
+        
+        for cell in range(owner, end):
+            self.cachedCells[cell] = self.cachedCells.get(cell, frozenset()) | {owner}
+                
+    def _predecode(self, addr:int) -> DecodedInstruction:
+        """Decodes the instruction at a given address once and for all, and stores it in the
+        decode cache. Only what solely depends on the instruction's cells is resolved here.
+        Instructions read from a program image are decoded once for every Intcom sharing it.
+
+        Arguments:
+            addr {int} -- Address of the instruction's opcode
+
+        Returns:
+            DecodedInstruction -- The decoded instruction
+            
+        Raises:
+            ValueError -- Address arguments can't be in immediate mode
+            NotImplementedError -- Opcode or argument mode is not implemented
+        """
         
-        rawOpcode: int = self._load(self.instPtr)
+        image: ProgramImage = self.ram.image
+        if image is not None and addr in image.decodeCache:
+            instr: DecodedInstruction = image.decodeCache[addr]
+            if self.ram.shares(addr, addr + instr.length):
+                self.decodeCache[addr] = instr
+                self._cache_cells(addr, addr + instr.length)
+                return instr
         
-        self.opcode = OPCODE(rawOpcode % 100) # Ones and Tens digits are the actual opcode.
-        # All the other digits (even implicit 0s) are argument modes
+        rawOpcode: int = self._load(addr)
+        opcode, plan = decode_opcode(rawOpcode, addr)
+        shape: List[ARG_TYPE] = INSTR_ARG_SHAPE[opcode]
         
-        self.args = [self._load(self.instPtr+i)
-                     for i in range(1,len(INSTR_ARG_SHAPE[self.opcode]))]
+        operands: Tuple[int, ...] = tuple(self._load(addr+i) for i in range(1, len(shape)))
         
-        self.argModes = []
+        handler: Callable[..., int] = DISPATCH.get(rawOpcode % 10**(len(shape)+1)) # Useless mode digits are dropped
         
-        rawOpcode //= 10
-        for i in range(len(INSTR_ARG_SHAPE[self.opcode])-1):
-            rawOpcode //= 10
-            self.argModes.append(rawOpcode%10)
+        instr = DecodedInstruction(opcode, Intcom._EXECUTORS[opcode], operands, plan, handler)
         
-        self.instPtr += len(INSTR_ARG_SHAPE[self.opcode])
+        if self.ram.shares(addr, addr + instr.length):
+            image.decodeCache[addr] = instr
+        self.decodeCache[addr] = instr
+        self._cache_cells(addr, addr + instr.length)
         
-    def _decode(self) -> None:
-        """Implementation of a classic CPU's cycle's DECODE stage. Resolves arguments values."""
-        
-        for argIndex in range(len(self.args)):
-            if INSTR_ARG_SHAPE[self.opcode][argIndex+1] == ARG_TYPE.VALUE:
-                if self.argModes[argIndex] == ARG_MODE.IMM: # - --> Immediate mode doesn't change the value
-                    self.args[argIndex] = self.args[argIndex]
-                elif self.argModes[argIndex] == ARG_MODE.POS: # --> Positional mode loads given value
-                    self.args[argIndex] = self._load(self.args[argIndex]) 
-                elif self.argModes[argIndex] == ARG_MODE.REL: # --> Relative mode loads given value with relative base's offset
-                    self.args[argIndex] = self._load(self.args[argIndex] + self.relBase)
-                else:
-                    raise NotImplementedError(f"ARGMODE ERROR : Argument mode {self.argModes[argIndex]} is not implemented (@ {self.instPtr})")
-            
-            elif INSTR_ARG_SHAPE[self.opcode][argIndex+1] == ARG_TYPE.ADDRESS:
-                if self.argModes[argIndex] == ARG_MODE.IMM: # - --> Immediate mode raises an error
-                    raise ValueError(f"ARGMODE ERROR : Address arguments can't be in immediate mode (@ {self.instPtr})")
-                elif self.argModes[argIndex] == ARG_MODE.POS: # --> Positional mode doesn't change anything
-                    self.args[argIndex] = self.args[argIndex]
-                elif self.argModes[argIndex] == ARG_MODE.REL: # --> Relative mode just adds the offset to the value
-                    self.args[argIndex] += self.relBase
-                else:
-                    raise NotImplementedError(f"ARGMODE ERROR : Argument mode {self.argModes[argIndex]} is not implemented (@ {self.instPtr})")
+        return instr
+    
+    def _compile_block(self, entry:int) -> CompiledBlock:
+        """Compiles the straight-line run of instructions starting at a given address, and stores it
+        in the block cache. The block ends with the first jump, or right before the first instruction
+        which has to go through a classic cycle (I/O, halt, volatile cells, or anything raising an error).
+        Instructions covering volatile cells are left out so that programs computing their own arguments
+        (a common Intcode pattern) don't get their blocks recompiled every time.
 
-            else:
-                raise NotImplementedError(f"ARGTYPE ERROR : Argument shape for opcode {self.opcode} does not exist.")
+        Arguments:
+            entry {int} -- Address of the block's first instruction
+
+        Returns:
+            CompiledBlock -- The compiled block
+        """
+        
+        instrs: List[Tuple[int, DecodedInstruction]] = []
+        addr: int = entry
+        
+        while len(instrs) < BLOCK_MAX_LENGTH:
+            instr: DecodedInstruction = self.decodeCache.get(addr)
+            if instr is None:
+                try:
+                    instr = self._predecode(addr)
+                except (ValueError, NotImplementedError): # Left to the classic cycle, if it ever runs
+                    break
+                
+            if instr.kind >= OP_KIND.CYCLE or not self.volatileCells.isdisjoint(range(addr, addr + instr.length)):
+                break
+            instrs.append((addr, instr))
+            addr += instr.length
+            if instr.kind == OP_KIND.JUMP:
+                break
+        
+        if len(instrs) > 0:
+            block: CompiledBlock = CompiledBlock(entry, addr, block_source(instrs),
+                                                 ends=tuple(instrAddr + instr.length for instrAddr, instr in instrs))
+        else:
+            block = CompiledBlock(entry, entry + (instr.length if instr is not None else 1))
+        
+        self.blockCache[entry] = block
+        self._cache_cells(entry, block.end)
+        
+        return block
+                
+    def _fetch(self) -> None:
+        """Implementation of a classic CPU's cycle's FETCH stage. Fills Intcom's properties
+        with current instruction, decoding it only if it is not cached yet, and increment instPtr"""
+        
+        instr: DecodedInstruction = self.decodeCache.get(self.instPtr)
+        if instr is None:
+            instr = self._predecode(self.instPtr)
+        
+        self.instr = instr
+        self.opcode = instr.opcode
+        self.instPtr += instr.length
+        
+    def _decode(self) -> None:
+        """Implementation of a classic CPU's cycle's DECODE stage. Resolves arguments values
+        following current instruction's plan."""
+        
+        args: List[int] = list(self.instr.operands) # Immediate values and positional addresses are used as they are
+        for argIndex, plan in enumerate(self.instr.plan):
+            if plan == _POS_VALUE:
+                args[argIndex] = self._load(args[argIndex])
+            elif plan == _REL_VALUE:
+                args[argIndex] = self._load(args[argIndex] + self.relBase)
+            elif plan == _REL_ADDRESS:
+                args[argIndex] += self.relBase
+        self.args = args
     
     def _execute(self) -> None:
         
-        """Implementation of a classic CPU's cycle's DECODE stage. Executes the opcode's associated function"""
-        
-        if self.opcode == OPCODE.ADD:
-            self._add()
-        elif self.opcode == OPCODE.MUL:
-            self._mul()
-        elif self.opcode == OPCODE.IN:
-            self._in()
-        elif self.opcode == OPCODE.OUT:
-            self._out()
-        elif self.opcode == OPCODE.JIT:
-            self._jit()
-        elif self.opcode == OPCODE.JIF:
-            self._jif()
-        elif self.opcode == OPCODE.LT:
-            self._lt()
-        elif self.opcode == OPCODE.EQ:
-            self._eq()
-        elif self.opcode == OPCODE.URB:
-            self._urb()
-        elif self.opcode == OPCODE.HLT:
-            self._hlt()
-        else:
-            raise NotImplementedError(f"OPCODE ERROR : opcode is undefined (opcode : {self.opcode} / ptr : {self.instPtr})")
+        """Implementation of a classic CPU's cycle's EXECUTE stage. Executes the opcode's associated function"""
+        
+        self.instr.executor(self)
 
         ######################
         # EXECUTIONS METHODS #
@@ -264,25 +2114,69 @@ class Intcom(object):
         
         self._write(self.args[2], self.args[0]*self.args[1])
         
+    def _input_available(self) -> bool:
+        """Tells whether an input can be read without waiting. Text inputs always block, they are
+        said to be available."""
+        
+        if self.inputMethod == IO_METHOD.LIST:
+            return len(self.inputSrc) > 0
+        elif self.inputMethod in (IO_METHOD.PIPE, IO_METHOD.FRAMED, IO_METHOD.RING):
+            return self.inputSrc.poll()
+        return True
+        
+    def _answer(self) -> None:
+        """Flushes framed outputs, telling the host the intcom waits for input. With framed inputs,
+        it happens once per input frame : when every value of the last one was read (or before the
+        first one), so that hosts get a single frame, always, in answer to each of theirs."""
+        
+        if self.inputMethod != IO_METHOD.FRAMED:
+            if not self._input_available():
+                self.outputDest.flush(FRAME_FLAG.WAITING)
+        elif len(self.inputSrc.inBuffer) == 0 and self.inputSrc.framesReceived != self.answeredFrames:
+            self.answeredFrames = self.inputSrc.framesReceived
+            self.outputDest.flush(FRAME_FLAG.WAITING)
+        
     def _in(self) -> None:
-        """Executes an input instruction
+        """Executes an input instruction. When not blocking and no input is available (empty list or
+        pipe), the instruction is undone and the Intcom stops with NEEDS_INPUT status. Text inputs
+        always block. Framed outputs are flushed before waiting for an input (see _answer). Pipes and
+        rings are only waited for until the watchdog's deadline : the instruction is undone, and the
+        Intcom stops with TIMED_OUT status.
 
         Raises:
             NotImplementedError: Raises an error if input method is invalid
         """
         
+        if self.outputMethod == IO_METHOD.FRAMED:
+            self._answer()
+        if not self.blocking and not self._input_available():
+            self.instPtr -= self.instr.length
+            self.status = STATUS.NEEDS_INPUT
+            return
+        elif (self.blocking and self.deadline is not None and self.inputMethod in (IO_METHOD.PIPE, IO_METHOD.FRAMED, IO_METHOD.RING)
+              and not self.inputSrc.poll(max(0.0, self.deadline - perf_counter()))):
+            self.instPtr -= self.instr.length
+            self.status = STATUS.TIMED_OUT
+            return
+        
         if self.inputMethod == IO_METHOD.TIOW:
             buffer: str = self.inputSrc.read()
             if buffer[-1:] == '\n':
                 buffer = buffer[:-1]
-            self._write(self.args[0], int(buffer))
+            value: int = int(buffer)
         elif self.inputMethod == IO_METHOD.LIST:
-            self._write(self.args[0], int(self.inputSrc.pop()))
-        elif self.inputMethod == IO_METHOD.PIPE:
-            self._write(self.args[0], int(self.inputSrc.recv()))
+            value = int(self.inputSrc.pop())
+        elif self.inputMethod in (IO_METHOD.PIPE, IO_METHOD.FRAMED, IO_METHOD.RING):
+            value = int(self.inputSrc.recv())
         else:
             raise NotImplementedError(f"VALUE ERROR : input method is invalid : {self.inputMethod}")
         
+        self._write(self.args[0], value)
+        if self.session is not None:
+            self.session.record(IO_EVENT.IN, value)
+        if self.tracer is not None:
+            self.tracer.inputs.append(value)
+        
     def _out(self) -> None:
         """Executes an output instruction
 
@@ -293,11 +2187,16 @@ class Intcom(object):
             self.outputDest.write("Output -> "+str(self.args[0])+"\n")
         elif self.outputMethod == IO_METHOD.LIST:
             self.outputDest.insert(0, self.args[0])
-        elif self.outputMethod == IO_METHOD.PIPE:
+        elif self.outputMethod in (IO_METHOD.PIPE, IO_METHOD.FRAMED, IO_METHOD.RING):
             self.outputDest.send(self.args[0])
         else:
             raise NotImplementedError(f"VALUE ERROR : output method is invalid : {self.outputMethod}")
         
+        if self.session is not None:
+            self.session.record(IO_EVENT.OUT, self.args[0])
+        if self.event == STATUS.HAS_OUTPUT:
+            self.status = STATUS.HAS_OUTPUT
+        
     def _jit(self) -> None:
         """Executes a jump-if-true instruction"""
         
@@ -313,12 +2212,12 @@ class Intcom(object):
     def _lt(self) -> None:
         """Executes a less-than instruction"""
         
-        self._write(self.args[2], self.args[0] < self.args[1])
+        self._write(self.args[2], int(self.args[0] < self.args[1]))
         
     def _eq(self) -> None:
         """Executes an equals instruction"""
         
-        self._write(self.args[2], self.args[0] == self.args[1])
+        self._write(self.args[2], int(self.args[0] == self.args[1]))
         
     def _urb(self) -> None:
         """Executes a update-relative-base instruction"""
@@ -329,16 +2228,666 @@ class Intcom(object):
         """Executes a halt instruction"""
         
         self.halt = True
+        self.status = STATUS.HALTED
+        
+    def _cycle(self) -> None:
+        """Runs a single classic CPU cycle (FETCH->DECODE->EXECUTE)"""
+        
+        self._fetch()
+        self._decode()
+        self._execute()
+        
+    def _run_cycle(self, budget: int) -> None:
+        """Runs the intcom with a classic CPU cycle (FETCH->DECODE->EXECUTE)
+
+        Arguments:
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        remaining: int = budget
+        while remaining != 0:
+            remaining -= 1
+            self._cycle()
+            if self.status is not None:
+                if self.status in UNDONE_STATUSES: # Starving or timed out input was undone
+                    remaining += 1
+                break
+        else:
+            self.status = STATUS.BUDGET_EXHAUSTED
+        
+        self.instructionCount += budget - remaining
+            
+    def _run_table(self, budget: int) -> None:
+        """Runs the intcom with the table-driven engine. Pointers are kept in locals and only
+        written back when an instruction goes through a classic cycle (I/O and halt).
+
+        Arguments:
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        ram: PagedMemory = self.ram
+        readPages: Dict[int, array] = ram.readPages
+        writePages: Dict[int, array] = ram.writePages
+        decodeCache: Dict[int, DecodedInstruction] = self.decodeCache
+        cachedCells: Dict[int, FrozenSet[int]] = self.cachedCells
+        WRITE: int = int(OP_KIND.WRITE)
+        JUMP: int = int(OP_KIND.JUMP)
+        BASE: int = int(OP_KIND.BASE)
+        FUSED: int = int(OP_KIND.FUSED)
+        
+        ptr: int = self.instPtr
+        rb: int = self.relBase
+        remaining: int = budget
+        
+        while remaining != 0:
+            remaining -= 1
+            instr: DecodedInstruction = decodeCache.get(ptr)
+            if instr is None:
+                self.instPtr = ptr
+                instr = self._predecode(ptr)
+            
+            kind: int = instr.kind
+            if kind == WRITE:
+                written: int = instr.handler(readPages, writePages, ram, rb, instr.a, instr.b, instr.c)
+                if written in cachedCells:
+                    self._invalidate(written)
+                ptr += 4
+            elif kind == JUMP:
+                target: int = instr.handler(readPages, writePages, ram, rb, instr.a, instr.b, instr.c)
+                ptr = ptr + 3 if target is None else target
+            elif kind == BASE:
+                rb = instr.handler(readPages, writePages, ram, rb, instr.a, instr.b, instr.c)
+                ptr += 2
+            elif kind == FUSED:
+                ptr, rb, written = instr.handler(readPages, writePages, ram, rb, cachedCells)
+                if written is not None:
+                    self._invalidate(written)
+            else: # I/O and halt go through a classic cycle
+                self.instPtr = ptr
+                self.relBase = rb
+                self._cycle()
+                if self.status is not None:
+                    if self.status in UNDONE_STATUSES: # Starving or timed out input was undone
+                        remaining += 1
+                    break
+                ptr = self.instPtr
+                rb = self.relBase
+        else:
+            self.instPtr = ptr
+            self.relBase = rb
+            self.status = STATUS.BUDGET_EXHAUSTED
+            
+        self.instructionCount += budget - remaining
+        
+    def _run_block(self, budget: int) -> None:
+        """Runs the intcom with the block engine. Compiled blocks are run one after the other, and
+        instructions which can't be compiled go through a classic cycle, as well as the ones of
+        blocks that don't fit in what is left of the budget.
+
+        Arguments:
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        ram: PagedMemory = self.ram
+        readPages: Dict[int, array] = ram.readPages
+        writePages: Dict[int, array] = ram.writePages
+        blockCache: Dict[int, CompiledBlock] = self.blockCache
+        cachedCells: Dict[int, FrozenSet[int]] = self.cachedCells
+        
+        ptr: int = self.instPtr
+        rb: int = self.relBase
+        remaining: int = budget
+        
+        while remaining != 0:
+            block: CompiledBlock = blockCache.get(ptr)
+            if block is None:
+                block = self._compile_block(ptr)
+            
+            function = block.function
+            if function is not None and block.count <= remaining:
+                ptr, rb, written = function(readPages, writePages, ram, rb, cachedCells)
+                if written is None:
+                    remaining -= block.count
+                else: # Block stopped right after the write
+                    remaining -= block.ends.index(ptr) + 1
+                    self._invalidate(written)
+            else: # I/O, halt, volatile cells and errors go through a classic cycle
+                remaining -= 1
+                self.instPtr = ptr
+                self.relBase = rb
+                self._cycle()
+                if self.status is not None:
+                    if self.status in UNDONE_STATUSES: # Starving or timed out input was undone
+                        remaining += 1
+                    break
+                ptr = self.instPtr
+                rb = self.relBase
+        else:
+            self.instPtr = ptr
+            self.relBase = rb
+            self.status = STATUS.BUDGET_EXHAUSTED
+            
+        self.instructionCount += budget - remaining
+        
+    def _run_profiled(self, budget: int) -> None:
+        """Runs the intcom with a classic CPU cycle, counting every instruction it executes and timing
+        its inputs in its profiler. Engines are only replaced by it while profiling, so they stay
+        uninstrumented.
+
+        Arguments:
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        profiler: IntcomProfiler = self.profiler
+        counts: Dict[Tuple[int, DecodedInstruction], int] = profiler.counts
+        decodeCache: Dict[int, DecodedInstruction] = self.decodeCache
+        
+        begin: float = perf_counter()
+        remaining: int = budget
+        while remaining != 0:
+            remaining -= 1
+            ptr: int = self.instPtr
+            instr: DecodedInstruction = decodeCache.get(ptr)
+            if instr is None:
+                instr = self._predecode(ptr)
+            
+            if instr.opcode == OPCODE.IN:
+                inputBegin: float = perf_counter()
+                self._cycle()
+                profiler.inputSeconds += perf_counter() - inputBegin
+            else:
+                self._cycle()
+                
+            if self.status in UNDONE_STATUSES: # Starving or timed out input was undone
+                remaining += 1
+                break
+            key: Tuple[int, DecodedInstruction] = (ptr, instr)
+            counts[key] = counts.get(key, 0) + 1
+            if self.status is not None:
+                break
+        else:
+            self.status = STATUS.BUDGET_EXHAUSTED
+            
+        profiler.seconds += perf_counter() - begin
+        self.instructionCount += budget - remaining
         
-    def run(self) -> None:
-        """Runs the intcom with a classic CPU cycle (FETCH->DECODE->EXECUTE)"""
+    def _run_recorded(self, budget: int) -> None:
+        """Runs the intcom with the table-driven engine, recording its control transfers and writes
+        in its recorder. Straight-line code only pays for its writes. Only replays of traced runs
+        are recorded (see IntcomTracer.flush), traced runs themselves stay uninstrumented.
+
+        Arguments:
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        recorder: TraceRecorder = self.recorder
+        if self.instPtr != recorder.resumeAddr: # Replay starts, or the pointer was moved to a checkpoint's
+            recorder.transfer(recorder.recorded, self.instPtr)
+        
+        transfers: array = recorder.transfers
+        writes: array = recorder.writes
+        transfersSize: int = len(transfers)
+        writesSize: int = len(writes)
+        transferCursor: int = recorder.transferCursor
+        writeCursor: int = recorder.writeCursor
+        
+        ram: PagedMemory = self.ram
+        readPages: Dict[int, array] = ram.readPages
+        writePages: Dict[int, array] = ram.writePages
+        decodeCache: Dict[int, DecodedInstruction] = self.decodeCache
+        cachedCells: Dict[int, FrozenSet[int]] = self.cachedCells
+        WRITE: int = int(OP_KIND.WRITE)
+        JUMP: int = int(OP_KIND.JUMP)
+        BASE: int = int(OP_KIND.BASE)
+        
+        ptr: int = self.instPtr
+        rb: int = self.relBase
+        remaining: int = budget
+        end: int = recorder.recorded + budget # Position of the next instruction is end - remaining
+        
+        while remaining != 0:
+            remaining -= 1
+            instr: DecodedInstruction = decodeCache.get(ptr)
+            if instr is None:
+                self.instPtr = ptr
+                instr = self._predecode(ptr)
+                recorder.define(end - remaining - 1, ptr, ram.load(ptr), instr)
+            
+            kind: int = instr.kind
+            if kind == WRITE:
+                written: int = instr.handler(readPages, writePages, ram, rb, instr.a, instr.b, instr.c)
+                writes[writeCursor] = written
+                try:
+                    writes[writeCursor + 1] = readPages[written >> PAGE_SHIFT][written & PAGE_MASK]
+                except OverflowError:
+                    writes[writeCursor + 1] = 0
+                writeCursor += 2
+                if writeCursor == writesSize:
+                    writeCursor = 0
+                    recorder.writesWrapped = True
+                if written in cachedCells:
+                    self._invalidate(written)
+                ptr += 4
+            elif kind == JUMP:
+                target: int = instr.handler(readPages, writePages, ram, rb, instr.a, instr.b, instr.c)
+                if target is None:
+                    ptr += 3
+                else:
+                    ptr = target
+                    transfers[transferCursor] = end - remaining
+                    transfers[transferCursor + 1] = target
+                    transferCursor += 2
+                    if transferCursor == transfersSize:
+                        transferCursor = 0
+                        recorder.transfersWrapped = True
+            elif kind == BASE:
+                rb = instr.handler(readPages, writePages, ram, rb, instr.a, instr.b, instr.c)
+                ptr += 2
+            else: # I/O and halt go through a classic cycle
+                self.instPtr = ptr
+                self.relBase = rb
+                self._cycle()
+                if self.status in UNDONE_STATUSES: # Starving or timed out input was undone, and is not recorded
+                    remaining += 1
+                    break
+                
+                if instr.opcode == OPCODE.IN:
+                    writes[writeCursor] = self.args[0]
+                    try:
+                        writes[writeCursor + 1] = ram.load(self.args[0])
+                    except OverflowError:
+                        writes[writeCursor + 1] = 0
+                    writeCursor += 2
+                    if writeCursor == writesSize:
+                        writeCursor = 0
+                        recorder.writesWrapped = True
+                ptr = self.instPtr
+                rb = self.relBase
+                if self.status is not None:
+                    break
+        else:
+            self.instPtr = ptr
+            self.relBase = rb
+            self.status = STATUS.BUDGET_EXHAUSTED
+        
+        recorder.transferCursor = transferCursor
+        recorder.writeCursor = writeCursor
+        recorder.recorded += budget - remaining
+        recorder.resumeAddr = self.instPtr
+        self.instructionCount += budget - remaining
+        
+    def _run_traced(self, runner: Callable[[int], None], budget: int) -> None:
+        """Runs the intcom with a runner, in chunks ending at its tracer's checkpoints. The intcom
+        is checkpointed first if its pointers or RAM were changed since the last traced run.
+
+        Arguments:
+            runner {Callable[[int], None]} -- The runner the intcom would run with, were it not traced
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        tracer: IntcomTracer = self.tracer
+        if tracer.resumed != (self.instPtr, self.relBase, self.ram.edits): # Tracing starts, or the host changed the state
+            tracer.checkpoint(self)
+        
+        remaining: int = budget
+        while True:
+            if tracer.recorded - tracer.checkpoints[-1].position >= tracer.capacity:
+                tracer.checkpoint(self)
+            chunk: int = min(remaining, tracer.checkpoints[-1].position + tracer.capacity - tracer.recorded)
+            executed: int = self.instructionCount
+            runner(chunk)
+            tracer.recorded += self.instructionCount - executed
+            remaining -= chunk
+            if self.status != STATUS.BUDGET_EXHAUSTED or remaining == 0:
+                break
+        tracer.resumed = (self.instPtr, self.relBase, self.ram.edits)
+        
+    def _run_watched(self, budget: int) -> None:
+        """Runs the intcom with a classic CPU cycle, looking for infinite loops. Every cell written is
+        tracked, and a hash of the intcom's state (instruction pointer, relative base and tracked
+        cells' values, hashed incrementally as they are written) is remembered at every backward
+        jump. Cells never written are as they were when detection started, so meeting a state again
+        means the program loops forever, unless it read an input in between (states are forgotten at
+        every input). Hashes only point at candidates : the state is then recorded in full, and the
+        intcom stops with LOOPING status when it meets it again, which proves the loop. Engines are
+        only replaced by it while detecting loops.
+
+        Arguments:
+            budget {int} -- Maximum number of instructions to execute
+        """
+        
+        dirtyCells: Set[int] = self.dirtyCells
+        loopStates: Set[Tuple[int, int, int]] = self.loopStates
+        fullStates: Dict[Tuple[int, int, int], Tuple[Tuple[int, int], ...]] = self.fullStates
+        decodeCache: Dict[int, DecodedInstruction] = self.decodeCache
+        load: Callable[[int], int] = self.ram.load
+        FUSED: int = int(OP_KIND.FUSED)
+        
+        remaining: int = budget
+        while remaining != 0:
+            remaining -= 1
+            ptr: int = self.instPtr
+            instr: DecodedInstruction = decodeCache.get(ptr)
+            if instr is None or instr.kind == FUSED: # Fused instructions hide their writes : they get decoded again, as plain ones
+                if instr is not None:
+                    self._uncache(ptr)
+                instr = self._predecode(ptr)
+            
+            opcode: OPCODE = instr.opcode
+            dest: int = None
+            if opcode in (OPCODE.ADD, OPCODE.MUL, OPCODE.LT, OPCODE.EQ, OPCODE.IN): # Destination is the last argument
+                dest = instr.operands[-1] + (self.relBase if instr.plan[-1] == ARG_PLAN.REL_ADDRESS else 0)
+                old: int = load(dest) if dest >= 0 else 0 # Negative destinations fail in the cycle
+            self._cycle()
+            if self.status in UNDONE_STATUSES: # Starving or timed out input was undone
+                remaining += 1
+                break
+            
+            if dest is not None:
+                if dest in dirtyCells:
+                    self.stateHash ^= hash((dest, old))
+                else:
+                    dirtyCells.add(dest)
+                self.stateHash ^= hash((dest, load(dest)))
+                if opcode == OPCODE.IN: # Next inputs may differ, states can't be compared across inputs
+                    loopStates.clear()
+                    fullStates.clear()
+            elif opcode in (OPCODE.JIT, OPCODE.JIF) and self.instPtr <= ptr: # Backward jump
+                state: Tuple[int, int, int] = (self.instPtr, self.relBase, self.stateHash)
+                if state in loopStates:
+                    cells: Tuple[Tuple[int, int], ...] = tuple(sorted((cell, load(cell)) for cell in dirtyCells))
+                    if fullStates.get(state) == cells:
+                        self.status = STATUS.LOOPING
+                        break
+                    fullStates[state] = cells
+                else:
+                    if len(loopStates) >= LOOP_HISTORY:
+                        loopStates.clear()
+                        fullStates.clear()
+                    loopStates.add(state)
+            
+            if self.status is not None:
+                break
+        else:
+            self.status = STATUS.BUDGET_EXHAUSTED
+        
+        self.instructionCount += budget - remaining
+        
+    def _forget_states(self) -> None:
+        """Restarts loop detection from the intcom's current state"""
+        
+        self.dirtyCells = set()
+        self.stateHash = 0
+        self.loopStates = set()
+        self.fullStates = dict()
+        
+    def start_tracing(self, capacity: int=DEFAULT_TRACE_CAPACITY) -> IntcomTracer:
+        """Turns tracing on : until it is turned off, the intcom runs with its engine as usual, its
+        tracer checkpointing it and keeping its inputs so that its last instructions can be replayed
+        and recorded (see IntcomTracer). Forks don't trace.
+
+        Keyword Arguments:
+            capacity {int} -- Number of instructions the tracer's traces hold, if it has to be created (default: {DEFAULT_TRACE_CAPACITY})
+
+        Returns:
+            IntcomTracer -- The tracer, which keeps what it was already filled with
+        """
+        
+        if self.tracer is None:
+            self.tracer = IntcomTracer(capacity)
+        return self.tracer
+    
+    def stop_tracing(self) -> IntcomTracer:
+        """Turns tracing off. The tracer can still be flushed.
+
+        Returns:
+            IntcomTracer -- The tracer, None if tracing was not on
+        """
+        
+        tracer: IntcomTracer = self.tracer
+        self.tracer = None
+        return tracer
+        
+    def start_recording(self, filePath: str=None) -> IOSession:
+        """Turns I/O recording on : until it is turned off, every value the intcom reads or writes
+        is recorded in its session, which starts from the intcom's current state. Forks don't record.
+
+        Keyword Arguments:
+            filePath {str} -- File to record the session to, as it goes (default: {None})
+
+        Returns:
+            IOSession -- The session
+        """
+        
+        self.session = IOSession(dict(self.ram.items()), self.instPtr, self.relBase, filePath=filePath)
+        return self.session
+    
+    def stop_recording(self) -> IOSession:
+        """Turns I/O recording off, closing the session's file
+
+        Returns:
+            IOSession -- The recorded session, None if recording was not on
+        """
+        
+        session: IOSession = self.session
+        self.session = None
+        if session is not None:
+            session.close()
+        return session
+        
+    def start_profiling(self) -> IntcomProfiler:
+        """Turns profiling on : until it is turned off, the intcom runs with an instrumented classic
+        cycle whatever its engine, filling its profiler. Forks don't profile.
+
+        Returns:
+            IntcomProfiler -- The profiler, which keeps what it was already filled with
+        """
+        
+        if self.profiler is None:
+            self.profiler = IntcomProfiler()
+        return self.profiler
+    
+    def stop_profiling(self) -> IntcomProfiler:
+        """Turns profiling off, the intcom runs with its engine again
+
+        Returns:
+            IntcomProfiler -- The filled profiler, None if profiling was not on
+        """
+        
+        profiler: IntcomProfiler = self.profiler
+        self.profiler = None
+        return profiler
+    
+    def memory_usage(self) -> Dict[str, int]:
+        """Returns the intcom's RAM usage report. See PagedMemory.usage for more infos"""
+        
+        return self.ram.usage()
+        
+    def _run(self, event: STATUS, budget: int, blocking: bool) -> STATUS:
+        """Runs the intcom with its engine, until the program halts, an event occurs, the budget
+        is exhausted or one of the intcom's limits stops it. With a time limit, engines run chunks
+        of WATCHDOG_CHUNK instructions, the watchdog checking the clock between them.
+
+        Arguments:
+            event {STATUS} -- Event to stop at (only outputs actually need to be watched)
+            budget {int} -- Maximum number of instructions to execute
+            blocking {bool} -- Whether inputs wait for a value, or stop the Intcom when there is none
+
+        Returns:
+            STATUS -- Why the intcom stopped
+        """
         
         self.halt = False # Down the halt flag to show the program starts running
+        self.event = event
+        self.blocking = blocking
+        
+        if self.recorder is not None:
+            runner: Callable[[int], None] = self._run_recorded
+        elif self.profiler is not None:
+            runner = self._run_profiled
+        elif self.detectLoops:
+            runner = self._run_watched
+        elif self.engine == ENGINE.CYCLE:
+            runner = self._run_cycle
+        elif self.engine == ENGINE.TABLE:
+            runner = self._run_table
+        else:
+            runner = self._run_block
+        if runner != self._run_watched: # Writes are not tracked, states seen so far can't be compared anymore
+            self._forget_states()
+        if self.tracer is not None: # Only checkpoints and inputs are recorded, the runner stays as it is
+            runner = partial(self._run_traced, runner)
+        
+        self.deadline = None if self.timeLimit is None else perf_counter() + self.timeLimit
+        while True:
+            chunk: int = min(budget, BUDGET_CHUNK if self.deadline is None else WATCHDOG_CHUNK)
+            if self.maxInstructions is not None:
+                chunk = min(chunk, self.maxInstructions - self.instructionCount)
+            self.status = None
+            if chunk > 0 or budget == 0:
+                runner(chunk)
+                budget -= chunk
+            
+            if self.status in (STATUS.BUDGET_EXHAUSTED, None):
+                if self.maxInstructions is not None and self.instructionCount >= self.maxInstructions:
+                    self.status = STATUS.LIMIT_REACHED
+                elif self.deadline is not None and perf_counter() >= self.deadline:
+                    self.status = STATUS.TIMED_OUT
+            if self.status != STATUS.BUDGET_EXHAUSTED or budget == 0:
+                self.deadline = None
+                if self.outputMethod == IO_METHOD.FRAMED: # Hosts get outputs as soon as the intcom stops
+                    self.outputDest.flush(FRAME_FLAG.CLOSED if self.status == STATUS.HALTED else FRAME_FLAG.MORE)
+                elif self.outputMethod == IO_METHOD.RING and self.status == STATUS.HALTED: # Readers don't wait for more
+                    self.outputDest.finish()
+                return self.status
+        
+    def run(self) -> STATUS:
+        """Runs the intcom with its engine, until its program halts. Inputs wait for a value.
+
+        Returns:
+            STATUS -- HALTED, unless one of the intcom's limits stopped it : LIMIT_REACHED, TIMED_OUT or LOOPING
+        """
+        
+        return self._run(STATUS.HALTED, maxsize, True)
+        
+    def run_until(self, event: STATUS=STATUS.HALTED, budget: int=None) -> STATUS:
+        """Runs the intcom without ever waiting for an input, until a given event occurs. It also
+        stops when its program halts, when it needs an input none is available for (the input
+        instruction runs again next time), and when it exhausted its budget. Its state is kept
+        intact, so it can be run again from where it stopped.
+
+        Keyword Arguments:
+            event {STATUS} -- Event to stop at : NEEDS_INPUT, HAS_OUTPUT or HALTED (default: {STATUS.HALTED})
+            budget {int} -- Maximum number of instructions to execute, unlimited if None (default: {None})
+
+        Returns:
+            STATUS -- Why the intcom stopped
+            
+        Raises:
+            ValueError -- Budgets can't be negative
+        """
+        
+        if budget is not None and budget < 0:
+            raise ValueError(f"RUN ERROR : Budget can't be negative (budget:{budget})")
+        elif self.status == STATUS.HALTED:
+            return STATUS.HALTED
+        
+        return self._run(event, maxsize if budget is None else budget, False)
+    
+    def step(self, n: int=1) -> STATUS:
+        """Executes n instructions, without ever waiting for an input. Stops earlier if the program
+        halts or needs an input none is available for.
+
+        Keyword Arguments:
+            n {int} -- Number of instructions to execute (default: {1})
+
+        Returns:
+            STATUS -- Why the intcom stopped, BUDGET_EXHAUSTED if all n instructions were executed
+        """
+        
+        return self.run_until(STATUS.HALTED, n)
+    
+        ####################
+        # SNAPSHOT METHODS #
+        ####################
+        
+    def snapshot(self) -> IntcomSnapshot:
+        """Takes a snapshot of the intcom's state, to restore it later or fork it. No RAM page is
+        copied : pages are frozen and shared, the intcom copying them on its next write to them.
+        List channels' pending values are copied, other channels are kept as they are.
+
+        Returns:
+            IntcomSnapshot -- The snapshot
+        """
+        
+        return IntcomSnapshot(self)
+    
+    def restore(self, snapshot: IntcomSnapshot) -> None:
+        """Brings the intcom back to a snapshot's state. The snapshot is left untouched.
+
+        Arguments:
+            snapshot {IntcomSnapshot} -- A snapshot of an intcom running the same program
+        """
         
-        while not self.halt:
-            self._fetch()
-            self._decode()
-            self._execute()
+        self.ram.restore(snapshot.pages)
+        self.instPtr = snapshot.instPtr
+        self.relBase = snapshot.relBase
+        self.halt = snapshot.halt
+        self.status = snapshot.status
+        self.instructionCount = snapshot.instructionCount
+        if snapshot.inputs is not None: # Channels are refilled in place, as their owner may hold them
+            self.inputSrc.clear()
+            self.inputSrc.extend(snapshot.inputs)
+        if snapshot.outputs is not None:
+            self.outputDest.clear()
+            self.outputDest.extend(snapshot.outputs)
+        for name, cache in snapshot.caches.items():
+            setattr(self, name, copy(cache))
+        self._forget_states()
+            
+    def fork(self, name: str=None) -> Intcom:
+        """Clones the intcom, sharing its RAM copy-on-write : both only copy the pages they write to.
+        The clone gets its own copy of list channels, other channels are shared.
+
+        Keyword Arguments:
+            name {str} -- The clone's name, the intcom's one if None (default: {None})
+
+        Returns:
+            Intcom -- The clone, ready to run from where the intcom stopped
+        """
+        
+        snapshot: IntcomSnapshot = self.snapshot()
+        
+        clone: Intcom = copy(self)
+        clone.ram = PagedMemory(self.ram.image)
+        clone.session = None
+        clone.tracer = None # Its runs would interleave into the intcom's trace
+        clone.profiler = None # Its counts would add up in the intcom's profile
+        if self.inputMethod == IO_METHOD.LIST: # Of the same type as the intcom's
+            clone.inputSrc = type(self.inputSrc)()
+        if self.outputMethod == IO_METHOD.LIST:
+            clone.outputDest = type(self.outputDest)()
+        clone.restore(snapshot)
+        if name is not None:
+            clone.name = name
+        return clone
+            
+    # Caches saved by snapshots, shallow copies of them must be independent from the originals
+    _SNAPSHOT_CACHES: Tuple[str, ...] = ('decodeCache', 'blockCache', 'cachedCells', 'volatileCells')
+            
+    # Executor of each opcode, as stored in decoded instructions
+    _EXECUTORS: Dict[OPCODE, Callable[[Intcom], None]] = {
+        OPCODE.ADD: _add,
+        OPCODE.MUL: _mul,
+        OPCODE.IN:  _in,
+        OPCODE.OUT: _out,
+        OPCODE.JIT: _jit,
+        OPCODE.JIF: _jif,
+        OPCODE.LT:  _lt,
+        OPCODE.EQ:  _eq,
+        OPCODE.URB: _urb,
+        OPCODE.HLT: _hlt
+    }
             
     # FUNCTIONS
 
@@ -349,16 +2898,56 @@ def list_to_dict(l: List[int]) -> Dict[int, int]:
     return {i: l[i] for i in range(len(l))}
 
 
-def _run_piped_intcom(intcode: Dict[int, int], inPipe: PipeConnection, outPipe: PipeConnection) -> None:
-    """Runs a computer specifically created"""
+def _run_piped_intcom(intcode: Dict[int, int], inPipe: PipeConnection, outPipe: PipeConnection, recordPath: str=None,
+                      framed: bool=False, maxInstructions: int=None, timeLimit: float=None) -> None:
+    """Runs a computer specifically created. If one of its limits stops it, its output pipe is
+    closed, so that readers stop waiting for it."""
+
+    method: IO_METHOD = IO_METHOD.FRAMED if framed else IO_METHOD.PIPE
+    ic: Intcom = Intcom(intcode, "Piped Intcom",
+                        inputMethod=method, outputMethod=method,
+                        inputSrc=FramedPipe(inPipe) if framed else inPipe,
+                        outputDest=FramedPipe(outPipe) if framed else outPipe,
+                        maxInstructions=maxInstructions, timeLimit=timeLimit)
+    if recordPath is not None:
+        ic.start_recording(recordPath)
+    if ic.run() != STATUS.HALTED:
+        if framed:
+            ic.outputDest.flush(FRAME_FLAG.CLOSED)
+        outPipe.close()
+    ic.stop_recording()
+
+
+def piped_intcom_as_a_process(intcode: Dict[int, int], inPipe: PipeConnection, outPipe: PipeConnection, recordPath: str=None,
+                              framed: bool=False, maxInstructions: int=None, timeLimit: float=None) -> Process:
+    """Returns a process ready to run specified intcode, I/O made by passed pipes. Its I/O session
+    gets recorded to recordPath if given one (see IOSession). If framed, the intcom wraps its pipes
+    in FramedPipes : the other ends must be wrapped too. The process ends once the intcom executed
+    maxInstructions, or ran for timeLimit seconds, if given."""
+
+    return Process(target=_run_piped_intcom, args=(intcode, inPipe, outPipe, recordPath, framed, maxInstructions, timeLimit))
+
+
+def _run_ring_intcom(intcode: Dict[int, int], inRing: SharedRing, outRing: SharedRing, recordPath: str=None,
+                     maxInstructions: int=None, timeLimit: float=None) -> None:
+    """Runs a computer reading from and writing to shared rings. Its output ring is finished
+    whether it halts or one of its limits stops it."""
 
-    ic: Intcomputer = Intcom(intcode, "Piped Intcom",
-                             inputMethod=IO_METHOD.PIPE, outputMethod=IO_METHOD.PIPE,
-                             inputSrc=inPipe, outputDest=outPipe)
-    ic.run()
+    ic: Intcom = Intcom(intcode, "Ring Intcom",
+                        inputMethod=IO_METHOD.RING, outputMethod=IO_METHOD.RING,
+                        inputSrc=inRing, outputDest=outRing,
+                        maxInstructions=maxInstructions, timeLimit=timeLimit)
+    if recordPath is not None:
+        ic.start_recording(recordPath)
+    if ic.run() != STATUS.HALTED:
+        outRing.finish()
+    ic.stop_recording()
 
 
-def piped_intcom_as_a_process(intcode: Dict[int, int], inPipe: PipeConnection, outPipe: PipeConnection) -> Process:
-    """Returns a process ready to run specified intcode, I/O made by passed pipes"""
+def ring_intcom_as_a_process(intcode: Dict[int, int], inRing: SharedRing, outRing: SharedRing, recordPath: str=None,
+                             maxInstructions: int=None, timeLimit: float=None) -> Process:
+    """Returns a process ready to run specified intcode, reading inRing and writing to outRing (see
+    SharedRing). Its I/O session gets recorded to recordPath if given one (see IOSession). The
+    process ends once the intcom executed maxInstructions, or ran for timeLimit seconds, if given."""
 
-    return Process(target=_run_piped_intcom, args=(intcode, inPipe, outPipe))
\ No newline at end of file
+    return Process(target=_run_ring_intcom, args=(intcode, inRing, outRing, recordPath, maxInstructions, timeLimit))
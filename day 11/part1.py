@@ -9,16 +9,17 @@ class HPRobot(object):
     """Class representing a 'Hull-Painting Robot'"""
 
     def __init__(self, brainCode: List[int]) -> None:
-        """Initializes robot's brain, information pipes, location and movement vector."""
+        """Initializes robot's brain, information pipes, location and movement vector.
+        Pipes are framed : each turn is a single frame each way."""
 
         brainToCamera, cameraToBrain = Pipe()
         brainToLegs, legsToBrain = Pipe()
         
-        self.cameraToBrain: Connection = cameraToBrain
-        self.legsToBrain: Connection = legsToBrain
+        self.cameraToBrain: FramedPipe = FramedPipe(cameraToBrain)
+        self.legsToBrain: FramedPipe = FramedPipe(legsToBrain)
 
         self.brain: Process = piped_intcom_as_a_process(
-            list_to_dict(brainCode), brainToCamera, brainToLegs)
+            list_to_dict(brainCode), brainToCamera, brainToLegs, framed=True)
 
         self.location: Tuple[int, int] = (0, 0)
         self.directionVector: Tuple[int, int] = (0, 1)
@@ -73,20 +74,22 @@ class HPRobot(object):
     def run(self) -> None:
 
         self.brain.start()
+        self.legsToBrain.recv_turn() # The brain outputs nothing before its first input
         
         while True:
             
             
-            self.cameraToBrain.send(self._get_camera_output())
+            self.cameraToBrain.send_many([self._get_camera_output()])
             
             try:
-                color: int = self.legsToBrain.recv()
-                self._paint(color)
-            except EOFError: # If brain stopped sending
+                orders: List[int] = self.legsToBrain.recv_turn() # Color, then rotation
+            except EOFError:
+                break
+            if len(orders) < 2: # If brain stopped sending
                 break
             
-            rotation: int = self.legsToBrain.recv()
-            self._rotate_right_angle(bool(rotation))
+            self._paint(orders[0])
+            self._rotate_right_angle(bool(orders[1]))
             
             self._move_to_next()
         
@@ -1,8 +1,5 @@
 from typing import List, Dict, Tuple
 from intcom import *
-from multiprocessing import Pipe, Process
-from multiprocessing.connection import Connection
-from time import sleep
 from sys import maxsize
 
 
@@ -10,16 +7,15 @@ class HPRobot(object):
     """Class representing a 'Hull-Painting Robot'"""
 
     def __init__(self, brainCode: List[int]) -> None:
-        """Initializes robot's brain, information pipes, location and movement vector."""
+        """Initializes robot's brain, information lists, location and movement vector.
+        The brain runs in the robot's process, only when the robot needs it."""
 
-        brainToCamera, cameraToBrain = Pipe()
-        brainToLegs, legsToBrain = Pipe()
-        
-        self.cameraToBrain: Connection = cameraToBrain
-        self.legsToBrain: Connection = legsToBrain
+        self.cameraToBrain: List[int] = []
+        self.legsToBrain: List[int] = []
 
-        self.brain: Process = piped_intcom_as_a_process(
-            list_to_dict(brainCode), brainToCamera, brainToLegs)
+        self.brain: Intcom = Intcom(list_to_dict(brainCode), "HPRobot's brain",
+                                    inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                    inputSrc=self.cameraToBrain, outputDest=self.legsToBrain)
 
         self.location: Tuple[int, int] = (0, 0)
         self.directionVector: Tuple[int, int] = (0, 1)
@@ -72,26 +68,27 @@ class HPRobot(object):
             self.grid[self.location[0]][self.location[1]] = '#'
 
     def run(self) -> None:
-
-        self.brain.start()
         
         while True:
             
+            self.cameraToBrain.insert(0, self._get_camera_output())
             
-            self.cameraToBrain.send(self._get_camera_output())
+            # Brain paints and rotates, then waits for the next camera output
+            status: STATUS = self.brain.run_until(STATUS.NEEDS_INPUT)
             
-            try:
-                color: int = self.legsToBrain.recv()
-                self._paint(color)
-            except EOFError: # If brain stopped sending
+            if len(self.legsToBrain) == 0: # If brain stopped sending
                 break
             
-            rotation: int = self.legsToBrain.recv()
+            color: int = self.legsToBrain.pop()
+            self._paint(color)
+            
+            rotation: int = self.legsToBrain.pop()
             self._rotate_right_angle(bool(rotation))
             
             self._move_to_next()
-        
-        self.brain.join()
+            
+            if status == STATUS.HALTED:
+                break
         
 
 def save_dict_grid_as_PPM(grid: Dict[int, Dict[int, str]]) -> None:
@@ -17,14 +17,19 @@ class TILE_TYPE(IntEnum):
 class Arcade(object):
     """A class representing an Acade machine"""
     
-    def __init__(self, gameProg: List[int]) -> None:
-        """Builds an Arcade machine from a code"""
+    def __init__(self, gameProg: List[int], recordPath: str=None) -> None:
+        """Builds an Arcade machine from a code. The processor's I/O session is recorded to
+        recordPath if given one, to be replayed without the arcade (see IOSession). Pipes are
+        framed : each turn is a single frame each way."""
         
-        self.processorIn, self.arcadeOut = Pipe(duplex=False)
-        self.arcadeIn, self.processorOut = Pipe(duplex=False)
+        self.processorIn, arcadeOut = Pipe(duplex=False)
+        arcadeIn, self.processorOut = Pipe(duplex=False)
+        self.arcadeOut: FramedPipe = FramedPipe(arcadeOut)
+        self.arcadeIn: FramedPipe = FramedPipe(arcadeIn)
         
         self.processor: Process = piped_intcom_as_a_process(list_to_dict(gameProg),
-                                                            self.processorIn, self.processorOut)
+                                                            self.processorIn, self.processorOut,
+                                                            recordPath, framed=True)
         
         self.screen: List[List[TILE_TYPE]] = [[0 for j in range(24)] for i in range(41)]
         
@@ -34,16 +39,15 @@ class Arcade(object):
         self.hPaddleX: int = -1
         
     def _refresh_screen(self) -> None:
-        """Refreshes the screen and the segment data"""
+        """Refreshes the screen and the segment data, with every tile the processor drew since it
+        last asked for the joystick"""
         
-        while self.arcadeIn.poll(0.1):
-            
-            x = self.arcadeIn.recv()
-            y = self.arcadeIn.recv()
+        tiles: List[int] = self.arcadeIn.recv_turn()
+        for i in range(0, len(tiles) - 2, 3):
+            x, y, t = tiles[i:i + 3]
             if x == -1 and y == 0:
-                self.score = self.arcadeIn.recv()
+                self.score = t
             else:
-                t = self.arcadeIn.recv()
                 if t == TILE_TYPE.BALL:
                     self.ballX = x
                 elif t == TILE_TYPE.H_PADDLE:
@@ -74,14 +78,19 @@ class Arcade(object):
         
         self.processor.start()
         
-        while self.processor.is_alive():
-            self._refresh_screen()
+        while True:
+            try:
+                self._refresh_screen()
+            except EOFError:
+                break
+            if self.arcadeIn.closed(): # Game over
+                break
             
             joystickInput = self.getJoystickBestInput()
             
             try:
-                self.arcadeOut.send(joystickInput)
-            except EOFError:
+                self.arcadeOut.send_many([joystickInput])
+            except (EOFError, BrokenPipeError):
                 break
             
             if self.check_for_blocks() == False:
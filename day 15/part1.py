@@ -1,6 +1,5 @@
-from intcom import Intcom, piped_intcom_as_a_process, list_to_dict
+from intcom import Intcom, PipeConnection, piped_intcom_as_a_process, list_to_dict
 from multiprocessing import Pipe, Process
-from multiprocessing.connection import PipeConnection
 from typing import List, Dict, Tuple, Set, Union
 from sys import maxsize
 from queue import Queue
@@ -1,14 +1,15 @@
-from intcom import Intcom, piped_intcom_as_a_process, list_to_dict
-from multiprocessing import Pipe, Process
-from multiprocessing.connection import PipeConnection
-from typing import List, Dict, Tuple, Set, Union
+from intcom import Intcom, IO_METHOD, STATUS, list_to_dict
+from typing import List, Dict, Tuple, Set, Union, Deque
 from sys import maxsize
-from queue import Queue
+from collections import deque
 
 
 # A tile is a 2-int-tuple containing X and Y coordinates (0,0) being the starting tile
 Tile = Tuple[int, int]
 
+# Commands moving the droid to each tile given by Droid._get_nearby_from, in the same order
+MOVE_COMMANDS: List[int] = [3, 2, 4, 1]  # West, South, East, North
+
 
 class Droid(object):
     """Class representing a repair droid"""
@@ -16,29 +17,22 @@ class Droid(object):
     def __init__(self, remoteCode: List[int]) -> None:
         """Initialize the repair droid with an intcode"""
 
-        remoteIn, droidOut = Pipe(duplex=False)
-        droidIn, remoteOut = Pipe(duplex=False)
-
         startingTile: Tile = (0, 0)
 
-        self.droidIn: PipeConnection = droidIn
-        self.droidOut: PipeConnection = droidOut
-
-        self.remote: Process = piped_intcom_as_a_process(list_to_dict(remoteCode),
-                                                         remoteIn, remoteOut)
+        self.remote: Intcom = Intcom(list_to_dict(remoteCode), "Remote",
+                                     inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                     inputSrc=[], outputDest=[])
 
         self.wallTiles: Set[Tile] = set()
         # Starting tile is always empty
         self.emptyTiles: Set[Tile] = set({startingTile})
-        # Stack, should start as [(-1, 0), (0, -1), (1, 0)]
-        self.unknownTiles: List[Tile] = []
-        self.path: List[Tile] = []  # First path should simply be [(0, 1)]
 
         self.droidTile: Tile = startingTile
         self.oxygenTile: Tile = None
 
         self.shortestPathLength: int = 0
         self.fillingTime: int = 0
+        self.instructionCount: int = 0  # Instructions executed by the remote and its forks
 
     def _get_nearby_from(self, location: Tile) -> List[Tile]:
         """Returns every tiles directly south, north, east and west from a given tile"""
@@ -56,63 +50,6 @@ class Droid(object):
 
         return [t for t in tiles if t in self.emptyTiles]
 
-    def _get_unmarked(self, tiles: List[Tile]) -> List[Tile]:
-        """Returns a list containing every tile from a given list that are not marked"""
-
-        return [t for t in tiles if t not in self.emptyTiles.union(set(self.unknownTiles)).union(self.wallTiles)]
-
-    def _mark_as_unknown(self, tiles: List[Tile]) -> None:
-        """Marks every tile in the list as unknown"""
-
-        self.unknownTiles.extend(
-            [t for t in tiles if t not in self.unknownTiles])
-
-    def _dijkstra(self, start: Tile, end: Tile) -> List[Tile]:
-        """Dijkstra search algorithm, usable as a pathfinding algorithm by the droid"""
-
-        distance: Dict[Tile, int] = {}
-        parent: Dict[Tile, Tile] = {}
-        unexplored: Set[Tile] = set(self.emptyTiles).union(
-            set(self._get_possible_moves(self._get_nearby_from(start)))).union({end})
-
-        for emptyTile in unexplored:
-            distance[emptyTile] = maxsize
-            parent[emptyTile] = None
-
-        distance[start] = 0
-
-        while len(unexplored) > 0:
-            minDistance: int = maxsize
-            minDistanceTile: Tile = None
-
-            for testedTile in unexplored:
-                if distance[testedTile] <= minDistance:
-                    minDistanceTile = testedTile
-                    minDistance = distance[testedTile]
-
-            unexplored.remove(minDistanceTile)
-
-            if minDistanceTile == end:
-                path: List[Tile] = [end]
-                currentParent = parent[end]
-                while currentParent != None:
-                    path.append(currentParent)
-                    currentParent = parent[currentParent]
-                return path[:-1]
-
-            neighbors: List[Tile] = self._get_possible_moves(
-                self._get_nearby_from(minDistanceTile))
-            if end in self._get_nearby_from(minDistanceTile) and end not in neighbors:
-                neighbors.append(end)
-
-            for neighbor in neighbors:
-                if neighbor in unexplored:
-                    newDistance: int = distance[minDistanceTile] + 1
-
-                    if newDistance < distance[neighbor]:
-                        parent[neighbor] = minDistanceTile
-                        distance[neighbor] = newDistance
-                        
     def _dijkstra_complete_eval(self, source: Tile) -> Dict[str, Union[Dict[Tile, Tile], Dict[Tile, int]]]:
         """Dijkstra algorithm implemented so that it associate a distance to
            every node"""
@@ -148,85 +85,45 @@ class Droid(object):
                         
         return {'parent': parent, 'distance': distance}
 
-    def _apply_mov(self, destination: Tile, status: int) -> None:
-        """Apply a movement given a destination and a status"""
-
-        if status == 0:  # The destination is a wall tile
-            print("wall !")
-            self.wallTiles.add(destination)
-        else:
-            self.droidTile = destination
-            if status == 1:  # The destination is an empty tile
-                self.emptyTiles.add(destination)
-            else:  # The destination is the oxygen tile
-                print("found oxygen !")
-                self.emptyTiles.add(destination)
-                self.oxygenTile = destination
-
-    def _get_mov_command(self, destination: Tile) -> None:
-        """Returns the command needed to go from the droid's location to a destination"""
-
-        offset = (destination[0] - self.droidTile[0],
-                  destination[1] - self.droidTile[1])
-
-        if offset == (-1, 0):  # West
-            return 3
-        elif offset == (0, -1):  # South
-            return 2
-        elif offset == (1, 0):  # East
-            return 4
-        elif offset == (0, 1):  # North
-            return 1
-        else:
-            raise ValueError(f"Offset is not valid : {offset}")
-
-    def searchForDoubles(self):
-        return len(self.unknownTiles) != len(set(self.unknownTiles))
-
     def run(self) -> None:
+        """Maps the whole maze breadth-first : the remote is forked on every empty tile it reaches,
+           and each fork tries a single move from there, so the droid never walks back"""
 
-        self.remote.start()
-
-        started: bool = False
-        self._mark_as_unknown(self._get_unmarked(
-            self._get_nearby_from(self.droidTile)))
-
-        i: int = 0  # iter counter
-
-        while not started or len(self.unknownTiles) > 0:
-            started = True
-            i += 1
-            print("ITER :", i)
-
-            print("start =", self.droidTile)
-
-            if len(self.path) == 0:
-                print("renewing path")
-                nextTarget: Tile = self.unknownTiles.pop()
-                while nextTarget == self.droidTile:
-                    nextTarget = self.unknownTiles.pop()
-                print("unknownTiles check =", nextTarget in self.unknownTiles)
+        self.remote.run_until(STATUS.NEEDS_INPUT)
+        self.instructionCount = self.remote.instructionCount
 
-                self.path = self._dijkstra(self.droidTile, nextTarget)
+        distance: Dict[Tile, int] = {self.droidTile: 0}
+        frontier: Deque[Tuple[Tile, Intcom]] = deque([(self.droidTile, self.remote)])
 
-            destination: Tile = self.path.pop()
+        while len(frontier) > 0:
+            tile, remote = frontier.popleft()
 
-            self.droidOut.send(self._get_mov_command(destination))
+            for command, neighbor in zip(MOVE_COMMANDS, self._get_nearby_from(tile)):
+                if neighbor in self.emptyTiles or neighbor in self.wallTiles:
+                    continue
 
-            self._apply_mov(destination, self.droidIn.recv())
+                fork: Intcom = remote.fork()
+                fork.inputSrc.append(command)
+                fork.run_until(STATUS.NEEDS_INPUT)
+                self.instructionCount += fork.instructionCount - remote.instructionCount
 
-            self._mark_as_unknown(self._get_unmarked(
-                self._get_nearby_from(self.droidTile)))
-            print("stop =", self.droidTile)
+                status: int = fork.outputDest.pop()
+                if status == 0:  # The neighbor is a wall tile
+                    self.wallTiles.add(neighbor)
+                    continue
 
-        self.remote.kill()
+                self.emptyTiles.add(neighbor)
+                distance[neighbor] = distance[tile] + 1
+                if status == 2:  # The neighbor is the oxygen tile
+                    self.oxygenTile = neighbor
+                frontier.append((neighbor, fork))
 
-        self.shortestPathLength = len(self._dijkstra((0, 0), self.oxygenTile))
+        self.shortestPathLength = distance[self.oxygenTile]
         
         # Now getting filling time
         
         fillingTime: int = 0
-        distance: Dict[Tile, int] = self._dijkstra_complete_eval(self.oxygenTile)['distance']
+        distance = self._dijkstra_complete_eval(self.oxygenTile)['distance']
         
         for tile in distance.keys():
             if fillingTime < distance[tile]:
@@ -244,4 +141,5 @@ if __name__ == "__main__":
         droid.run()
         print("=== FINISHED CARTOGRAPHY ===")
         print("Oxygen distance :", droid.shortestPathLength)
-        print("Filling time :", droid.fillingTime)
\ No newline at end of file
+        print("Filling time :", droid.fillingTime)
+        print("Remote instructions :", droid.instructionCount)
\ No newline at end of file
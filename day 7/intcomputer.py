@@ -1,4 +1,5 @@
-from typing import List, Dict, IO
+from typing import List, Dict, IO, Deque
+from collections import deque
 from logging import *
 from sys import stdout, stdin
 from multiprocessing import Pipe, Process
@@ -68,7 +69,7 @@ class Intcomputer(object):
         if inputMethod == self.IN_STDIN:
             self.input: IO = stdin
         elif inputMethod == self.IN_INTERNAL_LIST:
-            self.input: List[int] = list()
+            self.input: Deque[int] = deque()  # Popped from the right, fed from the left in O(1)
         elif inputMethod == self.IN_PIPE:
             self.input: Conection = Pipe()[0]
         else:
@@ -77,7 +78,7 @@ class Intcomputer(object):
         if outputMethod == self.OUT_STDOUT:
             self.output: IO = stdout
         elif outputMethod == self.OUT_INTERNAL_LIST:
-            self.output: List[int] = list()
+            self.output: Deque[int] = deque()
         elif outputMethod == self.OUT_PIPE:
             self.output: Connection = Pipe()[0]
         else:
@@ -112,7 +113,7 @@ class Intcomputer(object):
         print("Output -->", val)
 
     def _out_from_internal_list(self, val: int) -> None:
-        self.output.insert(0, val)
+        self.output.appendleft(val)
 
     def _out_from_pipe(self, val: int) -> None:
         self.output.send(int(val))
@@ -273,7 +274,7 @@ class Intcomputer(object):
     def list_input(self, val: int) -> None:
         """Adds an input in list if in INTERNAL LIST mode"""
         if self.inputMethod == self.IN_INTERNAL_LIST:
-            self.input.insert(0, val)
+            self.input.appendleft(val)
         else:
             raise ValueError(f"ERROR : OUTPUT IS NOT IN INTERNAL_LIST MODE")
 
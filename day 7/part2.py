@@ -1,56 +1,102 @@
-from intcomputer import Intcomputer, piped_intcomputer_as_a_process
-from typing import List, Dict
-from itertools import permutations
-from multiprocessing import Pool, Pipe, Process
-from functools import partial
+from intcom import ProgramImage, list_to_dict
+from network import IntcomNetwork
+from typing import List, Dict, Iterable, Sequence, Tuple
+from math import factorial
+from multiprocessing import Pool
+from os import cpu_count
 from time import time
 
-def amplifier_test(intcode:List[int], settings:List[int]) -> int:
+def amplifier_test(image:ProgramImage, settings:Sequence[int]) -> int:
     """Return amplifier test for specified settings"""
-    
-    outA, inB = Pipe()
-    outB, inC = Pipe()
-    outC, inD = Pipe()
-    outD, inE = Pipe()
-    outE, inA = Pipe()
-    
-    pA = piped_intcomputer_as_a_process(intcode, inA, outA)
-    pB = piped_intcomputer_as_a_process(intcode, inB, outB)
-    pC = piped_intcomputer_as_a_process(intcode, inC, outC)
-    pD = piped_intcomputer_as_a_process(intcode, inD, outD)
-    pE = piped_intcomputer_as_a_process(intcode, inE, outE)
-    
-    outE.send(settings[0])
-    outA.send(settings[1])
-    outB.send(settings[2])
-    outC.send(settings[3])
-    outD.send(settings[4])
-    
-    outE.send(0)
-    
-    pA.start()
-    pB.start()
-    pC.start()
-    pD.start()
-    pE.start()
-    
-    pA.join()
-    pB.join()
-    pC.join()
-    pD.join()
-    pE.join()
-    
-    return inA.recv()
+
+    names: List[str] = [chr(ord('A') + i) for i in range(len(settings))]
+    channels: List[Tuple[str, str]] = list(zip(names, names[1:] + names[:1])) # A -> B -> ... -> A
+    inputs: Dict[str, List[int]] = {name: [setting] for name, setting in zip(names, settings)}
+    inputs['A'].append(0)
+
+    network: IntcomNetwork = IntcomNetwork({name: image for name in names}, channels, inputs)
+
+    return network.run()[names[-1]][-1]
+
+
+def nth_permutation(phases:Sequence[int], index:int) -> Tuple[int, ...]:
+    """Returns the permutation of phases that itertools.permutations yields at a given index"""
+
+    left: List[int] = list(phases)
+    permutation: List[int] = []
+    for remaining in range(len(left), 0, -1):
+        position, index = divmod(index, factorial(remaining - 1))
+        permutation.append(left.pop(position))
+    return tuple(permutation)
+
+
+_image: ProgramImage = None # Program of the worker's amplifiers, loaded once per worker
+
+def _load_program(intcode:List[int]) -> None:
+    """Initializes a worker : loads the amplifiers' program"""
+
+    global _image
+    _image = ProgramImage(list_to_dict(intcode))
+
+
+def _search_range(args:Tuple[Sequence[int], int, int]) -> Tuple[int, Tuple[int, ...]]:
+    """Returns the highest signal, and its settings, of the permutations in a range of indices"""
+
+    phases, start, stop = args
+    return max((amplifier_test(_image, settings), settings)
+               for settings in (nth_permutation(phases, index) for index in range(start, stop)))
+
+
+def _reduce(results:Iterable[Tuple[int, Tuple[int, ...]]], bound:int) -> Tuple[int, Tuple[int, ...]]:
+    """Returns the best of ranges' results, or the first one reaching the target signal, leaving
+    the other ranges unread"""
+
+    best: Tuple[int, Tuple[int, ...]] = None
+    for result in results:
+        best = result if best is None else max(best, result)
+        if bound is not None and best[0] >= bound:
+            break
+    return best
+
+
+def parallel_search(intcode:List[int], phases:Sequence[int], processes:int=None, *,
+                    chunkSize:int=None, bound:int=None) -> Tuple[int, Tuple[int, ...]]:
+    """Returns the highest signal a feedback loop of amplifiers outputs, and its phase settings. The
+    permutations of phases are searched by a pool of processes : each worker loads the program once,
+    then is handed ranges of permutation indices, runs their feedback loops in-process and only
+    sends back the best one.
+
+    Nothing bounds a feedback loop's signal in general, so the search can only stop early on a
+    target signal given by the caller : it is not checked, and a loop above it may be missed. As
+    soon as a range reaches it, the pool is terminated, cancelling the ranges still running.
+
+    Arguments:
+        intcode {List[int]} -- The amplifiers' program
+        phases {Sequence[int]} -- Phase settings, an amplifier per phase
+
+    Keyword Arguments:
+        processes {int} -- Number of worker processes, 0 to search in the current process, None for one per CPU (default: {None})
+        chunkSize {int} -- Permutations per range, a few ranges per worker if None (default: {None})
+        bound {int} -- Target signal, trusted as it is : the search stops as soon as a loop reaches it, None to search every permutation (default: {None})
+    """
+
+    total: int = factorial(len(phases))
+    workers: int = processes if processes is not None else cpu_count()
+    if chunkSize is None:
+        chunkSize = max(1, total // (8 * max(workers, 1))) # A few ranges per worker, to balance the load
+    ranges: List[Tuple[Sequence[int], int, int]] = [(tuple(phases), start, min(start + chunkSize, total))
+                                                    for start in range(0, total, chunkSize)]
+
+    if workers == 0:
+        _load_program(intcode)
+        return _reduce(map(_search_range, ranges), bound)
+
+    with Pool(workers, initializer=_load_program, initargs=(intcode,)) as pool:
+        return _reduce(pool.imap_unordered(_search_range, ranges), bound) # Leaving the pool terminates the ranges left
 
 if __name__ == '__main__':
     begin = time()
-    with open("C:\\Projects\\aoc2019\\day 7\\inputs.txt", 'r+') as raw_intcode:
+    with open("inputs.txt", 'r+') as raw_intcode:
         intcode:List[int] = [int(elt) for elt in raw_intcode.readline().split(',')]
-        
-        settings:List[int] = list(permutations([5, 6, 7, 8, 9]))
-        
-        res:List[int] = [amplifier_test(intcode, setting) for setting in settings]
-        #with Pool(None) as p:
-            #res = p.map(partial(amplifier_test, intcode), settings)
-            
-        print(max(res), time() - begin)
\ No newline at end of file
+
+        print(*parallel_search(intcode, [5, 6, 7, 8, 9]), time() - begin)
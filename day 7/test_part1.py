@@ -0,0 +1,17 @@
+from part1 import ChainSearch, amplifier_test
+from itertools import permutations
+import pytest
+
+
+def test_chain_search() -> None:
+    intcode = [3, 19, 3, 20, 1002, 20, 10, 20, 1, 19, 20, 20, 1001, 20, 1, 20, 4, 20, 99, 0, 0] # Outputs signal*10 + setting+1
+    
+    search = ChainSearch(intcode)
+    assert search.best([0, 1, 2, 3, 4]) == (54321, (4, 3, 2, 1, 0))
+    assert search.runs == 325
+    assert search.best([0, 1, 2, 3, 4]) == max((amplifier_test(intcode, settings), settings) for settings in permutations(range(5)))
+    assert search.runs == 325
+    
+    assert ChainSearch(intcode).best([7, 3, 5], 2) == (86, (7, 5))
+    with pytest.raises(ValueError):
+        search.best([1, 1], 2)
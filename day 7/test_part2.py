@@ -0,0 +1,27 @@
+from part2 import parallel_search, nth_permutation
+from itertools import permutations
+from threading import Thread
+
+
+def test_nth_permutation() -> None:
+    assert [nth_permutation([5, 6, 7, 8], index) for index in range(24)] == list(permutations([5, 6, 7, 8]))
+
+
+def test_parallel_search() -> None:
+    intcode = [3, 26, 1001, 26, -4, 26, 3, 27, 1002, 27, 2, 27, 1, 27, 26, 27, 4, 27, 1001, 28, -1, 28, 1005, 28, 6, 99, 0, 0, 5]
+    assert parallel_search(intcode, [5, 6, 7, 8, 9], 0) == (139629729, (9, 8, 7, 6, 5))
+    assert parallel_search(intcode, [5, 6, 7, 8, 9], 2, chunkSize=7) == (139629729, (9, 8, 7, 6, 5))
+    assert parallel_search(intcode, [5, 6, 7, 8, 9], 0, chunkSize=1, bound=0)[0] < 139629729 # Stops at the first loop
+
+
+def test_parallel_search_bound() -> None:
+    # Outputs its setting, if it is higher than its input signal : spins forever otherwise
+    intcode = [3, 20, 3, 21, 7, 21, 20, 22, 1006, 22, 14, 4, 20, 99, 1105, 1, 14, 0, 0, 0, 0, 0, 0]
+    results = []
+    
+    # Only the first permutation halts : the search only returns if the pool is torn down once it is found
+    search = Thread(target=lambda: results.append(parallel_search(intcode, [5, 6, 7, 8, 9], 2, chunkSize=1, bound=9)), daemon=True)
+    search.start()
+    search.join(30)
+    assert not search.is_alive()
+    assert results == [(9, (5, 6, 7, 8, 9))]
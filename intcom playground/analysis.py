@@ -0,0 +1,429 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, List, Mapping, Set, Tuple
+
+    ############
+    # DECODING #
+    ############
+
+def static_decode(prog: Mapping[int, int], addr: int) -> DecodedInstruction:
+    """Decodes an instruction from a program that is not running, None if it is not a valid instruction
+
+    Arguments:
+        prog {Mapping[int, int]} -- The program, as given by list_to_dict
+        addr {int} -- Address of the instruction's opcode
+    """
+
+    rawOpcode: int = prog.get(addr, 0)
+    try:
+        opcode, plan = decode_opcode(rawOpcode, addr)
+    except (ValueError, NotImplementedError):
+        return None
+    shape: List[ARG_TYPE] = INSTR_ARG_SHAPE[opcode]
+
+    operands: Tuple[int, ...] = tuple(prog.get(addr + i, 0) for i in range(1, len(shape)))
+    handler = DISPATCH.get(rawOpcode % 10**(len(shape)+1)) # Useless mode digits are dropped
+    return DecodedInstruction(opcode, Intcom._EXECUTORS[opcode], operands, plan, handler)
+
+
+def branch_taken(instr: DecodedInstruction) -> bool:
+    """Tells whether a jump is always taken (True), never taken (False), or if it depends on its
+    condition at runtime (None)"""
+
+    if instr.plan[0] != ARG_PLAN.IMM_VALUE:
+        return None
+    return (instr.a != 0) == (instr.opcode == OPCODE.JIT)
+
+
+def immediate_constant(instr: DecodedInstruction) -> int:
+    """Returns the constant an immediate-only addition or multiplication computes, None for any
+    other instruction"""
+
+    if instr.opcode not in (OPCODE.ADD, OPCODE.MUL) or instr.plan[:2] != (ARG_PLAN.IMM_VALUE, ARG_PLAN.IMM_VALUE):
+        return None
+    return instr.a + instr.b if instr.opcode == OPCODE.ADD else instr.a * instr.b
+
+    ################
+    # REACHABILITY #
+    ################
+
+def _walk(prog: Mapping[int, int], start: int, instrs: Dict[int, DecodedInstruction], entries: Set[int],
+          constants: Set[int], known: Dict[int, DecodedInstruction], knownCells: Set[int]) -> bool:
+    """Follows control flow from an address, adding the instructions it finds to ``instrs`` and the
+    blocks they start to ``entries``. Walks stop at instructions already found or known. Return
+    addresses of calls (a constant stored right before the jump it follows) are walked as well,
+    other constants pointing inside the program are added to ``constants``.
+
+    Arguments:
+        prog {Mapping[int, int]} -- The program
+        start {int} -- Where to start walking
+        instrs {Dict[int, DecodedInstruction]} -- Instructions found, by address (updated in place)
+        entries {Set[int]} -- Block entries found (updated in place)
+        constants {Set[int]} -- Constants which may be code addresses (updated in place)
+        known {Dict[int, DecodedInstruction]} -- Instructions found by previous walks
+        knownCells {Set[int]} -- Cells covered by known instructions
+
+    Returns:
+        bool -- Whether every instruction decoded, and none of them overlaps known instructions
+    """
+
+    valid: bool = True
+    toVisit: List[int] = [start]
+
+    while len(toVisit) > 0:
+        addr: int = toVisit.pop()
+        runConstants: Set[int] = set() # Constants computed since the last jump
+
+        while 0 <= addr < len(prog) and addr not in instrs and addr not in known:
+            instr: DecodedInstruction = static_decode(prog, addr)
+            if instr is None or any(cell in knownCells for cell in range(addr, addr + instr.length)):
+                valid = False
+                break
+            instrs[addr] = instr
+            nextAddr: int = addr + instr.length
+
+            if instr.opcode == OPCODE.HLT:
+                break
+            elif instr.opcode in (OPCODE.JIT, OPCODE.JIF):
+                taken: bool = branch_taken(instr)
+                if taken != False and instr.plan[1] == ARG_PLAN.IMM_VALUE:
+                    entries.add(instr.b)
+                    toVisit.append(instr.b)
+                if nextAddr in runConstants: # A call, which returns right after its jump
+                    entries.add(nextAddr)
+                    toVisit.append(nextAddr)
+                    runConstants.discard(nextAddr)
+                constants.update(runConstants)
+                runConstants = set()
+                if taken == True:
+                    break
+                entries.add(nextAddr)
+            elif instr.opcode in (OPCODE.IN, OPCODE.OUT): # Blocks start again right after I/O
+                entries.add(nextAddr)
+            else:
+                constant: int = immediate_constant(instr)
+                if constant is not None and 0 <= constant < len(prog):
+                    runConstants.add(constant)
+            addr = nextAddr
+
+        constants.update(runConstants)
+
+    return valid
+
+
+def find_code(prog: Mapping[int, int]) -> Tuple[Dict[int, DecodedInstruction], Set[int]]:
+    """Finds the instructions of a program by following its control flow from address 0, calls'
+    return addresses included. Targets of other dynamic jumps can't be known : constants computed by
+    immediate-only additions and multiplications that point inside the program are followed as
+    well, as it is how Intcode stores code pointers. As most of them point to data, code they lead
+    to is only kept if it decodes fully and lines up with the code already found.
+
+    Arguments:
+        prog {Mapping[int, int]} -- The program
+
+    Returns:
+        Tuple[Dict[int, DecodedInstruction], Set[int]] -- Instructions by address, and block entries
+    """
+
+    instrs: Dict[int, DecodedInstruction] = dict()
+    entries: Set[int] = {0}
+    constants: Set[int] = set()
+    _walk(prog, 0, instrs, entries, constants, dict(), set())
+
+    codeCells: Set[int] = {cell for addr, instr in instrs.items() for cell in range(addr, addr + instr.length)}
+    tried: Set[int] = set()
+    while len(constants - tried) > 0:
+        constant: int = min(constants - tried)
+        tried.add(constant)
+        if constant in instrs:
+            entries.add(constant)
+            continue
+
+        found: Dict[int, DecodedInstruction] = dict()
+        foundEntries: Set[int] = {constant}
+        foundConstants: Set[int] = set()
+        if _walk(prog, constant, found, foundEntries, foundConstants, instrs, codeCells):
+            instrs.update(found)
+            entries.update(foundEntries)
+            constants.update(foundConstants)
+            codeCells.update(cell for addr, instr in found.items() for cell in range(addr, addr + instr.length))
+
+    return instrs, entries
+
+    #####################
+    # BASIC BLOCK CLASS #
+    #####################
+
+class BasicBlock(object):
+    """A straight-line run of instructions, ending with a jump, an I/O instruction or a halt (the
+    places where Intcom's engines end their own blocks), or right before another block's entry"""
+
+    __slots__ = ('entry', 'addrs', 'end', 'successors', 'dynamic')
+
+    def __init__(self, entry: int, addrs: List[int], end: int) -> None:
+        """Initializes a basic block, without successors
+
+        Arguments:
+            entry {int} -- Address of its first instruction
+            addrs {List[int]} -- Address of each of its instructions
+            end {int} -- Address right after its last instruction
+        """
+
+        self.entry: int = entry
+        self.addrs: List[int] = addrs
+        self.end: int = end
+        self.successors: List[int] = [] # Entries of the blocks run next
+        self.dynamic: bool = False # Whether it ends with a jump computed at runtime, successors being the known candidates
+
+    def __repr__(self) -> str:
+        return f"BasicBlock({self.entry}-{self.end} -> {self.successors}{' (dynamic)' if self.dynamic else ''})"
+
+    ##########################
+    # PROGRAM ANALYSIS CLASS #
+    ##########################
+
+class ProgramAnalysis(object):
+    """Static analysis of a program : its instructions, which cells are code and which are data, its
+    control-flow graph of basic blocks, the instructions writing into code, and the functions
+    following the usual relative-base calling convention :
+
+    - a call stores its return address (an immediate-only addition or multiplication, usually at
+      ``[rb+offset]``) right before jumping unconditionally, the return address being right after the jump
+    - a function's prologue grows the stack with ``URB frame``
+    - a return pops the frame with ``URB -frame``, then jumps unconditionally to a relative cell
+
+    Positional writes into code (or into cells control flow reaches, but which don't hold a valid
+    instruction yet) are known statically. Relative writes are assumed to hit the stack,
+    which nothing can tell for sure : a program free of code writes may still modify itself that way."""
+
+    def __init__(self, prog: Mapping[int, int]) -> None:
+        """Analyzes a program
+
+        Arguments:
+            prog {Mapping[int, int]} -- The program, as given by list_to_dict
+        """
+
+        self.prog: Mapping[int, int] = prog
+        self.instructions, entries = find_code(prog)
+
+        self.codeCells: Set[int] = {cell for addr, instr in self.instructions.items()
+                                    for cell in range(addr, addr + instr.length)}
+        self.dataCells: Set[int] = {addr for addr in prog if addr not in self.codeCells}
+
+        self.undecoded: Set[int] = set() # Addresses control flow reaches, which only hold an instruction once written at runtime
+        self.blocks: Dict[int, BasicBlock] = self._build_blocks(entries)
+
+        self.codeWrites: Dict[int, int] = dict() # Code cell written by each instruction writing positionally into code
+        for addr, instr in self.instructions.items():
+            if OPCODE_KIND[instr.opcode] == OP_KIND.WRITE and instr.plan[2] == ARG_PLAN.POS_ADDRESS:
+                written: int = instr.c
+            elif instr.opcode == OPCODE.IN and instr.plan[0] == ARG_PLAN.POS_ADDRESS:
+                written = instr.a
+            else:
+                continue
+            if written in self.codeCells or written in self.undecoded:
+                self.codeWrites[addr] = written
+
+        self.stackBase: int = self._find_stack_base() # Relative base the program starts with, None if unknown
+
+        self.calls: Dict[int, Tuple[int, int]] = dict() # (callee, return address) of each call's jump, callee being None if dynamic
+        self.returns: Dict[int, int] = dict() # Frame size popped by each return's jump
+        self.functions: Dict[int, int] = dict() # Frame size of each called function, 0 without prologue
+        self._find_calls()
+
+        ##################
+        # GRAPH BUILDING #
+        ##################
+
+    def _build_blocks(self, entries: Set[int]) -> Dict[int, BasicBlock]:
+        """Splits instructions into basic blocks, and links them with their static successors"""
+
+        blocks: Dict[int, BasicBlock] = dict()
+        for entry in sorted(entries):
+            if entry not in self.instructions:
+                continue
+
+            addrs: List[int] = []
+            addr: int = entry
+            while addr in self.instructions and (addr == entry or addr not in entries):
+                addrs.append(addr)
+                addr += self.instructions[addr].length
+                if self.instructions[addrs[-1]].kind == OP_KIND.JUMP or self.instructions[addrs[-1]].opcode in (OPCODE.IN, OPCODE.OUT, OPCODE.HLT):
+                    break
+            block: BasicBlock = BasicBlock(entry, addrs, addr)
+
+            last: DecodedInstruction = self.instructions[addrs[-1]]
+            if last.opcode in (OPCODE.JIT, OPCODE.JIF):
+                taken: bool = branch_taken(last)
+                if taken != False:
+                    if last.plan[1] == ARG_PLAN.IMM_VALUE:
+                        block.successors.append(last.b)
+                    else:
+                        block.dynamic = True
+                if taken != True:
+                    block.successors.append(addr)
+            elif last.opcode != OPCODE.HLT:
+                block.successors.append(addr)
+            self.undecoded.update(successor for successor in block.successors
+                                  if successor not in self.instructions and 0 <= successor < len(self.prog))
+            block.successors = [successor for successor in block.successors if successor in self.instructions]
+
+            blocks[entry] = block
+        return blocks
+
+    def _find_stack_base(self) -> int:
+        """Returns the relative base set by the first instructions using it, if every path from address
+        0 meets the same immediate URB first. Relative accesses are then made from there, usually past
+        the program's end. Returns None if something else may use the relative base first, 0 if nothing does."""
+
+        bases: Set[int] = set()
+        seen: Set[int] = set()
+        toVisit: List[int] = [0]
+        while len(toVisit) > 0:
+            addr: int = toVisit.pop()
+            if addr in seen:
+                continue
+            seen.add(addr)
+            instr: DecodedInstruction = self.instructions.get(addr)
+
+            if instr is None or ARG_PLAN.REL_VALUE in instr.plan or ARG_PLAN.REL_ADDRESS in instr.plan:
+                return None
+            elif instr.opcode == OPCODE.URB:
+                if instr.plan[0] != ARG_PLAN.IMM_VALUE:
+                    return None
+                bases.add(instr.a)
+            elif instr.opcode in (OPCODE.JIT, OPCODE.JIF):
+                taken: bool = branch_taken(instr)
+                if taken != False:
+                    if instr.plan[1] != ARG_PLAN.IMM_VALUE:
+                        return None
+                    toVisit.append(instr.b)
+                if taken != True:
+                    toVisit.append(addr + instr.length)
+            elif instr.opcode != OPCODE.HLT:
+                toVisit.append(addr + instr.length)
+
+        if len(bases) > 1:
+            return None
+        return bases.pop() if len(bases) == 1 else 0
+
+    def _find_calls(self) -> None:
+        """Finds calls, returns and functions following the relative-base calling convention. Returns
+        of a function get the return addresses of its calls as successors."""
+
+        for block in self.blocks.values():
+            jumpAddr: int = block.addrs[-1]
+            jump: DecodedInstruction = self.instructions[jumpAddr]
+            if jump.opcode not in (OPCODE.JIT, OPCODE.JIF) or branch_taken(jump) != True:
+                continue
+
+            if any(immediate_constant(self.instructions[addr]) == block.end for addr in block.addrs[:-1]):
+                callee: int = jump.b if jump.plan[1] == ARG_PLAN.IMM_VALUE else None
+                self.calls[jumpAddr] = (callee, block.end)
+                if callee in self.instructions:
+                    prologue: DecodedInstruction = self.instructions[callee]
+                    self.functions[callee] = prologue.a if prologue.opcode == OPCODE.URB and prologue.plan[0] == ARG_PLAN.IMM_VALUE and prologue.a > 0 else 0
+            elif jump.plan[1] == ARG_PLAN.REL_VALUE and len(block.addrs) > 1:
+                epilogue: DecodedInstruction = self.instructions[block.addrs[-2]]
+                if epilogue.opcode == OPCODE.URB and epilogue.plan[0] == ARG_PLAN.IMM_VALUE and epilogue.a < 0:
+                    self.returns[jumpAddr] = -epilogue.a
+
+        for function in self.functions:
+            returnAddrs: List[int] = sorted(returnAddr for callee, returnAddr in self.calls.values() if callee == function)
+            for entry in self.function_blocks(function):
+                if self.blocks[entry].addrs[-1] in self.returns:
+                    self.blocks[entry].successors = [addr for addr in returnAddrs if addr in self.instructions]
+
+        ###########
+        # QUERIES #
+        ###########
+
+    def block_at(self, addr: int) -> BasicBlock:
+        """Returns the basic block holding the instruction at a given address, None if it is not code"""
+
+        for block in self.blocks.values():
+            if block.entry <= addr < block.end and addr in block.addrs:
+                return block
+        return None
+
+    def function_blocks(self, function: int) -> Set[int]:
+        """Returns the entries of a function's blocks : the blocks reachable from its entry, calls
+        being stepped over to their return address instead of being followed
+
+        Arguments:
+            function {int} -- Address of the function's entry
+        """
+
+        body: Set[int] = set()
+        toVisit: List[int] = [function]
+        while len(toVisit) > 0:
+            entry: int = toVisit.pop()
+            if entry in body or entry not in self.blocks:
+                continue
+            body.add(entry)
+
+            block: BasicBlock = self.blocks[entry]
+            if block.addrs[-1] in self.calls:
+                toVisit.append(self.calls[block.addrs[-1]][1])
+            elif block.addrs[-1] not in self.returns:
+                toVisit.extend(block.successors)
+        return body
+
+    def predecessors(self) -> Dict[int, List[int]]:
+        """Returns the entries of every block's predecessors, by block entry"""
+
+        preds: Dict[int, List[int]] = {entry: [] for entry in self.blocks}
+        for block in self.blocks.values():
+            for successor in block.successors:
+                if successor in preds:
+                    preds[successor].append(block.entry)
+        return preds
+
+    def is_self_modifying(self) -> bool:
+        """Tells whether some instruction writes positionally into code"""
+
+        return len(self.codeWrites) > 0
+
+        ###########
+        # LISTING #
+        ###########
+
+    def listing(self) -> str:
+        """Returns the program's disassembly : one line per instruction with its address, its raw
+        cells, its assembly and what analysis found about it, blocks being separated by blank lines.
+        Data cells get a line each."""
+
+        lines: List[str] = []
+        addr: int = 0
+        while addr < len(self.prog):
+            if addr in self.blocks and len(lines) > 0:
+                lines.append("")
+
+            if addr in self.instructions:
+                instr: DecodedInstruction = self.instructions[addr]
+                cells: str = ",".join(str(self.prog.get(cell, 0)) for cell in range(addr, addr + instr.length))
+                notes: List[str] = []
+                if addr in self.functions:
+                    notes.append(f"function (frame {self.functions[addr]})")
+                if addr in self.calls:
+                    callee, _ = self.calls[addr]
+                    notes.append(f"call {callee if callee is not None else '?'}")
+                if addr in self.returns:
+                    notes.append("return")
+                if addr in self.codeWrites:
+                    notes.append(f"writes code @ {self.codeWrites[addr]}")
+                line: str = f"{addr:>6}  {cells:<24}{disassemble_instruction(instr):<28}"
+                lines.append((line + "; " + ", ".join(notes)) if len(notes) > 0 else line.rstrip())
+                addr += instr.length
+            else:
+                if addr not in self.codeCells: # Overlapping instructions' cells are already listed
+                    lines.append(f"{addr:>6}  {self.prog.get(addr, 0):<24}DATA")
+                addr += 1
+
+        return "\n".join(lines)
+
+
+def disassemble(prog: Mapping[int, int]) -> str:
+    """Returns a program's disassembly, see ProgramAnalysis.listing"""
+
+    return ProgramAnalysis(prog).listing()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, List, Union
+from asyncio import Queue, sleep
+
+    #############
+    # CONSTANTS #
+    #############
+
+DEFAULT_SLICE: int = 100000 # Instructions an AsyncIntcom runs before letting other coroutines run
+
+    ######################
+    # ASYNC INTCOM CLASS #
+    ######################
+
+class AsyncIntcom(Intcom):
+    """An Intcom whose run() is a coroutine, reading inputs from an asyncio queue and writing outputs
+    to another one. Compute between I/O runs synchronously in slices of many instructions, and the
+    event loop only gets involved when the Intcom starves for input, when a slice ends, and to hand
+    its outputs over. Many AsyncIntcoms can run together on a single thread."""
+
+    def __init__(self, prog: Union[Dict[int, int], ProgramImage], name: str="Default Intcom", *,
+                 inputChannel: Queue, outputChannel: Queue,
+                 engine: ENGINE=ENGINE.TABLE, sliceBudget: int=DEFAULT_SLICE) -> None:
+        """Initializes an async Intcom. See Intcom for the other arguments.
+
+        Keyword Arguments:
+            inputChannel {Queue} -- Where inputs are awaited
+            outputChannel {Queue} -- Where outputs are put
+            sliceBudget {int} -- Instructions run before letting other coroutines run (default: {DEFAULT_SLICE})
+        """
+
+        super().__init__(prog, name, inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                         inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=engine)
+
+        self.inputChannel: Queue = inputChannel
+        self.outputChannel: Queue = outputChannel
+        self.sliceBudget: int = sliceBudget
+
+    async def _flush_outputs(self) -> None:
+        """Puts every output produced during the last slice in the output channel, oldest first"""
+
+        while len(self.outputDest) > 0:
+            await self.outputChannel.put(self.outputDest.pop())
+
+    async def _await_inputs(self) -> None:
+        """Waits for an input, and takes every other one already available along the way"""
+
+        self.inputSrc.feed(await self.inputChannel.get())
+        while not self.inputChannel.empty():
+            self.inputSrc.feed(self.inputChannel.get_nowait())
+
+    async def run(self) -> None:
+        """Runs the intcom until its program halts, awaiting inputs when there are none"""
+
+        while True:
+            status: STATUS = self.run_until(STATUS.NEEDS_INPUT, self.sliceBudget)
+            await self._flush_outputs()
+
+            if status == STATUS.HALTED:
+                return
+            elif status == STATUS.NEEDS_INPUT:
+                await self._await_inputs()
+            else: # End of the slice
+                await sleep(0)
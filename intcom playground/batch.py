@@ -0,0 +1,245 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, List, Tuple, Union
+import numpy as np
+
+    #############
+    # CONSTANTS #
+    #############
+
+INT64_MIN: int = -2**63
+
+RAW_OPCODE_LIMIT: int = 100000 # Valid raw opcodes are below, so that lanes can be grouped on ptr * RAW_OPCODE_LIMIT + raw opcode
+
+    ######################
+    # BATCH INTCOM CLASS #
+    ######################
+
+class BatchIntcom(object):
+    """Many Intcoms running the same program in lockstep, over NumPy arrays : lane i's RAM is row i
+    of ``ram``. At each step, lanes are grouped by instruction pointer and raw opcode, and each group
+    executes its instruction with vectorized operations, operands and relative bases being per lane.
+    Lanes which run the same code (parameter sweeps) stay in a single group, so the interpreter loop
+    runs once per instruction instead of once per instruction and per lane.
+
+    Inputs and outputs are per lane : ``feed`` appends inputs to lanes, and ``outputs`` holds what
+    each lane output. Values are int64s, overflows raise an error instead of wrapping around."""
+
+    def __init__(self, prog: Dict[int, int], lanes: int) -> None:
+        """Initializes lanes all loaded with the same program
+
+        Arguments:
+            prog {Dict[int, int]} -- The program, as given by list_to_dict
+            lanes {int} -- Number of lanes
+        """
+
+        self.lanes: int = lanes
+
+        self.ram: np.ndarray = np.zeros((lanes, max(prog) + 1 if len(prog) > 0 else 1), dtype=np.int64)
+        self.ram[:, list(prog.keys())] = list(prog.values())
+
+        self.instPtr: np.ndarray = np.zeros(lanes, dtype=np.int64)
+        self.relBase: np.ndarray = np.zeros(lanes, dtype=np.int64)
+        self.halted: np.ndarray = np.zeros(lanes, dtype=bool)
+
+        self.inputs: np.ndarray = np.zeros((lanes, 0), dtype=np.int64) # Inputs of each lane, oldest first
+        self.inCount: np.ndarray = np.zeros(lanes, dtype=np.int64) # Number of inputs fed to each lane
+        self.inCursor: np.ndarray = np.zeros(lanes, dtype=np.int64) # Number of inputs each lane read
+
+        self.outputs: np.ndarray = np.zeros((lanes, 0), dtype=np.int64) # Outputs of each lane, oldest first
+        self.outCount: np.ndarray = np.zeros(lanes, dtype=np.int64) # Number of outputs of each lane
+
+        self.steps: int = 0 # Number of grouped instructions executed
+        self.instructionCount: int = 0 # Number of instructions executed, over every lane
+
+        ###########
+        # HELPERS #
+        ###########
+
+    def _reserve(self, maxAddr: int) -> None:
+        """Grows every lane's RAM so that it holds a given address. Lanes' RAM is doubled at least,
+        so that growing stays rare."""
+
+        if maxAddr >= self.ram.shape[1]:
+            columns: int = max(maxAddr + 1, 2 * self.ram.shape[1])
+            self.ram = np.concatenate((self.ram, np.zeros((self.lanes, columns - self.ram.shape[1]), dtype=np.int64)), axis=1)
+
+    def _check_addresses(self, addrs: np.ndarray, lanes: np.ndarray) -> None:
+        """Checks that lanes' addresses are not negative, and that their RAM holds them
+
+        Raises:
+            ValueError -- Access to a negative address is forbidden
+        """
+
+        if addrs.min() < 0:
+            raise ValueError(f"RAM ACCESS ERROR : Accessing a negative address is forbidden (lanes:{lanes[addrs < 0].tolist()})")
+        self._reserve(int(addrs.max()))
+
+    def _load(self, lanes: np.ndarray, addrs: np.ndarray) -> np.ndarray:
+        """Loads a value from each lane's RAM"""
+
+        self._check_addresses(addrs, lanes)
+        return self.ram[lanes, addrs]
+
+    def _store(self, lanes: np.ndarray, addrs: np.ndarray, values: np.ndarray) -> None:
+        """Stores a value in each lane's RAM"""
+
+        self._check_addresses(addrs, lanes)
+        self.ram[lanes, addrs] = values
+
+    def _arg(self, lanes: np.ndarray, plan: ARG_PLAN, operand: np.ndarray) -> np.ndarray:
+        """Resolves an argument of each lane following its plan"""
+
+        if plan == ARG_PLAN.POS_VALUE:
+            return self._load(lanes, operand)
+        elif plan == ARG_PLAN.REL_VALUE:
+            return self._load(lanes, operand + self.relBase[lanes])
+        elif plan == ARG_PLAN.REL_ADDRESS:
+            return operand + self.relBase[lanes]
+        else: # Immediate values and positional addresses are used as they are
+            return operand
+
+        ###############
+        # I/O METHODS #
+        ###############
+
+    def feed(self, values: Union[int, List[int], np.ndarray], lanes: np.ndarray=None) -> None:
+        """Appends inputs to lanes
+
+        Arguments:
+            values {Union[int, List[int], np.ndarray]} -- A value for every lane, or a column of values per lane (lanes x inputs)
+
+        Keyword Arguments:
+            lanes {np.ndarray} -- Lanes to feed, every lane if None (default: {None})
+        """
+
+        lanes = np.arange(self.lanes) if lanes is None else np.asarray(lanes)
+        values = np.asarray(values, dtype=np.int64)
+        if values.ndim == 0: # Same value for every lane
+            values = np.full((len(lanes), 1), values, dtype=np.int64)
+        elif values.ndim == 1: # A value per lane
+            values = values.reshape(-1, 1)
+
+        needed: int = int((self.inCount[lanes] + values.shape[1]).max())
+        if needed > self.inputs.shape[1]:
+            self.inputs = np.concatenate((self.inputs, np.zeros((self.lanes, needed - self.inputs.shape[1]), dtype=np.int64)), axis=1)
+
+        for column in range(values.shape[1]):
+            self.inputs[lanes, self.inCount[lanes]] = values[:, column]
+            self.inCount[lanes] += 1
+
+    def output_columns(self) -> np.ndarray:
+        """Returns every lane's outputs (lanes x outputs), lanes with fewer outputs being padded with 0s"""
+
+        return self.outputs[:, :int(self.outCount.max()) if self.lanes > 0 else 0]
+
+        ##################
+        # EXECUTION STEP #
+        ##################
+
+    def _execute(self, lanes: np.ndarray, ptr: int, rawOpcode: int) -> None:
+        """Executes the instruction at a given address on lanes which all point to it
+
+        Arguments:
+            lanes {np.ndarray} -- The lanes
+            ptr {int} -- Address of the instruction
+            rawOpcode {int} -- The instruction's raw opcode, the same for every lane
+
+        Raises:
+            OverflowError -- Values must fit in an int64
+        """
+
+        opcode, plan = decode_opcode(rawOpcode, ptr)
+        self._reserve(ptr + len(plan))
+        args: List[np.ndarray] = [self._arg(lanes, argPlan, self.ram[lanes, ptr + 1 + i]) for i, argPlan in enumerate(plan)]
+        nextPtr: int = ptr + 1 + len(plan)
+
+        if opcode == OPCODE.ADD:
+            result: np.ndarray = args[0] + args[1]
+            if (((args[0] ^ result) & (args[1] ^ result)) < 0).any(): # Sign differs from both operands
+                raise OverflowError(f"BATCH ERROR : Addition overflows an int64 (@ {ptr})")
+            self._store(lanes, args[2], result)
+        elif opcode == OPCODE.MUL:
+            result = args[0] * args[1]
+            divisor: np.ndarray = np.where(args[0] == 0, 1, args[0])
+            with np.errstate(over='ignore'): # INT64_MIN // -1 overflows, and is checked apart
+                wrapped: np.ndarray = (result // divisor != args[1]) | ((args[0] == -1) & (args[1] == INT64_MIN))
+            if ((args[0] != 0) & wrapped).any():
+                raise OverflowError(f"BATCH ERROR : Multiplication overflows an int64 (@ {ptr})")
+            self._store(lanes, args[2], result)
+        elif opcode == OPCODE.LT:
+            self._store(lanes, args[2], (args[0] < args[1]).astype(np.int64))
+        elif opcode == OPCODE.EQ:
+            self._store(lanes, args[2], (args[0] == args[1]).astype(np.int64))
+        elif opcode == OPCODE.JIT:
+            self.instPtr[lanes] = np.where(args[0] != 0, args[1], nextPtr)
+            return
+        elif opcode == OPCODE.JIF:
+            self.instPtr[lanes] = np.where(args[0] == 0, args[1], nextPtr)
+            return
+        elif opcode == OPCODE.URB:
+            self.relBase[lanes] += args[0]
+        elif opcode == OPCODE.IN: # Starving lanes stay on their input instruction
+            fed: np.ndarray = self.inCursor[lanes] < self.inCount[lanes]
+            lanes, addrs = lanes[fed], args[0][fed]
+            if len(lanes) > 0:
+                self._store(lanes, addrs, self.inputs[lanes, self.inCursor[lanes]])
+                self.inCursor[lanes] += 1
+        elif opcode == OPCODE.OUT:
+            if int(self.outCount[lanes].max()) >= self.outputs.shape[1]:
+                self.outputs = np.concatenate((self.outputs, np.zeros((self.lanes, max(1, self.outputs.shape[1])), dtype=np.int64)), axis=1)
+            self.outputs[lanes, self.outCount[lanes]] = args[0]
+            self.outCount[lanes] += 1
+        else: # Halt
+            self.halted[lanes] = True
+            return
+
+        self.instPtr[lanes] = nextPtr
+
+    def step(self) -> int:
+        """Executes one instruction on every lane that can run (not halted, and not starving for
+        input), grouping lanes by instruction pointer and raw opcode
+
+        Returns:
+            int -- Number of lanes which executed an instruction
+        """
+
+        running: np.ndarray = np.flatnonzero(~self.halted)
+        if len(running) == 0:
+            return 0
+        self._reserve(int(self.instPtr[running].max()))
+        rawOpcodes: np.ndarray = self.ram[running, self.instPtr[running]]
+
+        starving: np.ndarray = (rawOpcodes % 100 == OPCODE.IN) & (self.inCursor[running] >= self.inCount[running])
+        running, rawOpcodes = running[~starving], rawOpcodes[~starving]
+        if len(running) == 0:
+            return 0
+
+        invalid: np.ndarray = (rawOpcodes < 0) | (rawOpcodes >= RAW_OPCODE_LIMIT)
+        if invalid.any(): # Raises the decoding error
+            decode_opcode(int(rawOpcodes[invalid][0]), int(self.instPtr[running][invalid][0]))
+
+        keys: np.ndarray = self.instPtr[running] * RAW_OPCODE_LIMIT + rawOpcodes
+        if (keys == keys[0]).all(): # Lanes didn't diverge
+            groups: List[int] = [int(keys[0])]
+            self._execute(running, groups[0] // RAW_OPCODE_LIMIT, groups[0] % RAW_OPCODE_LIMIT)
+        else:
+            groups, inverse = np.unique(keys, return_inverse=True)
+            for group, key in enumerate(groups.tolist()):
+                self._execute(running[inverse == group], key // RAW_OPCODE_LIMIT, key % RAW_OPCODE_LIMIT)
+
+        self.steps += len(groups)
+        self.instructionCount += len(running)
+        return len(running)
+
+    def run(self) -> np.ndarray:
+        """Runs every lane until it halts or starves for input
+
+        Returns:
+            np.ndarray -- Status of each lane : STATUS.HALTED or STATUS.NEEDS_INPUT
+        """
+
+        while self.step() > 0:
+            pass
+
+        return np.where(self.halted, int(STATUS.HALTED), int(STATUS.NEEDS_INPUT))
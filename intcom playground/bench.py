@@ -0,0 +1,698 @@
+from intcom import *
+from asyncintcom import AsyncIntcom
+from network import Topology, run_networks
+from tracing import TraceReader
+from analysis import ProgramAnalysis
+from optimizer import OptimizedIntcom, find_fusions, optimize
+from cache import ResultCache
+from symbolic import SymbolicIntcom, concrete_solve, solve
+from search import SearchResult, search
+try: # NumPy is only needed by the batch engine
+    from batch import BatchIntcom
+    import numpy as np
+except ImportError:
+    BatchIntcom = None
+from typing import Callable, Deque, Dict, List, Set, Tuple, Union
+from itertools import permutations
+from functools import partial
+from collections import deque
+from os import path, remove
+from time import perf_counter
+from multiprocessing import Pipe
+from asyncio import Queue, gather, run
+
+    ###########
+    # HELPERS #
+    ###########
+
+def load_day_intcode(day: int) -> Dict[int, int]:
+    """Loads the intcode of a given day from the repository, ready to init an Intcom's ram"""
+    
+    with open(path.join(path.dirname(path.abspath(__file__)), "..", f"day {day}", "inputs.txt"), "r") as inputs:
+        return list_to_dict([int(elt) for elt in inputs.readline().split(',')])
+
+
+def count_instructions(prog: Dict[int, int], inputs: List[int]) -> int:
+    """Returns how many instructions a program executes until it halts, given its inputs"""
+    
+    ic: Intcom = Intcom(prog, "Counting Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=list(inputs), outputDest=[])
+    ic.run()
+    return ic.instructionCount
+
+
+def time_engine(prog: Dict[int, int], inputs: List[int], engine: ENGINE, repeat: int=3) -> float:
+    """Returns the best time (in seconds) a given engine takes to run a program"""
+    
+    best: float = float("inf")
+    for _ in range(repeat):
+        ic: Intcom = Intcom(prog, "Benchmarked Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=list(inputs), outputDest=[], engine=engine)
+        begin: float = perf_counter()
+        ic.run()
+        best = min(best, perf_counter() - begin)
+    return best
+
+    ##############
+    # BENCHMARKS #
+    ##############
+
+def bench_engines() -> None:
+    """Prints every engine's speed on Day 9's BOOST program, in sensor boost mode"""
+    
+    prog: Dict[int, int] = load_day_intcode(9)
+    instructions: int = count_instructions(prog, [2])
+    
+    print(f"Day 9 - Part 2 : {instructions} instructions")
+    for engine in ENGINE:
+        duration: float = time_engine(prog, [2], engine)
+        print(f"{engine.name:>6} : {duration:.3f}s -> {instructions / duration:,.0f} instructions/s")
+
+
+
+def amplifiers_search(prog: Union[Dict[int, int], ProgramImage]) -> Tuple[int, int]:
+    """Runs Day 7 - Part 1's amplifiers search, returns the highest signal and the RAM bytes
+    every amplifier used"""
+    
+    best: int = 0
+    residentBytes: int = 0
+    for settings in permutations(range(5)):
+        signal: int = 0
+        for setting in settings:
+            outList: List[int] = []
+            ic: Intcom = Intcom(prog, "Amplifier Intcom",
+                                inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                inputSrc=[signal, setting], outputDest=outList)
+            ic.run()
+            signal = outList.pop()
+            residentBytes += ic.memory_usage()['residentBytes']
+        best = max(best, signal)
+    return best, residentBytes
+
+
+def bench_images() -> None:
+    """Prints Day 7 - Part 1's amplifiers search speed and memory, with a copy of the program per
+    amplifier and with a shared program image"""
+    
+    prog: Dict[int, int] = load_day_intcode(7)
+    
+    for kind, source in (("Copies", prog), ("Image", ProgramImage(prog))):
+        begin: float = perf_counter()
+        best, residentBytes = amplifiers_search(source)
+        print(f"{kind:>6} : {perf_counter() - begin:.3f}s, {residentBytes:,} RAM bytes for 600 amplifiers (best signal : {best})")
+
+
+
+def feedback_loop_processes(prog: Dict[int, int], settings: Tuple[int, ...]) -> int:
+    """Runs Day 7 - Part 2's amplifiers feedback loop with a process per amplifier, as Day 7 does"""
+    
+    pipes: List[Tuple[PipeConnection, PipeConnection]] = [Pipe() for _ in settings] # Amplifier i reads pipes[i], writes to pipes[i+1]
+    for (_, feeder), setting in zip(pipes, settings):
+        feeder.send(setting)
+    pipes[0][1].send(0)
+    
+    amplifiers: List[Process] = [piped_intcom_as_a_process(prog, pipes[i][0], pipes[(i + 1) % len(pipes)][1])
+                                 for i in range(len(pipes))]
+    for amplifier in amplifiers:
+        amplifier.start()
+    for amplifier in amplifiers:
+        amplifier.join()
+    
+    return pipes[0][0].recv()
+
+
+async def feedback_loop_async(prog: Union[Dict[int, int], ProgramImage], settings: Tuple[int, ...]) -> int:
+    """Runs Day 7 - Part 2's amplifiers feedback loop with AsyncIntcoms, on the running event loop"""
+    
+    channels: List[Queue] = [Queue() for _ in settings] # Amplifier i reads channels[i], writes to channels[i+1]
+    for channel, setting in zip(channels, settings):
+        channel.put_nowait(setting)
+    channels[0].put_nowait(0)
+    
+    amplifiers: List[AsyncIntcom] = [AsyncIntcom(prog, "Amplifier AsyncIntcom",
+                                                 inputChannel=channels[i], outputChannel=channels[(i + 1) % len(channels)])
+                                     for i in range(len(channels))]
+    await gather(*(amplifier.run() for amplifier in amplifiers))
+    
+    return channels[0].get_nowait()
+
+
+async def _feedback_loops_async(prog: Union[Dict[int, int], ProgramImage]) -> int:
+    """Runs every feedback loop of Day 7 - Part 2's search at the same time, returns the highest signal"""
+    
+    return max(await gather(*(feedback_loop_async(prog, settings) for settings in permutations(range(5, 10)))))
+
+
+def bench_feedback_loops() -> None:
+    """Prints Day 7 - Part 2's feedback loops search speed, with 600 processes and with 600 AsyncIntcoms
+    on a single thread"""
+    
+    prog: Dict[int, int] = load_day_intcode(7)
+    
+    begin: float = perf_counter()
+    best: int = max(feedback_loop_processes(prog, settings) for settings in permutations(range(5, 10)))
+    print(f"Processes : {perf_counter() - begin:.3f}s (best signal : {best})")
+    
+    begin = perf_counter()
+    best = run(_feedback_loops_async(ProgramImage(prog)))
+    print(f"    Async : {perf_counter() - begin:.3f}s (best signal : {best})")
+    
+    
+def paint_hull_process(prog: Dict[int, int], method: IO_METHOD) -> int:
+    """Runs Day 11 - Part 1's robot with its brain in a process, as Day 11 does, exchanging a value
+    per message (PIPE), a frame per turn (FRAMED) or values through shared rings (RING). Returns the
+    number of painted panels."""
+    
+    if method == IO_METHOD.RING:
+        brainIn, brainOut = SharedRing(), SharedRing()
+        robotOut, robotIn = brainIn, brainOut
+        brain: Process = ring_intcom_as_a_process(prog, brainIn, brainOut)
+        brain.start()
+    else:
+        brainIn, robotOut = Pipe(False)
+        robotIn, brainOut = Pipe(False)
+        brain = piped_intcom_as_a_process(prog, brainIn, brainOut, framed=method == IO_METHOD.FRAMED)
+        brain.start()
+        brainIn.close() # So that receiving from the brain fails once it halted
+        brainOut.close()
+    if method == IO_METHOD.FRAMED:
+        robotOut, robotIn = FramedPipe(robotOut), FramedPipe(robotIn)
+        robotIn.recv_turn() # The brain outputs nothing before its first input
+    
+    location: Tuple[int, int] = (0, 0)
+    direction: Tuple[int, int] = (0, 1)
+    panels: Dict[Tuple[int, int], int] = dict()
+    while True:
+        if method == IO_METHOD.FRAMED:
+            robotOut.send_many([panels.get(location, 0)])
+            orders: List[int] = robotIn.recv_turn()
+            if len(orders) < 2:
+                break
+            color, rotation = orders
+        else:
+            robotOut.send(panels.get(location, 0))
+            try:
+                color, rotation = robotIn.recv(), robotIn.recv()
+            except EOFError: # Brain halted
+                break
+        panels[location] = color
+        direction = (direction[1], -direction[0]) if rotation else (-direction[1], direction[0])
+        location = (location[0] + direction[0], location[1] + direction[1])
+    
+    brain.join()
+    if method == IO_METHOD.RING:
+        brainIn.close()
+        brainOut.close()
+    return len(panels)
+
+
+def stream_burst_process(count: int, method: IO_METHOD) -> int:
+    """Runs an intcom outputting count values in a process, reading them with plain pipes (PIPE),
+    framed pipes (FRAMED) or a shared ring (RING). Returns the sum of the values read."""
+    
+    burst: Dict[int, int] = list_to_dict([4,20, 1001,20,1,20, 1007,20,count,21, 1005,21,0, 99]) # Outputs 0 to count-1
+    total: int = 0
+    if method == IO_METHOD.RING:
+        with SharedRing() as intcomIn, SharedRing() as intcomOut:
+            process: Process = ring_intcom_as_a_process(burst, intcomIn, intcomOut)
+            process.start()
+            try:
+                while True:
+                    total += intcomOut.recv()
+            except EOFError:
+                process.join()
+        return total
+    
+    intcomIn, hostOut = Pipe(False)
+    hostIn, intcomOut = Pipe(False)
+    process = piped_intcom_as_a_process(burst, intcomIn, intcomOut, framed=method == IO_METHOD.FRAMED)
+    process.start()
+    intcomOut.close() # So that receiving fails once the intcom halted
+    if method == IO_METHOD.FRAMED:
+        total = sum(FramedPipe(hostIn).recv_turn())
+    else:
+        try:
+            while True:
+                total += hostIn.recv()
+        except EOFError:
+            pass
+    process.join()
+    return total
+
+
+def bench_transports() -> None:
+    """Prints how long Day 11 - Part 1's robot (a round trip per turn) and a burst of outputs take
+    with an intcom in a process, with plain pipes, framed pipes and shared rings"""
+    
+    prog: Dict[int, int] = load_day_intcode(11)
+    
+    for method in (IO_METHOD.PIPE, IO_METHOD.FRAMED, IO_METHOD.RING):
+        begin: float = perf_counter()
+        panels: int = paint_hull_process(prog, method)
+        print(f"Day 11 - Part 1 - {method.name:>6} : {perf_counter() - begin:.3f}s ({panels} panels)")
+        
+    for method in (IO_METHOD.PIPE, IO_METHOD.FRAMED, IO_METHOD.RING):
+        begin = perf_counter()
+        total: int = stream_burst_process(200000, method)
+        print(f"Burst of 200000 outputs - {method.name:>6} : {perf_counter() - begin:.3f}s (sum : {total})")
+        
+    
+def amplifiers_topology(prog: Union[Dict[int, int], ProgramImage], settings: Tuple[int, ...]) -> Topology:
+    """Returns the topology of Day 7 - Part 2's amplifiers feedback loop, for given phase settings"""
+    
+    names: str = "ABCDE"
+    nodes: Dict[str, Union[Dict[int, int], ProgramImage]] = {name: prog for name in names}
+    channels: List[Tuple[str, str]] = [(names[i], names[(i + 1) % len(names)]) for i in range(len(names))]
+    inputs: Dict[str, List[int]] = {name: [setting] for name, setting in zip(names, settings)}
+    inputs['A'].append(0)
+    
+    return nodes, channels, inputs
+
+
+def bench_networks() -> None:
+    """Prints Day 7 - Part 2's feedback loops search speed with IntcomNetworks, in this process and
+    sharded across a pool of processes"""
+    
+    with ProgramImage(load_day_intcode(7), shared=True) as image:
+        topologies: List[Topology] = [amplifiers_topology(image, settings) for settings in permutations(range(5, 10))]
+        
+        for processes in (0, None):
+            begin: float = perf_counter()
+            best: int = max(outputs['E'][-1] for outputs in run_networks(topologies, processes))
+            duration: float = perf_counter() - begin
+            print(f"Networks ({'in-process' if processes == 0 else 'pool'}) : {duration:.3f}s, "
+                  f"{duration / len(topologies) * 10**6:.0f}us per loop (best signal : {best})")
+    
+
+def amplifiers_search_batch(prog: Dict[int, int]) -> int:
+    """Runs Day 7 - Part 1's amplifiers search with the batch engine : a lane per phase settings
+    permutation, and a batch per amplifier. Returns the highest signal."""
+    
+    settings: np.ndarray = np.array(list(permutations(range(5))))
+    signals: np.ndarray = np.zeros(len(settings), dtype=np.int64)
+    
+    for amplifier in range(5):
+        batch: BatchIntcom = BatchIntcom(prog, len(settings))
+        batch.feed(np.stack((settings[:, amplifier], signals), axis=1))
+        batch.run()
+        signals = batch.output_columns()[:, 0]
+        
+    return int(signals.max())
+
+
+def bench_batch() -> None:
+    """Prints Day 2 - Part 2's noun/verb search and Day 7 - Part 1's amplifiers search speeds, with
+    an Intcom per run and with the batch engine"""
+    
+    if BatchIntcom is None:
+        print("Batch : NumPy is not installed")
+        return
+    
+    prog: Dict[int, int] = load_day_intcode(2)
+    
+    begin: float = perf_counter()
+    for nounVerb in range(10000):
+        ic: Intcom = Intcom({**prog, 1: nounVerb // 100, 2: nounVerb % 100}, "Day 2 Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST, inputSrc=[], outputDest=[])
+        ic.run()
+        if ic.ram[0] == 19690720:
+            found: int = nounVerb
+    print(f"Day 2 - Intcoms : {perf_counter() - begin:.3f}s (noun/verb : {found})")
+    
+    begin = perf_counter()
+    batch: BatchIntcom = BatchIntcom(prog, 10000)
+    batch.ram[:, 1] = np.arange(10000) // 100
+    batch.ram[:, 2] = np.arange(10000) % 100
+    batch.run()
+    print(f"Day 2 -   Batch : {perf_counter() - begin:.3f}s (noun/verb : {int(np.flatnonzero(batch.ram[:, 0] == 19690720)[0])})")
+    
+    prog = load_day_intcode(7)
+    
+    begin = perf_counter()
+    best, _ = amplifiers_search(ProgramImage(prog))
+    print(f"Day 7 - Intcoms : {perf_counter() - begin:.3f}s (best signal : {best})")
+    
+    begin = perf_counter()
+    best = amplifiers_search_batch(prog)
+    print(f"Day 7 -   Batch : {perf_counter() - begin:.3f}s (best signal : {best})")
+    
+
+# Day 15's droid commands, and the move each of them makes
+DROID_MOVES: Dict[int, Tuple[int, int]] = {1: (0, 1), 2: (0, -1), 3: (-1, 0), 4: (1, 0)}
+DROID_BACK: Dict[int, int] = {1: 2, 2: 1, 3: 4, 4: 3}
+
+
+def map_maze_walking(prog: Dict[int, int], remoteClass: Callable[..., Intcom]=Intcom) -> Tuple[int, int]:
+    """Maps Day 15's maze with a single remote, walking depth-first and back. Returns the number of
+    instructions executed and of open tiles."""
+    
+    remote: Intcom = remoteClass(prog, "Walking remote", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                 inputSrc=[], outputDest=[])
+    remote.run_until(STATUS.NEEDS_INPUT)
+    
+    seen: Set[Tuple[int, int]] = {(0, 0)}
+    openTiles: int = 1
+    path: List[Tuple[Tuple[int, int], int]] = [((0, 0), 0)] # Tiles walked to, with the command that led there
+    
+    while len(path) > 0:
+        tile, _ = path[-1]
+        for command, (dx, dy) in DROID_MOVES.items():
+            neighbor: Tuple[int, int] = (tile[0] + dx, tile[1] + dy)
+            if neighbor not in seen:
+                break
+        else: # Every neighbor is known, walking back
+            _, command = path.pop()
+            if len(path) > 0:
+                remote.inputSrc.append(DROID_BACK[command])
+                remote.run_until(STATUS.NEEDS_INPUT)
+                remote.outputDest.pop()
+            continue
+        
+        seen.add(neighbor)
+        remote.inputSrc.append(command)
+        remote.run_until(STATUS.NEEDS_INPUT)
+        if remote.outputDest.pop() != 0:
+            openTiles += 1
+            path.append((neighbor, command))
+            
+    return remote.instructionCount, openTiles
+
+
+def map_maze_forks(prog: Dict[int, int]) -> Tuple[int, int]:
+    """Maps Day 15's maze breadth-first, forking the remote on every open tile so that each fork
+    makes a single move. Returns the number of instructions executed and of open tiles."""
+    
+    remote: Intcom = Intcom(prog, "Forked remote", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[], outputDest=[])
+    remote.run_until(STATUS.NEEDS_INPUT)
+    executed: int = remote.instructionCount
+    
+    seen: Set[Tuple[int, int]] = {(0, 0)}
+    openTiles: int = 1
+    frontier: Deque[Tuple[Tuple[int, int], Intcom]] = deque([((0, 0), remote)])
+    
+    while len(frontier) > 0:
+        tile, remote = frontier.popleft()
+        for command, (dx, dy) in DROID_MOVES.items():
+            neighbor: Tuple[int, int] = (tile[0] + dx, tile[1] + dy)
+            if neighbor in seen:
+                continue
+            seen.add(neighbor)
+            
+            fork: Intcom = remote.fork()
+            fork.inputSrc.append(command)
+            fork.run_until(STATUS.NEEDS_INPUT)
+            executed += fork.instructionCount - remote.instructionCount
+            if fork.outputDest.pop() != 0:
+                openTiles += 1
+                frontier.append((neighbor, fork))
+                
+    return executed, openTiles
+
+
+def bench_forks() -> None:
+    """Prints the instructions executed to map Day 15's maze, walking a single remote and forking it"""
+    
+    prog: Dict[int, int] = load_day_intcode(15)
+    
+    for name, mapper in (("Walking", map_maze_walking), ("  Forks", map_maze_forks)):
+        begin: float = perf_counter()
+        executed, openTiles = mapper(prog)
+        print(f"Day 15 - {name} : {executed} instructions, {perf_counter() - begin:.3f}s ({openTiles} open tiles)")
+        
+
+def bench_profiler() -> None:
+    """Prints the cost of profiling Day 9 - Part 2, and its hottest instructions"""
+    
+    prog: Dict[int, int] = load_day_intcode(9)
+    print(f"Day 9 - Part 2 - Unprofiled : {time_engine(prog, [2], ENGINE.TABLE):.3f}s")
+    
+    ic: Intcom = Intcom(prog, "Profiled Intcom", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[2], outputDest=[])
+    profiler: IntcomProfiler = ic.start_profiling()
+    ic.run()
+    print(f"Day 9 - Part 2 -   Profiled : {profiler.seconds:.3f}s ({profiler.inputSeconds:.6f}s waiting for inputs)")
+    print(profiler.hot_listing(10))
+    
+
+def play_arcade(ic: Intcom) -> int:
+    """Plays Day 13 - Part 2's game on an Intcom running the arcade's program (with IntcomChannels),
+    the paddle following the ball. Returns the final score."""
+    
+    score: int = 0
+    ballX: int = 0
+    paddleX: int = 0
+    
+    while True:
+        status: STATUS = ic.run_until(STATUS.NEEDS_INPUT)
+        
+        for x, y, tile in ic.outputDest.read_records(3):
+            if x == -1 and y == 0:
+                score = tile
+            elif tile == 4: # Ball
+                ballX = x
+            elif tile == 3: # Paddle
+                paddleX = x
+                
+        if status == STATUS.HALTED:
+            return score
+        ic.inputSrc.feed((ballX > paddleX) - (ballX < paddleX))
+        
+
+def bench_tracing() -> None:
+    """Prints the cost of tracing Day 9 - Part 2's bare run and Day 13 - Part 2's game (best of 3
+    runs), and of flushing (replaying) and reading the game's trace back"""
+    
+    boost: Dict[int, int] = load_day_intcode(9)
+    for traced in (False, True):
+        best: float = float("inf")
+        for _ in range(3):
+            ic: Intcom = Intcom(boost, "Benchmarked Intcom", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                inputSrc=[2], outputDest=[])
+            if traced:
+                ic.start_tracing()
+            begin: float = perf_counter()
+            ic.run()
+            best = min(best, perf_counter() - begin)
+        print(f"Day  9 - Part 2 - {'  Traced' if traced else 'Untraced'} : {best:.3f}s ({ic.instructionCount} instructions)")
+    
+    prog: Dict[int, int] = load_day_intcode(13)
+    prog[0] = 2 # Free play
+    tracePath: str = path.join(path.dirname(path.abspath(__file__)), "arcade.trace")
+    
+    for traced in (False, True):
+        best = float("inf")
+        for _ in range(3):
+            ic = Intcom(prog, "Arcade", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=IntcomChannel(), outputDest=IntcomChannel())
+            if traced:
+                ic.start_tracing()
+            begin: float = perf_counter()
+            score: int = play_arcade(ic)
+            best = min(best, perf_counter() - begin)
+        print(f"Day 13 - Part 2 - {'  Traced' if traced else 'Untraced'} : {best:.3f}s "
+              f"({ic.instructionCount} instructions, score : {score})")
+    
+    begin = perf_counter()
+    ic.stop_tracing().flush(tracePath)
+    print(f"Day 13 - Part 2 -    Flush : {perf_counter() - begin:.3f}s ({path.getsize(tracePath):,} bytes)")
+    begin = perf_counter()
+    outputs: int = sum(1 for _ in TraceReader(tracePath).filter(opcode=OPCODE.OUT))
+    print(f"Day 13 - Part 2 -     Read : {perf_counter() - begin:.3f}s ({outputs} output instructions)")
+    remove(tracePath)
+    
+
+def bench_sessions() -> None:
+    """Records Day 13 - Part 2's game, then prints how long replaying it takes with every engine, and
+    whether replays' outputs are identical to the recorded ones"""
+    
+    prog: Dict[int, int] = load_day_intcode(13)
+    prog[0] = 2 # Free play
+    sessionPath: str = path.join(path.dirname(path.abspath(__file__)), "arcade.session")
+    
+    ic: Intcom = Intcom(prog, "Arcade", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=IntcomChannel(), outputDest=IntcomChannel())
+    ic.start_recording(sessionPath)
+    play_arcade(ic)
+    ic.stop_recording()
+    
+    session: IOSession = IOSession.load(sessionPath)
+    print(f"Day 13 - Part 2 - Session : {len(session.inputs())} inputs, {len(session.outputs())} outputs ({path.getsize(sessionPath):,} bytes)")
+    for engine in ENGINE:
+        begin: float = perf_counter()
+        replayed: Intcom = session.replay(engine)
+        print(f"{engine.name:>6} : {perf_counter() - begin:.3f}s ({replayed.instructionCount} instructions, "
+              f"{'identical' if session.matches(replayed) else 'DIFFERENT'} outputs)")
+    remove(sessionPath)
+    
+
+def bench_analysis() -> None:
+    """Prints how long static analysis takes on Days 9, 13 and 15's programs, and what it finds"""
+    
+    for day in (9, 13, 15):
+        prog: Dict[int, int] = load_day_intcode(day)
+        begin: float = perf_counter()
+        analysis: ProgramAnalysis = ProgramAnalysis(prog)
+        print(f"Day {day:>2} - Analysis : {1000 * (perf_counter() - begin):.1f}ms ({len(analysis.instructions)} instructions, "
+              f"{len(analysis.dataCells)} data cells, {len(analysis.blocks)} blocks, {len(analysis.functions)} functions, "
+              f"{len(analysis.calls)} calls, {len(analysis.codeWrites)} code writes)")
+    
+
+def bench_optimizer() -> None:
+    """Prints how many instructions Days 9, 13 and 15 execute before and after peephole optimization,
+    and how long they take"""
+    
+    def day_9(prog: Dict[int, int], intcomClass: Callable[..., Intcom]) -> int:
+        ic: Intcom = intcomClass(prog, "BOOST", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                 inputSrc=[2], outputDest=[])
+        ic.run()
+        return ic.instructionCount
+    
+    def day_13(prog: Dict[int, int], intcomClass: Callable[..., Intcom]) -> int:
+        ic: Intcom = intcomClass(prog, "Arcade", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                 inputSrc=IntcomChannel(), outputDest=IntcomChannel())
+        play_arcade(ic)
+        return ic.instructionCount
+    
+    def day_15(prog: Dict[int, int], intcomClass: Callable[..., Intcom]) -> int:
+        return map_maze_walking(prog, intcomClass)[0]
+    
+    for day, runner in ((9, day_9), (13, day_13), (15, day_15)):
+        prog: Dict[int, int] = load_day_intcode(day)
+        if day == 13:
+            prog[0] = 2 # Free play
+        fusions: int = len(find_fusions(prog))
+        
+        begin: float = perf_counter()
+        executed: int = runner(prog, Intcom)
+        elapsed: float = perf_counter() - begin
+        begin = perf_counter()
+        fusedExecuted: int = runner(optimize(prog), OptimizedIntcom)
+        fusedElapsed: float = perf_counter() - begin
+        
+        print(f"Day {day:>2} - {fusions} fusions : {executed} -> {fusedExecuted} instructions "
+              f"({100 * (fusedExecuted - executed) / executed:+.1f}%), {elapsed:.3f}s -> {fusedElapsed:.3f}s")
+    
+
+def bench_channels() -> None:
+    """Prints how long a burst of outputs (never read until the program halts) takes to produce with
+    a list, and with an IntcomChannel"""
+    
+    for count in (10000, 200000):
+        burst: Dict[int, int] = list_to_dict([4,20, 1001,20,1,20, 1007,20,count,21, 1005,21,0, 99]) # Outputs 0 to count-1
+        for name, channel in (("   List", []), ("Channel", IntcomChannel())):
+            ic: Intcom = Intcom(burst, "Burst", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                inputSrc=[], outputDest=channel)
+            begin: float = perf_counter()
+            ic.run()
+            print(f"Burst of {count} outputs - {name} : {perf_counter() - begin:.3f}s")
+    
+
+def amplifiers_search_cached(prog: Dict[int, int], cache: ResultCache) -> int:
+    """Runs Day 7 - Part 1's amplifiers search through a result cache, returns the highest signal"""
+    
+    best: int = 0
+    for settings in permutations(range(5)):
+        signal: int = 0
+        for setting in settings:
+            signal = cache.run(prog, [setting, signal]).outputs[-1]
+        best = max(best, signal)
+    return best
+
+
+def bench_cache() -> None:
+    """Prints Day 7 - Part 1's amplifiers search speed without and with a result cache, and how
+    long Day 2's program takes to be run again once cached"""
+    
+    prog: Dict[int, int] = load_day_intcode(7)
+    begin: float = perf_counter()
+    best, _ = amplifiers_search(prog)
+    print(f"Day 7 - Uncached : {perf_counter() - begin:.3f}s (best signal : {best})")
+    
+    cache: ResultCache = ResultCache()
+    for attempt in ("First", "Again"):
+        begin = perf_counter()
+        best = amplifiers_search_cached(prog, cache)
+        print(f"Day 7 - {attempt:>8} : {perf_counter() - begin:.3f}s, {cache.hits} hits, {cache.misses} misses (best signal : {best})")
+    
+    prog = load_day_intcode(2)
+    prog[1], prog[2] = 12, 2
+    cache.clear()
+    for attempt in ("First", "Again"):
+        begin = perf_counter()
+        for _ in range(100):
+            result = cache.run(prog, [])
+        print(f"Day 2 - {attempt:>8} : {perf_counter() - begin:.3f}s for 100 runs, {cache.hits} hits (result : {result.memory[0]})")
+    
+
+def bench_symbolic() -> None:
+    """Prints how long Day 2 - Part 2's search for a noun and a verb takes, running the program
+    for each pair and running it once symbolically"""
+    
+    prog: Dict[int, int] = load_day_intcode(2)
+    symbols: Dict[int, str] = {1: "noun", 2: "verb"}
+    domains: Dict[str, range] = {"noun": range(100), "verb": range(100)}
+    
+    symbolic: SymbolicIntcom = SymbolicIntcom(prog, symbols)
+    symbolic.run()
+    print(f"Day 2 - Cell 0 : {symbolic.memory[0]}")
+    for name, solver in (("Concrete", concrete_solve), ("Symbolic", solve)):
+        begin: float = perf_counter()
+        assignment: Dict[str, int] = solver(prog, symbols, 0, 19690720, domains)
+        print(f"Day 2 - Part 2 - {name} : {perf_counter() - begin:.4f}s ({assignment})")
+
+    
+
+def cell_0_is(target: int, ic: Intcom) -> bool:
+    """Tells whether a halted Intcom's cell 0 holds a given value"""
+    
+    return ic.ram.load(0) == target
+
+
+def bench_search() -> None:
+    """Prints Day 2 - Part 2's search throughput, building an Intcom per run, and with the search
+    driver's preloaded workers (in the current process, and across a pool)"""
+    
+    prog: Dict[int, int] = load_day_intcode(2)
+    
+    begin: float = perf_counter()
+    result: SearchResult = None
+    runs: int = 0
+    for noun in range(100):
+        for verb in range(100):
+            ic: Intcom = Intcom({**prog, 1: noun, 2: verb}, "Day 2 Intcom",
+                                inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                inputSrc=[], outputDest=[])
+            ic.run()
+            runs += 1
+            if cell_0_is(19690720, ic):
+                result = SearchResult({1: noun, 2: verb}, runs, perf_counter() - begin)
+                break
+        if result is not None:
+            break
+    print(f"Day 2 - Part 2 - Intcom per run : {result}")
+    
+    for processes in (0, None):
+        result = search(prog, {1: range(100), 2: range(100)}, partial(cell_0_is, 19690720), processes)
+        print(f"Day 2 - Part 2 - Search ({processes} processes) : {result}")
+
+
+if __name__ == '__main__':
+    bench_engines()
+    bench_images()
+    bench_feedback_loops()
+    bench_transports()
+    bench_networks()
+    bench_batch()
+    bench_forks()
+    bench_profiler()
+    bench_tracing()
+    bench_sessions()
+    bench_analysis()
+    bench_optimizer()
+    bench_channels()
+    bench_cache()
+    bench_symbolic()
+    bench_search()
@@ -0,0 +1,223 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, Iterable, List, Tuple, Union
+from collections import OrderedDict
+from hashlib import sha256
+from array import array
+from os import path, makedirs, replace, getpid
+
+    #############
+    # CONSTANTS #
+    #############
+
+RESULT_MAGIC: bytes = b"ICRESLT1" # First bytes of a cached result file
+DEFAULT_CACHE_CAPACITY: int = 4096 # Results a cache keeps in memory
+
+    ###############
+    # CACHED RUNS #
+    ###############
+
+def digest(values: Iterable[int]) -> bytes:
+    """Returns the SHA-256 of a sequence of ints : of their int64s if they all fit, of their text otherwise"""
+
+    values = list(values)
+    try:
+        return sha256(b"q" + array('q', values).tobytes()).digest()
+    except OverflowError: # Big ints
+        return sha256(b"t" + ",".join(map(str, values)).encode()).digest()
+
+
+def run_key(prog: Mapping, inputs: List[int]) -> str:
+    """Returns the key of a run : a hash of the program's initial memory (its non-zero cells, so
+    that missing cells and zero cells are alike) and of the whole input sequence
+
+    Arguments:
+        prog {Mapping} -- The program, as given by list_to_dict, or its image
+        inputs {List[int]} -- Every input of the run, oldest first
+    """
+
+    cells: List[int] = [cell for item in sorted(prog.items()) if item[1] != 0 for cell in item]
+    return sha256(digest(cells) + digest(inputs)).hexdigest()
+
+
+class CachedRun(object):
+    """Result of a run that halted : its outputs, the memory it halted with and its number of
+    executed instructions. Cached runs are shared by every lookup : they must not be modified."""
+
+    __slots__ = ('outputs', 'memory', 'instructionCount')
+
+    def __init__(self, outputs: List[int], memory: Dict[int, int], instructionCount: int) -> None:
+        """Initializes a cached run
+
+        Arguments:
+            outputs {List[int]} -- Every output, oldest first
+            memory {Dict[int, int]} -- Non-zero cells of the memory the run halted with
+            instructionCount {int} -- Number of executed instructions
+        """
+
+        self.outputs: List[int] = outputs
+        self.memory: Dict[int, int] = memory
+        self.instructionCount: int = instructionCount
+
+    def save(self, filePath: str) -> None:
+        """Writes the run to a file : RESULT_MAGIC, then int64s (native byte order) : the number of
+        instructions, of outputs and of memory cells, the outputs, then the (address, value) of cells
+
+        Raises:
+            OverflowError -- Values must fit in an int64
+        """
+
+        content: array = array('q', (self.instructionCount, len(self.outputs), len(self.memory)))
+        content.extend(self.outputs)
+        content.extend(cell for item in sorted(self.memory.items()) for cell in item)
+        with open(filePath, "wb") as resultFile:
+            resultFile.write(RESULT_MAGIC)
+            content.tofile(resultFile)
+
+    @classmethod
+    def load(cls, filePath: str) -> CachedRun:
+        """Reads a run from a file
+
+        Raises:
+            ValueError -- The file is not a cached run
+        """
+
+        with open(filePath, "rb") as resultFile:
+            if resultFile.read(len(RESULT_MAGIC)) != RESULT_MAGIC:
+                raise ValueError(f"CACHE ERROR : Not a cached run file ({filePath})")
+            content: array = array('q', resultFile.read())
+
+        instructionCount, outputCount, cellCount = content[:3]
+        if len(content) != 3 + outputCount + 2 * cellCount:
+            raise ValueError(f"CACHE ERROR : Truncated cached run file ({filePath})")
+        cells: array = content[3 + outputCount:]
+        return cls(content[3:3 + outputCount].tolist(), {cells[i]: cells[i + 1] for i in range(0, len(cells), 2)}, instructionCount)
+
+    ################
+    # RESULT CACHE #
+    ################
+
+class ResultCache(object):
+    """Memoizes runs of programs that only depend on their initial memory and their inputs (which
+    intcoms' always do) : runs are keyed by a hash of both (see run_key), and their results kept
+    in memory, the least recently used ones being evicted past the cache's capacity. Results can
+    also be kept on disk, in a file per key, shared by every cache using the same directory.
+
+    Only runs that halt having been given every input they read are cached : a run that needs an
+    input the key doesn't hold is rejected, as its result would depend on what it is fed next."""
+
+    def __init__(self, capacity: int=DEFAULT_CACHE_CAPACITY, directory: str=None) -> None:
+        """Initializes a result cache
+
+        Keyword Arguments:
+            capacity {int} -- Results kept in memory (default: {DEFAULT_CACHE_CAPACITY})
+            directory {str} -- Directory results are also kept in, memory only if None (default: {None})
+
+        Raises:
+            ValueError -- Capacity must be positive
+        """
+
+        if capacity <= 0:
+            raise ValueError(f"CACHE ERROR : Capacity must be positive (capacity:{capacity})")
+        self.capacity: int = capacity
+        self.directory: str = directory
+        if directory is not None:
+            makedirs(directory, exist_ok=True)
+
+        self.results: OrderedDict = OrderedDict() # Results by key, least recently used first
+        self.hits: int = 0 # Lookups answered from memory
+        self.diskHits: int = 0 # Lookups answered from disk
+        self.misses: int = 0 # Lookups that had to run the program
+
+    def _file(self, key: str) -> str:
+        """Returns the file a result is kept in, on disk"""
+
+        return path.join(self.directory, key + ".result")
+
+    def get(self, key: str) -> CachedRun:
+        """Returns the result of a run, None if it is not cached"""
+
+        result: CachedRun = self.results.get(key)
+        if result is not None:
+            self.results.move_to_end(key)
+            self.hits += 1
+            return result
+
+        if self.directory is not None and path.exists(self._file(key)):
+            try:
+                result = CachedRun.load(self._file(key))
+            except (OSError, ValueError): # Unreadable, it is run again
+                return None
+            self._remember(key, result)
+            self.diskHits += 1
+        return result
+
+    def _remember(self, key: str, result: CachedRun) -> None:
+        """Keeps a result in memory, evicting the least recently used one if full"""
+
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.capacity:
+            self.results.popitem(last=False)
+
+    def put(self, key: str, result: CachedRun) -> None:
+        """Caches the result of a run, in memory and on disk. Results that don't fit in int64s are
+        only kept in memory."""
+
+        self._remember(key, result)
+        if self.directory is not None:
+            temporary: str = f"{self._file(key)}.{getpid()}.tmp"
+            try:
+                result.save(temporary)
+            except OverflowError:
+                return
+            replace(temporary, self._file(key)) # Atomic, for caches of other processes
+
+    def run(self, prog: Union[Dict[int, int], ProgramImage], inputs: List[int], engine: ENGINE=ENGINE.TABLE,
+            budget: int=None) -> CachedRun:
+        """Returns the result of running a program with given inputs, running it only if it is not
+        cached yet
+
+        Arguments:
+            prog {Union[Dict[int, int], ProgramImage]} -- The program, as given by list_to_dict, or its image
+            inputs {List[int]} -- Every input of the run, oldest first
+
+        Keyword Arguments:
+            engine {ENGINE} -- Engine running the program on misses (default: {ENGINE.TABLE})
+            budget {int} -- Maximum number of instructions to execute, unlimited if None (default: {None})
+
+        Returns:
+            CachedRun -- The run's result, not to be modified
+
+        Raises:
+            ValueError -- The program needs more inputs than given, or exhausted its budget
+        """
+
+        key: str = run_key(prog, inputs)
+        result: CachedRun = self.get(key)
+        if result is not None:
+            return result
+
+        self.misses += 1
+        ic: Intcom = Intcom(prog, "Cached Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=engine)
+        ic.inputSrc.feed_many(inputs)
+        status: STATUS = ic.run_until(STATUS.HALTED, budget)
+        if status == STATUS.NEEDS_INPUT:
+            raise ValueError(f"CACHE ERROR : Program needs more than the {len(inputs)} given inputs, its run can't be cached")
+        elif status != STATUS.HALTED:
+            raise ValueError(f"CACHE ERROR : Program did not halt within its budget (budget:{budget})")
+
+        result = CachedRun(ic.outputDest.drain(), dict(ic.ram.items()), ic.instructionCount)
+        self.put(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Forgets every result kept in memory, and its statistics. Results on disk are kept."""
+
+        self.results.clear()
+        self.hits = self.diskHits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.results)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, List, Tuple, Union
+from multiprocessing import Pool
+from os import cpu_count
+
+    #############
+    # CONSTANTS #
+    #############
+
+DEFAULT_BUDGET: int = 10000 # Instructions a node runs before the scheduler switches to the next one
+
+# A network's topology : programs by node name, directed channels, and initial inputs by node name
+Topology = Tuple[Dict[str, Union[Dict[int, int], ProgramImage]], List[Tuple[str, str]], Dict[str, List[int]]]
+
+    ########################
+    # INTCOM NETWORK CLASS #
+    ########################
+
+class IntcomNetwork(object):
+    """Intcoms wired together by directed channels, all run in the current process by a round-robin
+    scheduler : a node runs until it starves for input, halts, or exhausts its budget (so that a node
+    that never reads can't hold the others back), then the next one gets its turn. Outputs of a node
+    are sent to every node it has a channel to, and recorded in ``outputs``."""
+
+    def __init__(self, nodes: Dict[str, Union[Dict[int, int], ProgramImage]], channels: List[Tuple[str, str]],
+                 inputs: Dict[str, List[int]]=None, *,
+                 budget: int=DEFAULT_BUDGET, engine: ENGINE=ENGINE.TABLE) -> None:
+        """Initializes a network of Intcoms
+
+        Arguments:
+            nodes {Dict[str, Union[Dict[int, int], ProgramImage]]} -- Program of each node, by name. Scheduling follows this order.
+            channels {List[Tuple[str, str]]} -- Directed channels, as (source node, destination node)
+
+        Keyword Arguments:
+            inputs {Dict[str, List[int]]} -- Initial inputs of nodes, oldest first (default: {None})
+            budget {int} -- Instructions a node runs before the next one gets its turn (default: {DEFAULT_BUDGET})
+            engine {ENGINE} -- Nodes' execution engine (default: {ENGINE.TABLE})
+
+        Raises:
+            ValueError -- Channels must link existing nodes, and budgets must be positive
+        """
+
+        if budget <= 0:
+            raise ValueError(f"NETWORK ERROR : Budget must be positive (budget:{budget})")
+        self.budget: int = budget
+
+        self.nodes: Dict[str, Intcom] = {name: Intcom(prog, name,
+                                                      inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                                      inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=engine)
+                                         for name, prog in nodes.items()}
+
+        self.destinations: Dict[str, List[Intcom]] = {name: [] for name in nodes}
+        for source, destination in channels:
+            if source not in self.nodes or destination not in self.nodes:
+                raise ValueError(f"NETWORK ERROR : Channel links an unknown node ({source} -> {destination})")
+            self.destinations[source].append(self.nodes[destination])
+
+        if inputs is not None:
+            for name, values in inputs.items():
+                self.send(name, values)
+
+        self.outputs: Dict[str, List[int]] = {name: [] for name in nodes} # Every output of each node, oldest first
+
+    def send(self, name: str, values: List[int]) -> None:
+        """Sends values to a node, oldest first"""
+
+        self.nodes[name].inputSrc.feed_many(values)
+
+    def _route(self, name: str) -> None:
+        """Sends a node's new outputs through its channels"""
+
+        produced: List[int] = self.nodes[name].outputDest.drain()
+
+        self.outputs[name].extend(produced)
+        for destination in self.destinations[name]:
+            destination.inputSrc.feed_many(produced)
+
+    def run(self) -> Dict[str, List[int]]:
+        """Runs the network until every node halted
+
+        Returns:
+            Dict[str, List[int]] -- Every output of each node, oldest first
+
+        Raises:
+            RuntimeError -- Deadlock, every node still running starves for input
+        """
+
+        while True:
+            progressed: bool = False
+            running: List[str] = []
+
+            for name, node in self.nodes.items():
+                if node.status == STATUS.HALTED:
+                    continue
+                running.append(name)
+                if node.status == STATUS.NEEDS_INPUT and len(node.inputSrc) == 0: # Still starving
+                    continue
+
+                node.run_until(STATUS.NEEDS_INPUT, self.budget)
+                self._route(name)
+                progressed = True
+
+            if len(running) == 0:
+                return self.outputs
+            elif not progressed:
+                raise RuntimeError(f"NETWORK ERROR : Deadlock, every running node starves for input ({', '.join(running)})")
+
+
+def run_topology(topology: Topology, budget: int=DEFAULT_BUDGET, engine: ENGINE=ENGINE.TABLE) -> Dict[str, List[int]]:
+    """Builds a network from its topology and runs it, returns every output of each node (see IntcomNetwork)"""
+
+    nodes, channels, inputs = topology
+    return IntcomNetwork(nodes, channels, inputs, budget=budget, engine=engine).run()
+
+
+def _run_topology_args(args: Tuple[Topology, int, ENGINE]) -> Dict[str, List[int]]:
+    """Runs a network in a pool's worker"""
+
+    return run_topology(*args)
+
+
+def run_networks(topologies: List[Topology], processes: int=0, *,
+                 budget: int=DEFAULT_BUDGET, engine: ENGINE=ENGINE.TABLE) -> List[Dict[str, List[int]]]:
+    """Runs independent networks, in the current process or sharded across a pool of processes.
+    Programs given as shared ProgramImages are not copied to the workers.
+
+    Arguments:
+        topologies {List[Topology]} -- The networks to run
+
+    Keyword Arguments:
+        processes {int} -- Number of worker processes, 0 to run in the current process, None for one per CPU (default: {0})
+        budget {int} -- Instructions a node runs before the next one gets its turn (default: {DEFAULT_BUDGET})
+        engine {ENGINE} -- Nodes' execution engine (default: {ENGINE.TABLE})
+
+    Returns:
+        List[Dict[str, List[int]]] -- Outputs of each network, in the order of the topologies
+    """
+
+    if processes == 0:
+        return [run_topology(topology, budget, engine) for topology in topologies]
+
+    workers: int = processes if processes is not None else cpu_count()
+    args: List[Tuple[Topology, int, ENGINE]] = [(topology, budget, engine) for topology in topologies]
+    chunkSize: int = max(1, len(args) // (4 * workers)) # A few chunks per worker, to balance the load
+    
+    with Pool(workers) as pool:
+        return pool.map(_run_topology_args, args, chunkSize)
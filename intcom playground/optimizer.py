@@ -0,0 +1,216 @@
+from __future__ import annotations
+from intcom import *
+from analysis import ProgramAnalysis, branch_taken, immediate_constant
+from typing import Callable, Dict, List, Set, Tuple, Union
+
+    #############
+    # CONSTANTS #
+    #############
+
+FUSED_SHIFT: int = 100000 # Fused raw opcodes are the first instruction's raw opcode, plus (FUSED_OPCODE - FUSED_BASE) * FUSED_SHIFT
+FUSED_BASE: int = 100 # Pseudo-opcodes start right above OPCODE's, so that they are never mistaken for real ones
+
+class FUSED_OPCODE(IntEnum):
+    """Pseudo-opcodes of fused instructions. Their last digit is written over the raw opcode of a
+    pair's first instruction, above its mode digits : plain Intcoms ignore it, and run the pair as it was."""
+    STORE  = FUSED_BASE + 1 # Constant-folded store (ADD or MUL of immediates, rewritten as ADD constant, 0)
+    CALL   = FUSED_BASE + 2 # Constant-folded store, then an unconditional jump (a call storing its return address)
+    BRANCH = FUSED_BASE + 3 # LT or EQ, then JIT or JIF on its result (compare-and-branch)
+    RETURN = FUSED_BASE + 4 # URB, then an unconditional jump to a relative cell (a return popping its frame)
+
+    ###########
+    # FUSIONS #
+    ###########
+
+def fusion(first: DecodedInstruction, second: DecodedInstruction) -> FUSED_OPCODE:
+    """Returns what an instruction and the one right after it can be fused into, None if nothing
+
+    Arguments:
+        first {DecodedInstruction} -- The instruction
+        second {DecodedInstruction} -- The instruction right after it, None if it is not one
+    """
+
+    unconditional: bool = (second is not None and second.opcode in (OPCODE.JIT, OPCODE.JIF)
+                           and branch_taken(second) == True)
+
+    if immediate_constant(first) is not None:
+        return FUSED_OPCODE.CALL if unconditional else FUSED_OPCODE.STORE
+    elif (first.opcode in (OPCODE.LT, OPCODE.EQ) and second is not None and second.opcode in (OPCODE.JIT, OPCODE.JIF)
+          and second.a == first.c and (first.plan[2], second.plan[0]) in ((ARG_PLAN.POS_ADDRESS, ARG_PLAN.POS_VALUE),
+                                                                          (ARG_PLAN.REL_ADDRESS, ARG_PLAN.REL_VALUE))):
+        return FUSED_OPCODE.BRANCH
+    elif first.opcode == OPCODE.URB and unconditional and second.plan[1] == ARG_PLAN.REL_VALUE:
+        return FUSED_OPCODE.RETURN
+    return None
+
+
+def find_fusions(prog: Dict[int, int], analysis: ProgramAnalysis=None) -> Dict[int, FUSED_OPCODE]:
+    """Finds the instructions of a program that can safely be fused with the one right after them.
+    Fusing rewrites the first instruction's opcode cell (and its immediates, for constant-folded
+    stores) : no instruction may read these cells as data. No instruction may write to the pair's
+    cells either, as it would have to be decoded again after every write. Relative accesses are
+    assumed to hit the stack, which static analysis can't prove : nothing is fused unless programs
+    using relative accesses first set their relative base past their end (see ProgramAnalysis.stackBase).
+
+    Arguments:
+        prog {Dict[int, int]} -- The program, as given by list_to_dict
+
+    Keyword Arguments:
+        analysis {ProgramAnalysis} -- The program's analysis, if already done (default: {None})
+
+    Returns:
+        Dict[int, FUSED_OPCODE] -- Fusion of each fusable instruction, by address
+    """
+
+    if analysis is None:
+        analysis = ProgramAnalysis(prog)
+    instrs: Dict[int, DecodedInstruction] = analysis.instructions
+    relative: bool = any(plan in (ARG_PLAN.REL_VALUE, ARG_PLAN.REL_ADDRESS) for instr in instrs.values() for plan in instr.plan)
+    if relative and (analysis.stackBase is None or analysis.stackBase < len(prog)): # Relative accesses may hit code
+        return dict()
+
+    read: Set[int] = set() # Cells read positionally
+    written: Set[int] = set() # Cells written positionally
+    for instr in instrs.values():
+        for operand, plan in zip(instr.operands, instr.plan):
+            if plan == ARG_PLAN.POS_VALUE:
+                read.add(operand)
+            elif plan == ARG_PLAN.POS_ADDRESS:
+                written.add(operand)
+
+    fusions: Dict[int, FUSED_OPCODE] = dict()
+    for addr, instr in instrs.items():
+        second: DecodedInstruction = instrs.get(addr + instr.length)
+        fused: FUSED_OPCODE = fusion(instr, second)
+        if fused is None:
+            continue
+        rewritten: range = range(addr, addr + 3) if fused in (FUSED_OPCODE.STORE, FUSED_OPCODE.CALL) else range(addr, addr + 1)
+        pair: range = range(addr, addr + instr.length + (second.length if fused != FUSED_OPCODE.STORE else 0))
+        if read.isdisjoint(rewritten) and written.isdisjoint(pair):
+            fusions[addr] = fused
+    return fusions
+
+
+def optimize(prog: Dict[int, int], fusions: Dict[int, FUSED_OPCODE]=None) -> Dict[int, int]:
+    """Returns an equivalent program whose fusable instructions are marked with their fusion, for
+    OptimizedIntcom to run them as single pseudo-instructions. Constant-folded stores get their
+    constant computed. The program still runs as it is on a plain Intcom.
+
+    Arguments:
+        prog {Dict[int, int]} -- The program, as given by list_to_dict
+
+    Keyword Arguments:
+        fusions {Dict[int, FUSED_OPCODE]} -- Fusions to apply, found by find_fusions if None (default: {None})
+    """
+
+    if fusions is None:
+        fusions = find_fusions(prog)
+
+    optimized: Dict[int, int] = dict(prog)
+    for addr, fused in fusions.items():
+        rawOpcode: int = prog[addr]
+        if fused in (FUSED_OPCODE.STORE, FUSED_OPCODE.CALL):
+            opcode, plan = decode_opcode(rawOpcode, addr)
+            constant: int = prog[addr + 1] + prog[addr + 2] if opcode == OPCODE.ADD else prog[addr + 1] * prog[addr + 2]
+            rawOpcode = rawOpcode - rawOpcode % 100 + OPCODE.ADD
+            optimized[addr + 1], optimized[addr + 2] = constant, 0
+        optimized[addr] = (fused - FUSED_BASE) * FUSED_SHIFT + rawOpcode
+    return optimized
+
+    ##########################
+    # OPTIMIZED INTCOM CLASS #
+    ##########################
+
+class OptimizedIntcom(Intcom):
+    """An Intcom running optimized programs (see optimize) with the table engine, extended with
+    fused pseudo-instructions. A fused instruction runs its pair of instructions as a compiled block
+    does, and counts as a single executed instruction. Its cells are cached as any instruction's :
+    writes to them get it decoded again, and it falls back to its first instruction if the pair
+    does not match its fusion anymore. Nothing is fused while detecting loops, as fused
+    instructions hide their writes from it."""
+
+    # Fused instructions' handlers, by source
+    _handlers: Dict[str, Callable[..., Tuple[int, int, int]]] = dict()
+
+    def __init__(self, prog: Union[Dict[int, int], ProgramImage], name: str="Default Intcom", **kwargs) -> None:
+        """Initializes an optimized Intcom. See Intcom for the arguments, its engine is always the table one.
+
+        Raises:
+            ValueError -- Optimized Intcoms only run with the table engine
+        """
+
+        if kwargs.setdefault('engine', ENGINE.TABLE) != ENGINE.TABLE:
+            raise ValueError(f"CONSTRUCTION ERROR : Optimized Intcoms only run with the table engine : {kwargs['engine']}")
+        super().__init__(prog, name, **kwargs)
+
+    def _plain_decode(self, addr: int) -> DecodedInstruction:
+        """Decodes the instruction at a given address as plain Intcode (fusions are ignored), without caching it
+
+        Raises:
+            ValueError -- Address arguments can't be in immediate mode
+            NotImplementedError -- Opcode or argument mode is not implemented
+        """
+
+        rawOpcode: int = self._load(addr) % FUSED_SHIFT
+        opcode, plan = decode_opcode(rawOpcode, addr)
+        shape: List[ARG_TYPE] = INSTR_ARG_SHAPE[opcode]
+        operands: Tuple[int, ...] = tuple(self._load(addr+i) for i in range(1, len(shape)))
+        return DecodedInstruction(opcode, Intcom._EXECUTORS[opcode], operands, plan,
+                                  DISPATCH.get(rawOpcode % 10**(len(shape)+1)))
+
+    def _predecode(self, addr: int) -> DecodedInstruction:
+        """Decodes the instruction at a given address and stores it in the decode cache, fusing it
+        with the next one if its raw opcode says so and the pair still matches the fusion
+
+        Arguments:
+            addr {int} -- Address of the instruction's opcode
+
+        Returns:
+            DecodedInstruction -- The decoded instruction, fused or not
+        """
+
+        rawOpcode: int = self._load(addr)
+        if self.detectLoops or not min(FUSED_OPCODE) <= FUSED_BASE + rawOpcode // FUSED_SHIFT <= max(FUSED_OPCODE): # Plain instruction
+            return super()._predecode(addr)
+        fused: FUSED_OPCODE = FUSED_OPCODE(FUSED_BASE + rawOpcode // FUSED_SHIFT)
+
+        first: DecodedInstruction = self._plain_decode(addr)
+        pair: List[Tuple[int, DecodedInstruction]] = [(addr, first)]
+        if fused != FUSED_OPCODE.STORE:
+            try:
+                pair.append((addr + first.length, self._plain_decode(addr + first.length)))
+            except (ValueError, NotImplementedError): # Not an instruction anymore
+                return super()._predecode(addr)
+        if fusion(first, pair[1][1] if len(pair) > 1 else None) != fused: # Pair was modified since
+            return super()._predecode(addr)
+
+        source: str = block_source(pair)
+        if source not in OptimizedIntcom._handlers:
+            OptimizedIntcom._handlers[source] = CompiledBlock(addr, 0, source).function
+
+        end: int = pair[-1][0] + pair[-1][1].length
+        instr: DecodedInstruction = DecodedInstruction(fused, OptimizedIntcom._fused, (), ())
+        instr.length = end - addr
+        instr.kind = int(OP_KIND.FUSED)
+        instr.handler = OptimizedIntcom._handlers[source]
+
+        self.decodeCache[addr] = instr
+        self._cache_cells(addr, end)
+        return instr
+
+    def _fused(self) -> None:
+        """Executes a fused instruction, with its handler"""
+
+        self.instPtr, self.relBase, written = self.instr.handler(self.ram.readPages, self.ram.writePages, self.ram,
+                                                                 self.relBase, self.cachedCells)
+        if written is not None:
+            self._invalidate(written)
+
+    def start_tracing(self, capacity: int=DEFAULT_TRACE_CAPACITY) -> IntcomTracer:
+        """Fused instructions can't be traced : trace the original program instead
+
+        Raises:
+            ValueError -- Always
+        """
+
+        raise ValueError(f"TRACE ERROR : Fused instructions can't be traced, trace the original program instead ({self.name})")
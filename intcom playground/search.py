@@ -0,0 +1,186 @@
+from __future__ import annotations
+from intcom import *
+from analysis import find_code
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+from multiprocessing import Pool
+from os import cpu_count
+from time import perf_counter
+
+    ################
+    # SEARCH SPACE #
+    ################
+
+# Values each patched cell can take, by address
+PatchSpace = Dict[int, Sequence[int]]
+
+def space_size(space: PatchSpace) -> int:
+    """Returns the number of patch sets in a search space"""
+
+    size: int = 1
+    for values in space.values():
+        size *= len(values)
+    return size
+
+
+def nth_patches(space: PatchSpace, index: int) -> Dict[int, int]:
+    """Returns the patch set at a given index of a search space : the last cell's values vary the
+    fastest, as in nested loops over the cells in order"""
+
+    patches: Dict[int, int] = dict()
+    for addr, values in reversed(list(space.items())):
+        index, position = divmod(index, len(values))
+        patches[addr] = values[position]
+    return {addr: patches[addr] for addr in space}
+
+    ##################
+    # SEARCH WORKERS #
+    ##################
+
+class SearchWorker(object):
+    """A preloaded Intcom searching patch sets : each candidate is run from a snapshot of the
+    program's initial state, so neither the program nor the Intcom are built again per run. The
+    program's code is decoded before the snapshot is taken : runs only decode again the
+    instructions covering patched cells, and the ones the program writes to."""
+
+    def __init__(self, prog: Union[Dict[int, int], ProgramImage], predicate: Callable[[Intcom], bool],
+                 inputs: Iterable[int]=(), budget: int=None, engine: ENGINE=ENGINE.TABLE) -> None:
+        """Initializes a search worker, see search for the arguments"""
+
+        self.ic: Intcom = Intcom(prog, "Search Intcom",
+                                 inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                 inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=engine)
+        self.ic.inputSrc.feed_many(inputs)
+        for addr in find_code(prog)[0]:
+            self.ic._predecode(addr)
+        self.initial: IntcomSnapshot = self.ic.snapshot()
+        self.predicate: Callable[[Intcom], bool] = predicate
+        self.budget: int = budget
+
+    def try_patches(self, patches: Dict[int, int]) -> bool:
+        """Runs the program with given cells patched, returns whether the predicate holds once it halts
+
+        Raises:
+            ValueError -- The program needs more inputs than given, or exhausted its budget
+        """
+
+        self.ic.restore(self.initial)
+        for addr, value in patches.items():
+            self.ic._write(addr, value) # Drops decoded instructions covering patched cells
+        status: STATUS = self.ic.run_until(STATUS.HALTED, self.budget)
+        if status != STATUS.HALTED:
+            raise ValueError(f"SEARCH ERROR : Run did not halt ({status.name}, patches:{patches})")
+        return self.predicate(self.ic)
+
+    def search_range(self, space: PatchSpace, start: int, stop: int) -> Tuple[int, int]:
+        """Tries the patch sets of a range of indices in order, until one matches
+
+        Returns:
+            Tuple[int, int] -- The matching index (None if none matched), and the number of runs
+        """
+
+        for index in range(start, stop):
+            if self.try_patches(nth_patches(space, index)):
+                return index, index - start + 1
+        return None, stop - start
+
+
+_worker: SearchWorker = None # The pool worker's search worker, preloaded by _init_worker
+
+def _init_worker(*args) -> None:
+    """Initializes a pool's worker : preloads its search worker"""
+
+    global _worker
+    _worker = SearchWorker(*args)
+
+
+def _search_range(args: Tuple[PatchSpace, int, int]) -> Tuple[int, int]:
+    """Searches a range of indices in a pool's worker"""
+
+    return _worker.search_range(*args)
+
+    #################
+    # SEARCH DRIVER #
+    #################
+
+class SearchResult(object):
+    """Outcome of a search : the matching patch set, if any, and how fast candidates were run"""
+
+    __slots__ = ('patches', 'runs', 'elapsed')
+
+    def __init__(self, patches: Dict[int, int], runs: int, elapsed: float) -> None:
+        """Initializes a search result
+
+        Arguments:
+            patches {Dict[int, int]} -- Values of the patched cells, by address, None if nothing matched
+            runs {int} -- Number of runs reported by workers (runs cancelled midway are not counted)
+            elapsed {float} -- Duration of the search, in seconds
+        """
+
+        self.patches: Dict[int, int] = patches
+        self.runs: int = runs
+        self.elapsed: float = elapsed
+
+    def runs_per_second(self) -> float:
+        """Returns the search's throughput"""
+
+        return self.runs / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def __repr__(self) -> str:
+        return f"SearchResult({self.patches}, {self.runs} runs in {self.elapsed:.3f}s, {self.runs_per_second():,.0f} runs/s)"
+
+
+def search(prog: Union[Dict[int, int], ProgramImage], space: PatchSpace, predicate: Callable[[Intcom], bool],
+           processes: int=None, *, inputs: Iterable[int]=(), chunkSize: int=None, budget: int=None,
+           engine: ENGINE=ENGINE.TABLE) -> SearchResult:
+    """Searches a space of patched cells for the first patch set (in nested loops order, see
+    nth_patches) making a program halt in a state satisfying a predicate. Chunks of the space are
+    spread across a pool of processes, each worker preloading an Intcom once and resetting it from a
+    snapshot for every run. Workers are cancelled as soon as the first match is known.
+
+    Arguments:
+        prog {Union[Dict[int, int], ProgramImage]} -- The program, as given by list_to_dict, or its image
+        space {PatchSpace} -- Values each patched cell can take, by address
+        predicate {Callable[[Intcom], bool]} -- Tells whether a halted Intcom matches (picklable, to be sent to workers)
+
+    Keyword Arguments:
+        processes {int} -- Number of worker processes, 0 to search in the current process, None for one per CPU (default: {None})
+        inputs {Iterable[int]} -- Inputs of every run, oldest first (default: {()})
+        chunkSize {int} -- Patch sets per chunk, a few chunks per worker if None (default: {None})
+        budget {int} -- Maximum number of instructions a run executes, unlimited if None (default: {None})
+        engine {ENGINE} -- Workers' execution engine (default: {ENGINE.TABLE})
+
+    Returns:
+        SearchResult -- The first matching patch set, and the search's throughput
+
+    Raises:
+        ValueError -- A run needs more inputs than given, or exhausted its budget
+    """
+
+    begin: float = perf_counter()
+    size: int = space_size(space)
+    workers: int = processes if processes is not None else cpu_count()
+    if chunkSize is None:
+        chunkSize = max(1, size // (8 * max(workers, 1))) # A few chunks per worker, to balance the load
+    chunks: List[Tuple[PatchSpace, int, int]] = [(space, start, min(start + chunkSize, size)) for start in range(0, size, chunkSize)]
+    args: Tuple[object, ...] = (prog, predicate, list(inputs), budget, engine)
+
+    runs: int = 0
+    match: int = None
+    if workers == 0:
+        _init_worker(*args)
+        results: Iterable[Tuple[int, int]] = map(_search_range, chunks)
+    else:
+        pool: Pool = Pool(workers, initializer=_init_worker, initargs=args)
+        results = pool.imap(_search_range, chunks) # In order : the first match found is the first one
+
+    try:
+        for index, done in results:
+            runs += done
+            if index is not None:
+                match = index
+                break
+    finally:
+        if workers != 0:
+            pool.terminate() # Cancels the chunks still running
+
+    return SearchResult(nth_patches(space, match) if match is not None else None, runs, perf_counter() - begin)
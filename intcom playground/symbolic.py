@@ -0,0 +1,353 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, Iterable, List, Mapping, Set, Tuple, Union
+from itertools import product
+
+    ###############
+    # POLYNOMIALS #
+    ###############
+
+# A monomial : the names of its variables, sorted, each repeated as many times as its power
+Monomial = Tuple[str, ...]
+
+class Polynomial(object):
+    """Polynomial with int coefficients over named variables, as built by symbolic runs. Operations
+    return plain ints when their result is constant."""
+
+    __slots__ = ('terms',)
+
+    def __init__(self, terms: Dict[Monomial, int]) -> None:
+        """Initializes a polynomial
+
+        Arguments:
+            terms {Dict[Monomial, int]} -- Coefficient of each monomial, the constant one being ()
+        """
+
+        self.terms: Dict[Monomial, int] = {monomial: coef for monomial, coef in terms.items() if coef != 0}
+
+    @classmethod
+    def variable(cls, name: str) -> Polynomial:
+        """Returns the polynomial of a single variable"""
+
+        return cls({(name,): 1})
+
+    def __add__(self, other: Union[Polynomial, int]) -> Union[Polynomial, int]:
+        if isinstance(other, int):
+            other = Polynomial({(): other})
+        elif not isinstance(other, Polynomial):
+            return NotImplemented
+        terms: Dict[Monomial, int] = dict(self.terms)
+        for monomial, coef in other.terms.items():
+            terms[monomial] = terms.get(monomial, 0) + coef
+        return simplify(Polynomial(terms))
+
+    def __mul__(self, other: Union[Polynomial, int]) -> Union[Polynomial, int]:
+        if isinstance(other, int):
+            other = Polynomial({(): other})
+        elif not isinstance(other, Polynomial):
+            return NotImplemented
+        terms: Dict[Monomial, int] = dict()
+        for monomial, coef in self.terms.items():
+            for otherMonomial, otherCoef in other.terms.items():
+                merged: Monomial = tuple(sorted(monomial + otherMonomial))
+                terms[merged] = terms.get(merged, 0) + coef * otherCoef
+        return simplify(Polynomial(terms))
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Polynomial) and self.terms == other.terms
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.terms.items()))
+
+    def variables(self) -> Set[str]:
+        """Returns the names of the polynomial's variables"""
+
+        return {name for monomial in self.terms for name in monomial}
+
+    def degree(self, name: str) -> int:
+        """Returns the highest power of a variable in the polynomial"""
+
+        return max(monomial.count(name) for monomial in self.terms)
+
+    def substitute(self, values: Dict[str, int]) -> Union[Polynomial, int]:
+        """Returns the polynomial with some of its variables replaced by values, an int if none is left"""
+
+        terms: Dict[Monomial, int] = dict()
+        for monomial, coef in self.terms.items():
+            left: List[str] = []
+            for name in monomial:
+                if name in values:
+                    coef *= values[name]
+                else:
+                    left.append(name)
+            terms[tuple(left)] = terms.get(tuple(left), 0) + coef
+        return simplify(Polynomial(terms))
+
+    def __repr__(self) -> str:
+        text: str = ""
+        for monomial, coef in sorted(self.terms.items(), key=lambda term: (-len(term[0]), term[0])):
+            factors: List[str] = [name if monomial.count(name) == 1 else f"{name}^{monomial.count(name)}"
+                                  for name in sorted(set(monomial))]
+            if abs(coef) != 1 or len(factors) == 0:
+                factors.insert(0, str(abs(coef)))
+            text += (" - " if coef < 0 else " + ") + "*".join(factors)
+        return text[3:] if text.startswith(" + ") else "-" + text[3:]
+
+
+def simplify(poly: Polynomial) -> Union[Polynomial, int]:
+    """Returns a polynomial as an int if it is constant, as it is otherwise"""
+
+    if len(poly.terms) == 0:
+        return 0
+    elif len(poly.terms) == 1 and () in poly.terms:
+        return poly.terms[()]
+    return poly
+
+
+class _Unknown(object):
+    """Value a symbolic run can't compute : read from a symbolic address, or compared to a symbolic
+    value. Runs only fall back to concrete ones if they actually depend on it."""
+
+    def __repr__(self) -> str:
+        return "?"
+
+UNKNOWN: _Unknown = _Unknown()
+
+# A cell's value in a symbolic run
+SymbolicValue = Union[int, Polynomial, _Unknown]
+
+    #########################
+    # SYMBOLIC INTCOM CLASS #
+    #########################
+
+class SymbolicIntcom(object):
+    """Runs a program whose given cells hold variables instead of values : ADD and MUL on them
+    build polynomials, so that a single run tells what every cell and output is as a function of
+    the variables. Control flow has to stay concrete : a run depending on a symbolic value to jump,
+    to pick an instruction, to write somewhere or to move its relative base stops, and has to be
+    run concretely instead (see reason). Comparisons of symbolic values, and reads from symbolic
+    addresses, give UNKNOWN values that are fine as long as nothing depends on them."""
+
+    def __init__(self, prog: Mapping[int, int], symbols: Dict[int, str], inputs: Iterable[int]=()) -> None:
+        """Initializes a symbolic Intcom
+
+        Arguments:
+            prog {Mapping[int, int]} -- The program, as given by list_to_dict, or its image
+            symbols {Dict[int, str]} -- Name of the variable each symbolic cell holds, by address
+
+        Keyword Arguments:
+            inputs {Iterable[int]} -- Inputs of the run, oldest first (default: {()})
+        """
+
+        self.memory: Dict[int, SymbolicValue] = dict(prog.items())
+        for addr, name in symbols.items():
+            self.memory[addr] = Polynomial.variable(name)
+
+        self.inputs: List[int] = list(inputs)[::-1] # Popped from the end
+        self.outputs: List[SymbolicValue] = [] # Every output, oldest first
+        self.instPtr: int = 0
+        self.relBase: int = 0
+        self.instructionCount: int = 0
+        self.halted: bool = False
+        self.reason: str = None # Why the run has to be run concretely, None if it doesn't
+
+    def _value(self, operand: SymbolicValue, plan: ARG_PLAN) -> SymbolicValue:
+        """Resolves a value argument"""
+
+        if plan == ARG_PLAN.IMM_VALUE:
+            return operand
+        elif not isinstance(operand, int): # Symbolic address
+            return UNKNOWN
+        addr: int = operand if plan == ARG_PLAN.POS_VALUE else self.relBase + operand
+        if addr < 0:
+            raise ValueError(f"MEMORY ERROR : Negative address ({addr}) @ {self.instPtr}")
+        return self.memory.get(addr, 0)
+
+    def _address(self, operand: SymbolicValue, plan: ARG_PLAN) -> int:
+        """Resolves an address argument, None if it is symbolic"""
+
+        if not isinstance(operand, int):
+            return None
+        addr: int = operand if plan == ARG_PLAN.POS_ADDRESS else self.relBase + operand
+        if addr < 0:
+            raise ValueError(f"MEMORY ERROR : Negative address ({addr}) @ {self.instPtr}")
+        return addr
+
+    def _stop(self, reason: str) -> bool:
+        """Stops the run, that has to be run concretely"""
+
+        self.reason = f"{reason} @ {self.instPtr}"
+        return False
+
+    def run(self, budget: int=None) -> bool:
+        """Runs the program until it halts, or until it can't stay symbolic
+
+        Keyword Arguments:
+            budget {int} -- Maximum number of instructions to execute, unlimited if None (default: {None})
+
+        Returns:
+            bool -- True if the program halted, False if it has to be run concretely (see reason)
+
+        Raises:
+            ValueError -- Negative address, or address argument in immediate mode
+            NotImplementedError -- Opcode or argument mode is not implemented
+        """
+
+        while not self.halted:
+            if budget is not None and self.instructionCount >= budget:
+                return self._stop(f"Budget exhausted ({budget} instructions)")
+            rawOpcode: SymbolicValue = self.memory.get(self.instPtr, 0)
+            if not isinstance(rawOpcode, int):
+                return self._stop("Symbolic opcode")
+            opcode, plan = decode_opcode(rawOpcode, self.instPtr)
+            operands: List[SymbolicValue] = [self.memory.get(self.instPtr + i, 0) for i in range(1, len(plan) + 1)]
+            nextPtr: int = self.instPtr + len(plan) + 1
+
+            if opcode in (OPCODE.ADD, OPCODE.MUL, OPCODE.LT, OPCODE.EQ):
+                a, b = self._value(operands[0], plan[0]), self._value(operands[1], plan[1])
+                dest: int = self._address(operands[2], plan[2])
+                if dest is None:
+                    return self._stop("Write to a symbolic address")
+                if a is UNKNOWN or b is UNKNOWN:
+                    result: SymbolicValue = UNKNOWN
+                elif opcode == OPCODE.ADD:
+                    result = a + b
+                elif opcode == OPCODE.MUL:
+                    result = a * b
+                elif isinstance(a, int) and isinstance(b, int):
+                    result = int(a < b) if opcode == OPCODE.LT else int(a == b)
+                else: # Symbolic comparison
+                    result = UNKNOWN
+                self.memory[dest] = result
+            elif opcode == OPCODE.IN:
+                dest = self._address(operands[0], plan[0])
+                if dest is None:
+                    return self._stop("Write to a symbolic address")
+                elif len(self.inputs) == 0:
+                    return self._stop("Needs an input")
+                self.memory[dest] = self.inputs.pop()
+            elif opcode == OPCODE.OUT:
+                self.outputs.append(self._value(operands[0], plan[0]))
+            elif opcode in (OPCODE.JIT, OPCODE.JIF):
+                condition, target = self._value(operands[0], plan[0]), self._value(operands[1], plan[1])
+                if not isinstance(condition, int):
+                    return self._stop("Jump depending on a symbolic value")
+                if (condition != 0) == (opcode == OPCODE.JIT):
+                    if not isinstance(target, int):
+                        return self._stop("Jump to a symbolic address")
+                    nextPtr = target
+            elif opcode == OPCODE.URB:
+                offset: SymbolicValue = self._value(operands[0], plan[0])
+                if not isinstance(offset, int):
+                    return self._stop("Symbolic relative base")
+                self.relBase += offset
+            else: # HLT
+                self.halted = True
+                nextPtr = self.instPtr
+
+            self.instPtr = nextPtr
+            self.instructionCount += 1
+        return True
+
+    ###########
+    # SOLVING #
+    ###########
+
+def _assignments(domains: Dict[str, Iterable[int]]) -> Iterable[Dict[str, int]]:
+    """Yields every assignment of variables to values of their domain, in lexicographic order"""
+
+    names: List[str] = list(domains)
+    for values in product(*(list(domain) for domain in domains.values())):
+        yield dict(zip(names, values))
+
+
+def concrete_solve(prog: Mapping[int, int], symbols: Dict[int, str], addr: int, target: int,
+                   domains: Dict[str, Iterable[int]], inputs: Iterable[int]=(), budget: int=None,
+                   engine: ENGINE=ENGINE.TABLE) -> Dict[str, int]:
+    """Finds values of symbolic cells making a program halt with a given value at an address by
+    running it for each assignment, until one matches (see solve for the arguments)
+
+    Raises:
+        ValueError -- A run needs more inputs than given, or exhausted its budget
+    """
+
+    inputs = list(inputs)
+    for assignment in _assignments(domains):
+        patched: Dict[int, int] = dict(prog.items())
+        for cell, name in symbols.items():
+            patched[cell] = assignment[name]
+        ic: Intcom = Intcom(patched, "Concrete Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=engine)
+        ic.inputSrc.feed_many(inputs)
+        status: STATUS = ic.run_until(STATUS.HALTED, budget)
+        if status != STATUS.HALTED:
+            raise ValueError(f"SYMBOLIC ERROR : Concrete run did not halt ({status.name}, {assignment})")
+        if ic.ram[addr] == target:
+            return assignment
+    return None
+
+
+def invert(poly: Union[Polynomial, int], target: int, domains: Dict[str, Iterable[int]]) -> Dict[str, int]:
+    """Finds values of variables, within their domains, making a polynomial equal to a target. The
+    last variable the polynomial is linear in is solved for, the others searched (every one of them
+    if it is linear in none). Variables it doesn't depend on take their domain's first value.
+
+    Returns:
+        Dict[str, int] -- The first matching assignment, None if there is none
+    """
+
+    if isinstance(poly, int):
+        return next(_assignments(domains), None) if poly == target else None
+
+    linear: List[str] = [name for name in domains if name in poly.variables() and poly.degree(name) == 1]
+    if len(linear) == 0:
+        return next((assignment for assignment in _assignments(domains) if poly.substitute(assignment) == target), None)
+
+    solved: str = linear[-1]
+    allowed: Set[int] = set(domains[solved])
+    others: Dict[str, Iterable[int]] = {name: domain for name, domain in domains.items() if name != solved}
+    for assignment in _assignments(others):
+        rest: Union[Polynomial, int] = poly.substitute(assignment) # coef * solved + constant
+        terms: Dict[Monomial, int] = rest.terms if isinstance(rest, Polynomial) else {(): rest}
+        coef, constant = terms.get((solved,), 0), terms.get((), 0)
+        if coef != 0 and (target - constant) % coef == 0 and (target - constant) // coef in allowed:
+            return {**assignment, solved: (target - constant) // coef}
+        elif coef == 0 and constant == target:
+            return {**assignment, solved: next(iter(domains[solved]))}
+    return None
+
+
+def solve(prog: Mapping[int, int], symbols: Dict[int, str], addr: int, target: int,
+          domains: Dict[str, Iterable[int]], inputs: Iterable[int]=(), budget: int=None,
+          engine: ENGINE=ENGINE.TABLE) -> Dict[str, int]:
+    """Finds values of symbolic cells making a program halt with a given value at an address. The
+    program is run once symbolically, and the polynomial it leaves at the address inverted (see
+    invert). Programs that can't be run symbolically are run concretely for each assignment.
+
+    Arguments:
+        prog {Mapping[int, int]} -- The program, as given by list_to_dict, or its image
+        symbols {Dict[int, str]} -- Name of the variable each symbolic cell holds, by address
+        addr {int} -- Address of the result
+        target {int} -- Value wanted at the address
+        domains {Dict[str, Iterable[int]]} -- Values each variable can take
+
+    Keyword Arguments:
+        inputs {Iterable[int]} -- Inputs of the run, oldest first (default: {()})
+        budget {int} -- Maximum number of instructions a run executes, unlimited if None (default: {None})
+        engine {ENGINE} -- Engine of concrete runs (default: {ENGINE.TABLE})
+
+    Returns:
+        Dict[str, int] -- The first matching assignment, None if there is none
+    """
+
+    inputs = list(inputs)
+    symbolic: SymbolicIntcom = SymbolicIntcom(prog, symbols, inputs)
+    if symbolic.run(budget):
+        result: SymbolicValue = symbolic.memory.get(addr, 0)
+        if result is not UNKNOWN:
+            return invert(result, target, domains)
+    return concrete_solve(prog, symbols, addr, target, domains, inputs, budget, engine)
@@ -0,0 +1,78 @@
+from analysis import *
+from typing import List, Dict
+
+    ###################
+    # STATIC ANALYSIS #
+    ###################
+
+# Calls a function doubling cell 12 into its caller's frame, outputs the result (14) and halts
+CALLING: List[int] = [109,100, 21101,9,0,0, 1105,1,13, 204,1, 99, 7, 109,2, 20001,12,12,-1, 109,-2, 2106,0,0]
+
+
+def test_find_code() -> None:
+    """Constants are followed as code pointers only when they lead to code lining up with the rest"""
+
+    instrs, entries = find_code(list_to_dict([1101,1,2,9, 99, 0]))
+    assert sorted(instrs.keys()) == [0, 4] # 3 is the operand of the first instruction
+    assert entries == {0}
+
+    instrs, entries = find_code(list_to_dict([1101,0,6,20, 99, 0, 104,5, 99]))
+    assert sorted(instrs.keys()) == [0, 4, 6, 8]
+    assert entries == {0, 6, 8}
+
+
+def test_program_analysis() -> None:
+    """Code, data, blocks, calls and returns of a small program"""
+
+    ic: Intcom = Intcom(list_to_dict(CALLING), "Calling Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[])
+    ic.run()
+    assert ic.outputDest == [14]
+
+    analysis: ProgramAnalysis = ProgramAnalysis(list_to_dict(CALLING))
+    assert sorted(analysis.instructions.keys()) == [0, 2, 6, 9, 11, 13, 15, 19, 21]
+    assert analysis.dataCells == {12}
+    assert not analysis.is_self_modifying()
+
+    assert {entry: (block.addrs, block.successors, block.dynamic) for entry, block in analysis.blocks.items()} == {
+        0:  ([0, 2, 6], [13], False),
+        9:  ([9], [11], False),
+        11: ([11], [], False),
+        13: ([13, 15, 19, 21], [9], True)
+    }
+    assert analysis.predecessors() == {0: [], 9: [13], 11: [9], 13: [0]}
+    assert analysis.block_at(15).entry == 13
+    assert analysis.block_at(12) is None
+
+    assert analysis.stackBase == 100
+    assert analysis.calls == {6: (13, 9)}
+    assert analysis.functions == {13: 2}
+    assert analysis.returns == {21: 2}
+    assert analysis.function_blocks(13) == {13}
+    assert analysis.function_blocks(0) == {0, 9, 11}
+
+
+def test_self_modification() -> None:
+    """Positional writes into code are found, even into cells that only become code at runtime"""
+
+    analysis: ProgramAnalysis = ProgramAnalysis(list_to_dict([104,0,1001,1,1,1,1007,1,3,14,1005,14,0,99,0]))
+    assert analysis.codeWrites == {2: 1}
+    assert analysis.is_self_modifying()
+
+    analysis = ProgramAnalysis(list_to_dict([1101,4,0,4, 0,0, 99])) # Writes OUT's opcode over an invalid one
+    assert analysis.undecoded == {4}
+    assert analysis.codeWrites == {0: 4}
+
+
+def test_listing() -> None:
+    """Listings have a line per instruction or data cell, and say what analysis found"""
+
+    lines: List[str] = disassemble(list_to_dict(CALLING)).splitlines()
+
+    assert lines[0].split() == ["0", "109,100", "URB", "100"]
+    assert lines[2].endswith("JIT 1, 13                   ; call 13")
+    assert [line.split() for line in lines if "DATA" in line] == [["12", "7", "DATA"]]
+    assert [line for line in lines if line.strip().startswith("13 ")][0].endswith("; function (frame 2)")
+    assert lines[-1].endswith("JIF 0, [rb+0]               ; return")
+    assert lines.count("") == 3
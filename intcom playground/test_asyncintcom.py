@@ -0,0 +1,39 @@
+from asyncintcom import *
+from typing import List, Dict
+from asyncio import Queue, gather, run
+
+    ######################
+    # ASYNC INTCOM TESTS #
+    ######################
+
+async def _feedback_loop(intcode: List[int], settings: List[int], sliceBudget: int) -> int:
+    """Runs an amplifiers feedback loop of AsyncIntcoms, returns the signal sent to the thrusters"""
+    
+    channels: List[Queue] = [Queue() for _ in settings]
+    for channel, setting in zip(channels, settings):
+        channel.put_nowait(setting)
+    channels[0].put_nowait(0)
+    
+    amplifiers: List[AsyncIntcom] = [AsyncIntcom(list_to_dict(intcode), f"Amplifier {i}",
+                                                 inputChannel=channels[i], outputChannel=channels[(i + 1) % len(channels)],
+                                                 sliceBudget=sliceBudget)
+                                     for i in range(len(settings))]
+    await gather(*(amplifier.run() for amplifier in amplifiers))
+    
+    return channels[0].get_nowait()
+
+
+def test_aoc_day7_part2_test1() -> None:
+    """Test 1 from Part 2 of Day 7 on AOC website, five AsyncIntcoms on a single thread"""
+    
+    intcode: List[int] = [3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5]
+    
+    assert run(_feedback_loop(intcode, [9,8,7,6,5], 100000)) == 139629729
+    
+
+def test_async_slices() -> None:
+    """AsyncIntcoms let other coroutines run between slices, without losing their state"""
+    
+    intcode: List[int] = [3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5]
+    
+    assert run(_feedback_loop(intcode, [9,8,7,6,5], 3)) == 139629729
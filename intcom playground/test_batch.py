@@ -0,0 +1,59 @@
+from pytest import importorskip, raises
+np = importorskip("numpy")
+from batch import *
+from typing import List, Dict
+
+    ######################
+    # BATCH INTCOM TESTS #
+    ######################
+
+def test_batch_day2() -> None:
+    """Day 2's noun/verb patching, a different pair in each lane"""
+    
+    batch: BatchIntcom = BatchIntcom(list_to_dict([1,0,0,0,99,5,6,7]), 3)
+    batch.ram[:, 1] = [5, 5, 6]
+    batch.ram[:, 2] = [6, 7, 7]
+    
+    assert batch.run().tolist() == [STATUS.HALTED] * 3
+    assert batch.ram[:, 0].tolist() == [11, 12, 13]
+    assert batch.steps == 2
+    assert batch.instructionCount == 6
+    
+
+def test_batch_divergence() -> None:
+    """Test 5 from Part 2 of Day 5 on AOC website : lanes jump to different places"""
+    
+    intcode: List[int] = [3,21,1008,21,8,20,1005,20,22,107,8,21,20,1006,20,31,1106,0,36,98,0,0,1002,21,125,20,4,20,
+                          1105,1,46,104,999,1105,1,46,1101,1000,1,20,4,20,1105,1,46,98,99]
+    
+    batch: BatchIntcom = BatchIntcom(list_to_dict(intcode), 3)
+    batch.feed([7, 8, 9])
+    batch.run()
+    
+    assert batch.output_columns().tolist() == [[999], [1000], [1001]]
+    
+
+def test_batch_starvation() -> None:
+    """Lanes starving for input stop until they are fed"""
+    
+    batch: BatchIntcom = BatchIntcom(list_to_dict([3,20,3,21,1,20,21,22,4,22,99]), 2) # Outputs the sum of two inputs
+    batch.feed([1, 2])
+    
+    assert batch.run().tolist() == [STATUS.NEEDS_INPUT] * 2
+    
+    batch.feed([[10], [20]])
+    
+    assert batch.run().tolist() == [STATUS.HALTED] * 2
+    assert batch.output_columns().tolist() == [[11], [22]]
+    
+
+def test_batch_errors() -> None:
+    """Overflows and negative addresses raise errors instead of corrupting lanes"""
+    
+    batch: BatchIntcom = BatchIntcom(list_to_dict([1102,2**62,4,5,99,0]), 1)
+    with raises(OverflowError):
+        batch.run()
+        
+    batch = BatchIntcom(list_to_dict([1,-1,0,0,99]), 1)
+    with raises(ValueError):
+        batch.run()
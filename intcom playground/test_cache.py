@@ -0,0 +1,64 @@
+from cache import *
+from typing import List, Dict
+from pytest import raises
+
+    ################
+    # RESULT CACHE #
+    ################
+
+# Outputs input+1 until input is -1
+ECHO: List[int] = [3,20,1001,20,1,20,4,20,1005,20,0,99]
+
+
+def test_result_cache() -> None:
+    """Runs are cached by program and inputs, the least recently used ones evicted first"""
+
+    cache: ResultCache = ResultCache(2)
+    prog: Dict[int, int] = list_to_dict(ECHO)
+
+    result: CachedRun = cache.run(prog, [5, -1])
+    assert result.outputs == [6, 0] and result.memory.get(20, 0) == 0 and result.memory[0] == 3
+    assert cache.run(prog, [5, -1]) is result
+    assert cache.run(ProgramImage(prog), [5, -1]) is result # Same initial memory
+    assert cache.run({**prog, 30: 0}, [5, -1]) is result
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    assert cache.run(prog, [6, -1]).outputs == [7, 0]
+    cache.run(prog, [5, -1]) # Most recently used
+    cache.run(prog, [7, -1]) # Evicts [6, -1]
+    assert len(cache) == 2 and cache.get(run_key(prog, [6, -1])) is None
+    assert cache.get(run_key(prog, [5, -1])) is result
+
+    with raises(ValueError):
+        ResultCache(0)
+
+
+def test_result_cache_rejections() -> None:
+    """Runs needing inputs their key doesn't hold, or not halting, are not cached"""
+
+    cache: ResultCache = ResultCache()
+    with raises(ValueError):
+        cache.run(list_to_dict(ECHO), [5, 6])
+    with raises(ValueError):
+        cache.run(list_to_dict([1105,1,0]), [], budget=1000) # Loops forever
+    assert len(cache) == 0
+
+
+def test_result_cache_disk(tmp_path) -> None:
+    """Results kept on disk are shared by caches using the same directory"""
+
+    prog: Dict[int, int] = list_to_dict(ECHO)
+    first: ResultCache = ResultCache(directory=str(tmp_path))
+    result: CachedRun = first.run(prog, [41, 2**70, -1])
+    assert result.outputs == [42, 2**70 + 1, 0]
+    first.run(prog, [41, -1])
+
+    second: ResultCache = ResultCache(directory=str(tmp_path))
+    loaded: CachedRun = second.run(prog, [41, -1])
+    assert (second.diskHits, second.misses) == (1, 0)
+    assert loaded.outputs == [42, 0] and loaded.memory == first.run(prog, [41, -1]).memory
+    assert second.run(prog, [41, 2**70, -1]).outputs == result.outputs # Too big for the disk, run again
+    assert second.misses == 1
+
+    (tmp_path / (run_key(prog, [1, -1]) + ".result")).write_bytes(b"not a result")
+    assert second.run(prog, [1, -1]).outputs == [2, 0]
@@ -2,8 +2,11 @@ from intcom import *
 from typing import List, Dict
 from sys import stdin, stdout
 from io import StringIO
-from multiprocessing import Pipe
+from multiprocessing import Pipe, Pool
 from multiprocessing.connection import Connection
+from pytest import raises
+from os.path import abspath, dirname, join
+import json
 
     ################
     # CUSTOM TESTS #
@@ -277,6 +280,179 @@ def test_rel_value() -> None:
     
 # No HALT test, as the first test already is testing HALT Opcode
 
+
+def test_decode_cache() -> None:
+    """Simple test to see if instructions are decoded only once"""
+    
+    ic: Intcom = Intcom(list_to_dict([1101, 1, 3, 5, 99, 0]), "The World",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[])
+    
+    ic.run()
+    
+    assert sorted(ic.decodeCache.keys()) == [0, 4]
+    assert ic.decodeCache[0].opcode == OPCODE.ADD
+    assert ic.decodeCache[0].operands == (1, 3, 5)
+    assert ic.decodeCache[0].plan == (ARG_PLAN.IMM_VALUE, ARG_PLAN.IMM_VALUE, ARG_PLAN.POS_ADDRESS)
+    assert ic.cachedCells[2] == {0}
+    
+    
+def test_decode_cache_invalidation() -> None:
+    """Self-modifying test : the loop rewrites the argument of its own output instruction"""
+    
+    out: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([104, 1, 1001, 1, 1, 1, 1007, 1, 3, 14, 1005, 14, 0, 99, 0]), "Za Warudo",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=out)
+    
+    ic.run()
+    
+    assert out[::-1] == [1, 2]
+    assert 0 not in ic.decodeCache # Last write dropped it, and it never ran again
+    
+    
+def test_decode_cache_opcode_invalidation() -> None:
+    """Self-modifying test : an executed instruction gets replaced by a shorter one"""
+    
+    out: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([1101, 0, 0, 20, 1101, 0, 104, 0, 1101, 0, 7, 1, 1101, 0, 99, 2, 1105, 1, 0]),
+                        "Star Platinum",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=out)
+    
+    ic.run()
+    
+    assert out == [7]
+    assert ic.decodeCache[0].opcode == OPCODE.OUT
+    assert 3 not in ic.cachedCells
+
+    
+def test_dispatch_table() -> None:
+    """Simple test to see if every valid raw opcode has its handler"""
+    
+    assert len(DISPATCH) == 4*18 + 2*9 + 3 # ADD/MUL/LT/EQ + JIT/JIF + URB
+    assert 22201 in DISPATCH
+    assert 11101 not in DISPATCH # Address arguments can't be in immediate mode
+    assert 4 not in DISPATCH # I/O goes through a classic cycle
+    
+    
+def test_engine_cycle() -> None:
+    """Simple test to see if the classic cycle engine still works on its own"""
+    
+    out: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]), "Made in Heaven",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=out, engine=ENGINE.CYCLE)
+    
+    ic.run()
+    
+    assert out[::-1] == [109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]
+    
+    
+def test_engine_negative_address() -> None:
+    """Simple test to see if both engines refuse negative addresses"""
+    
+    for engine in ENGINE:
+        ic: Intcom = Intcom(list_to_dict([1, -1, 0, 0, 99]), "Killer Queen",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[], outputDest=[], engine=engine)
+        with raises(ValueError):
+            ic.run()
+        
+        ic2: Intcom = Intcom(list_to_dict([109, -5, 1201, 0, 0, 0, 99]), "Bites the Dust",
+                             inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                             inputSrc=[], outputDest=[], engine=engine)
+        with raises(ValueError):
+            ic2.run()
+        
+        ic3: Intcom = Intcom(list_to_dict([2006, 5, -3, 104, 7, 99]), "Another One", # Jump not taken, to a negative address
+                             inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                             inputSrc=[], outputDest=[], engine=engine)
+        with raises(ValueError):
+            ic3.run()
+
+
+def test_day_copies() -> None:
+    """Simple test to see if every day's engine copy is the playground one, fixes included"""
+
+    playground: str = dirname(abspath(__file__))
+    with open(join(playground, "intcom.py"), 'rb') as reference:
+        source: bytes = reference.read()
+
+    for day in ["day 7", "day 11", "day 13", "day 15"]:
+        with open(join(playground, "..", day, "intcom.py"), 'rb') as copied:
+            assert copied.read() == source, day
+
+    with open(join(playground, "network.py"), 'rb') as reference, \
+         open(join(playground, "..", "day 7", "network.py"), 'rb') as copied:
+        assert copied.read() == reference.read()
+
+
+def test_engine_block() -> None:
+    """Simple test to see if straight-line runs get compiled into blocks ending with their jump"""
+    
+    out: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]), "Crazy Diamond",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=out, engine=ENGINE.BLOCK)
+    
+    ic.run()
+    
+    assert out[::-1] == [109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]
+    assert ic.blockCache[0].end == 2 # Stops right before the output
+    assert ic.blockCache[2].function is None # Output goes through a classic cycle
+    assert ic.blockCache[4].end == 15 # Ends with the jump
+    assert ic.blockCache[15].function is None # Halt goes through a classic cycle
+    
+
+def test_engine_block_invalidation() -> None:
+    """Self-modifying tests, running compiled blocks"""
+    
+    out: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([104, 1, 1001, 1, 1, 1, 1007, 1, 3, 14, 1005, 14, 0, 99, 0]), "Za Warudo Block",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=out, engine=ENGINE.BLOCK)
+    
+    ic.run()
+    
+    assert out[::-1] == [1, 2]
+    
+    out2: List[int] = []
+    
+    ic2: Intcom = Intcom(list_to_dict([1101, 0, 0, 20, 1101, 0, 104, 0, 1101, 0, 7, 1, 1101, 0, 99, 2, 1105, 1, 0]),
+                         "Star Platinum Block",
+                         inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                         inputSrc=[], outputDest=out2, engine=ENGINE.BLOCK)
+    
+    ic2.run()
+    
+    assert out2 == [7]
+    assert 0 in ic2.volatileCells
+    
+    
+def test_engine_block_volatile_cells() -> None:
+    """A loop computing the address its own instruction reads, which must not be recompiled every time"""
+    
+    out: List[int] = []
+    
+    # Outputs cells 30 to 32 : the loop writes the address to read into its own instruction's argument
+    ic: Intcom = Intcom(list_to_dict([1001, 26, 30, 9, 1001, 26, 1, 26, 1001, 0, 0, 27, 4, 27, 1007, 26, 3, 28,
+                                      1005, 28, 0, 99, 0, 0, 0, 0, 0, 0, 0, 0, 42, 43, 44]),
+                        "Gold Experience",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=out, engine=ENGINE.BLOCK)
+    
+    ic.run()
+    
+    assert out[::-1] == [42, 43, 44]
+    assert ic.volatileCells == {9}
+    assert ic.blockCache[0].end == 8 # Addition's argument is volatile, no block can cover it anymore
+
     #############
     # AOC TESTS #
     #############
@@ -633,4 +809,524 @@ def test_aoc_day9_part1_test3() -> None:
     
     ic.run()
     
-    assert outList.pop() == 1125899906842624
\ No newline at end of file
+    assert outList.pop() == 1125899906842624
+    
+
+def test_paged_memory() -> None:
+    """Unmapped pages read as 0 without being allocated, pages are allocated on first write"""
+    
+    ram: PagedMemory = PagedMemory(list_to_dict([1, 2, 0, 3]))
+    
+    assert ram == {0: 1, 1: 2, 3: 3}
+    assert ram[10 * PAGE_SIZE] == 0
+    assert ram.usage() == {'residentPages': 1, 'sharedPages': 0, 'pageSize': PAGE_SIZE, 'residentBytes': PAGE_SIZE * 8, 'overflowCells': 0}
+    
+    ram[10 * PAGE_SIZE] = 0
+    assert ram.usage()['residentPages'] == 1
+    ram[10 * PAGE_SIZE + 5] = 42
+    assert ram.usage()['residentPages'] == 2
+    assert list(ram.items()) == [(0, 1), (1, 2), (3, 3), (10 * PAGE_SIZE + 5, 42)]
+    
+    with raises(ValueError):
+        ram[-1]
+    with raises(ValueError):
+        ram[-1] = 1
+    
+
+def test_paged_memory_overflow() -> None:
+    """Values that don't fit in an int64 go to their page's overflow map, until they are overwritten"""
+    
+    outList: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([1102,34915192,34915192,20,1002,20,1000000000000,20,4,20,1101,0,0,20,99]),
+                        "Overflow Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=outList)
+    ic.run()
+    
+    assert outList == [34915192 * 34915192 * 1000000000000]
+    assert ic.ram[20] == 0
+    assert ic.memory_usage()['overflowCells'] == 0
+    
+    ic.ram[20] = 2**64
+    assert ic.ram[20] == 2**64
+    assert ic.memory_usage()['overflowCells'] == 1
+    
+
+def test_program_image_copy_on_write() -> None:
+    """Intcoms built from the same image share its pages until they write to them"""
+    
+    image: ProgramImage = ProgramImage(list_to_dict([1101, 1, 2, 5, 99, 0, 2**70]))
+    
+    ic1: Intcom = Intcom(image, "COW Intcom 1", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST, inputSrc=[], outputDest=[])
+    ic2: Intcom = Intcom(image, "COW Intcom 2", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST, inputSrc=[], outputDest=[])
+    
+    assert ic1.memory_usage()['residentPages'] == 0
+    assert ic1.memory_usage()['sharedPages'] == 1
+    
+    ic1.run()
+    
+    assert ic1.ram[5] == 3
+    assert ic1.ram[6] == 2**70
+    assert ic1.memory_usage()['residentPages'] == 1
+    assert ic1.memory_usage()['overflowCells'] == 1
+    assert ic2.ram[5] == 0
+    assert image[5] == 0
+    assert ic2.memory_usage()['residentPages'] == 0
+    
+
+def _run_image(image: ProgramImage) -> List[int]:
+    """Runs Day 9's quine from an image, in another process"""
+    
+    outList: List[int] = []
+    ic: Intcom = Intcom(image, "Worker Intcom", inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST, inputSrc=[], outputDest=outList)
+    ic.run()
+    return outList
+    
+
+def test_program_image_shared() -> None:
+    """Shared images are passed to other processes without being copied"""
+    
+    quine: List[int] = [109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]
+    
+    with ProgramImage(list_to_dict(quine), shared=True) as image:
+        with Pool(2) as pool:
+            assert pool.map(_run_image, [image, image]) == [quine[::-1], quine[::-1]]
+    
+
+def test_run_until() -> None:
+    """Intcom stops when it needs an input, produces an output or halts, and resumes where it stopped"""
+    
+    inList: List[int] = []
+    outList: List[int] = []
+    
+    ic: Intcom = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), # Outputs input+1 until input is -1
+                        "Non-blocking Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=inList, outputDest=outList)
+    
+    assert ic.run_until(STATUS.HAS_OUTPUT) == STATUS.NEEDS_INPUT
+    assert ic.instPtr == 0
+    assert ic.instructionCount == 0
+    
+    inList.insert(0, 41)
+    assert ic.run_until(STATUS.HAS_OUTPUT) == STATUS.HAS_OUTPUT
+    assert outList.pop() == 42
+    assert ic.run_until(STATUS.HAS_OUTPUT) == STATUS.NEEDS_INPUT
+    assert ic.instructionCount == 4
+    
+    inList[:0] = [-1, 1]
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.HALTED
+    assert outList == [0, 2]
+    assert ic.run_until() == STATUS.HALTED
+    
+
+def test_step() -> None:
+    """Every engine executes exactly the given number of instructions"""
+    
+    for engine in ENGINE:
+        outList: List[int] = []
+        ic: Intcom = Intcom(list_to_dict([109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]),
+                            "Stepping Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[], outputDest=outList, engine=engine)
+        
+        assert ic.step() == STATUS.BUDGET_EXHAUSTED
+        assert ic.relBase == 1
+        assert ic.step(11) == STATUS.BUDGET_EXHAUSTED
+        assert ic.instructionCount == 12
+        assert outList == [204, 1, 109]
+        
+        while ic.step(7) == STATUS.BUDGET_EXHAUSTED:
+            pass
+        assert ic.halt
+        assert ic.instructionCount == 16 * 5 + 1
+        assert outList[::-1] == [109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]
+    
+    
+def test_snapshot_restore() -> None:
+    """Restoring a snapshot brings back RAM, pointers, run state and list channels, as many times as needed"""
+    
+    for engine in ENGINE:
+        inList: List[int] = [41]
+        outList: List[int] = []
+        ic: Intcom = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), # Outputs input+1 until input is -1
+                            "Snapshot Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=inList, outputDest=outList, engine=engine)
+        
+        assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+        snapshot: IntcomSnapshot = ic.snapshot()
+        
+        for value, status in ((1, STATUS.NEEDS_INPUT), (-1, STATUS.HALTED)):
+            inList.insert(0, value)
+            assert ic.run_until(STATUS.NEEDS_INPUT) == status
+            assert ic.ram[20] == value + 1
+            
+            ic.restore(snapshot)
+            assert ic.status == STATUS.NEEDS_INPUT and not ic.halt
+            assert ic.ram[20] == 42
+            assert ic.instPtr == 0
+            assert ic.instructionCount == 4
+            assert inList == [] and outList == [42]
+        
+        
+def test_fork() -> None:
+    """Forks run on their own, sharing the pages neither of them wrote to"""
+    
+    for engine in ENGINE:
+        ic: Intcom = Intcom(ProgramImage(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99] + [0] * 300)),
+                            "Forked Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[41], outputDest=[], engine=engine)
+        ic.run_until(STATUS.NEEDS_INPUT)
+        ic.ram[300] = 7
+        
+        clone: Intcom = ic.fork("Clone")
+        assert clone.name == "Clone" and ic.name == "Forked Intcom"
+        assert clone.memory_usage()['residentPages'] == ic.memory_usage()['residentPages'] == 0
+        
+        clone.inputSrc.insert(0, 1)
+        assert clone.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+        assert clone.outputDest == [2, 42] and ic.outputDest == [42]
+        assert clone.ram[20] == 2 and ic.ram[20] == 42
+        assert clone.ram[300] == ic.ram[300] == 7
+        assert clone.memory_usage()['residentPages'] == 1
+        assert ic.memory_usage()['residentPages'] == 0
+        
+        ic.inputSrc.insert(0, -1)
+        assert ic.run_until() == STATUS.HALTED
+        assert clone.status == STATUS.NEEDS_INPUT and clone.ram[20] == 2
+        
+        
+def test_channel() -> None:
+    """Channels are fed and read oldest first, and run, snapshot and fork as lists do"""
+    
+    channel: IntcomChannel = IntcomChannel([2, 1])
+    channel.feed(3)
+    channel.feed_many([4, 5, 6, 7])
+    assert list(channel) == [7, 6, 5, 4, 3, 2, 1] # Newest first, as a list channel
+    assert channel.read_records(3) == [(1, 2, 3), (4, 5, 6)]
+    assert channel.drain() == [7] and len(channel) == 0
+    with raises(ValueError):
+        channel.read_records(0)
+        
+    for engine in ENGINE:
+        ic: Intcom = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), # Outputs input+1 until input is -1
+                            "Channeled Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=IntcomChannel([41]), outputDest=IntcomChannel(), engine=engine)
+        assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+        snapshot: IntcomSnapshot = ic.snapshot()
+        
+        clone: Intcom = ic.fork()
+        assert isinstance(clone.inputSrc, IntcomChannel) and clone.outputDest is not ic.outputDest
+        clone.inputSrc.feed_many([1, 2, -1])
+        assert clone.run_until() == STATUS.HALTED
+        assert clone.outputDest.drain() == [42, 2, 3, 0]
+        
+        ic.inputSrc.feed(-1)
+        ic.run()
+        ic.restore(snapshot)
+        assert isinstance(ic.outputDest, IntcomChannel) and ic.outputDest.drain() == [42]
+        
+        
+def test_profiler() -> None:
+    """Profiles count executions by address, opcode and mode, whatever the engine, and only while profiling is on"""
+    
+    prog: Dict[int, int] = list_to_dict([109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]) # Quine
+    
+    for engine in ENGINE:
+        ic: Intcom = Intcom(prog, "Profiled Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[], outputDest=[], engine=engine)
+        
+        ic.step(5)
+        profiler: IntcomProfiler = ic.start_profiling()
+        ic.run()
+        assert ic.stop_profiling() is profiler and ic.profiler is None
+        
+        assert profiler.instructions() == ic.instructionCount - 5 == 76
+        assert profiler.by_address() == {0: 15, 2: 15, 4: 15, 8: 15, 12: 15, 15: 1}
+        assert profiler.by_opcode() == {OPCODE.URB: 15, OPCODE.OUT: 15, OPCODE.ADD: 15, OPCODE.EQ: 15, OPCODE.JIF: 15, OPCODE.HLT: 1}
+        assert profiler.by_mode() == {ARG_MODE.IMM: 60, ARG_MODE.REL: 15, ARG_MODE.POS: 75}
+        assert profiler.by_form()["EQ POS,IMM,POS"] == 15
+        
+        report: Dict[str, object] = json.loads(profiler.to_json())
+        assert report['instructions'] == 76
+        assert report['addresses']["2"] == 15
+        assert report['inputSeconds'] == 0
+        
+        assert profiler.hot_listing(1).splitlines()[1].split() == ["0", "15", "19.74%", "URB", "1"]
+        
+        
+def test_profiler_fork() -> None:
+    """Forks don't profile, so their counts stay out of the intcom's profile"""
+    
+    for engine in ENGINE:
+        ic: Intcom = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), "Profiled Intcom",
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[41], outputDest=[], engine=engine)
+        profiler: IntcomProfiler = ic.start_profiling()
+        assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+        assert profiler.instructions() == 4
+        
+        clone: Intcom = ic.fork("Clone")
+        assert clone.profiler is None and ic.profiler is profiler
+        clone.inputSrc.insert(0, -1)
+        assert clone.run_until() == STATUS.HALTED
+        
+        assert profiler.instructions() == 4
+        ic.inputSrc.insert(0, -1)
+        ic.run()
+        assert profiler.instructions() == ic.instructionCount == 9
+        
+        
+def test_disassemble_instruction() -> None:
+    """Arguments are disassembled by mode"""
+    
+    ic: Intcom = Intcom(list_to_dict([21101,3,-4,5,99,203,0]), "Disassembled Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[])
+    
+    assert disassemble_instruction(ic._predecode(0)) == "ADD 3, -4, [rb+5]"
+    assert disassemble_instruction(ic._predecode(4)) == "HLT"
+    assert disassemble_instruction(ic._predecode(5)) == "IN [rb+0]"
+        
+        
+def test_io_session(tmp_path) -> None:
+    """Recorded sessions replay to identical outputs, on every engine and from files"""
+    
+    ic: Intcom = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), # Outputs input+1 until input is -1
+                        "Recorded Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[41], outputDest=[])
+    ic.run_until(STATUS.NEEDS_INPUT)
+    
+    session: IOSession = ic.start_recording(str(tmp_path / "echo.session"))
+    ic.inputSrc[:0] = [-1, 9, 3]
+    ic.run()
+    assert ic.stop_recording() is session and ic.session is None
+    
+    assert session.events == [(IO_EVENT.IN, 3), (IO_EVENT.OUT, 4), (IO_EVENT.IN, 9), (IO_EVENT.OUT, 10),
+                              (IO_EVENT.IN, -1), (IO_EVENT.OUT, 0)]
+    assert session.instPtr == 0 and session.memory[20] == 42
+    
+    loaded: IOSession = IOSession.load(str(tmp_path / "echo.session"))
+    assert loaded.events == session.events and loaded.memory == session.memory
+    
+    for engine in ENGINE:
+        replayed: Intcom = loaded.replay(engine)
+        assert replayed.halt
+        assert loaded.matches(replayed)
+        
+    replayed.outputDest[0] = 1
+    assert not loaded.matches(replayed)
+    
+    (tmp_path / "not.session").write_bytes(b"not a session")
+    with raises(ValueError):
+        IOSession.load(str(tmp_path / "not.session"))
+        
+        
+def test_io_session_big_ints(tmp_path) -> None:
+    """Values that don't fit in an int64 are recorded, saved and loaded back whole"""
+    
+    big: int = 1 << 70
+    ic: Intcom = Intcom(list_to_dict([3,20,1002,20,-1,20,4,20,1105,1,0,99] + [0] * 8 + [big]), # Outputs -input forever
+                        "Big Recorded Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[])
+    session: IOSession = ic.start_recording(str(tmp_path / "big.session"))
+    ic.inputSrc[:0] = [-(1 << 63), big * big, 5]
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    ic.stop_recording()
+    
+    assert session.outputs() == [-5, -big * big, 1 << 63]
+    assert session.memory[20] == big
+    
+    for path in ["big.session", "saved.session"]:
+        if path == "saved.session":
+            session.save(str(tmp_path / path))
+        loaded: IOSession = IOSession.load(str(tmp_path / path))
+        assert loaded.events == session.events and loaded.memory == session.memory
+        assert loaded.matches(loaded.replay())
+        
+        
+def test_io_session_piped(tmp_path) -> None:
+    """Piped intcoms record their sessions to a file, from their process"""
+    
+    intcomIn, hostOut = Pipe(False)
+    hostIn, intcomOut = Pipe(False)
+    process: Process = piped_intcom_as_a_process(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]),
+                                                 intcomIn, intcomOut, str(tmp_path / "piped.session"))
+    process.start()
+    for value in (5, 6, -1):
+        hostOut.send(value)
+        assert hostIn.recv() == value + 1
+    process.join()
+    
+    session: IOSession = IOSession.load(str(tmp_path / "piped.session"))
+    assert session.inputs() == [5, 6, -1] and session.outputs() == [6, 7, 0]
+    assert session.matches(session.replay())
+
+
+def test_framed_pipe() -> None:
+    """Framed pipes send their buffer when full or flushed, big ints included"""
+    
+    receiving, sending = Pipe(False)
+    framedOut: FramedPipe = FramedPipe(sending, 2)
+    framedIn: FramedPipe = FramedPipe(receiving)
+    
+    framedOut.send(1)
+    assert not framedIn.poll()
+    framedOut.send(2) # Full
+    assert framedIn.poll() and framedIn.recv() == 1
+    framedOut.send(2**70)
+    framedOut.send_many([3])
+    assert framedIn.recv_turn() == [2, 2**70, 3]
+    assert framedOut.framesSent == framedIn.framesReceived == 2
+    
+    framedOut.flush()
+    framedOut.flush(FRAME_FLAG.CLOSED) # Sent empty
+    assert framedIn.recv_turn() == [] and framedIn.closed()
+    
+    with raises(ValueError):
+        FramedPipe(sending, 0)
+        
+        
+def test_framed_intcom(tmp_path) -> None:
+    """Framed intcoms send their outputs when they want input or halt, in a frame per turn"""
+    
+    intcomIn, hostOut = Pipe(False)
+    hostIn, intcomOut = Pipe(False)
+    process: Process = piped_intcom_as_a_process(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]),
+                                                 intcomIn, intcomOut, str(tmp_path / "framed.session"), framed=True)
+    framedOut: FramedPipe = FramedPipe(hostOut)
+    framedIn: FramedPipe = FramedPipe(hostIn)
+    process.start()
+    framedOut.send_many([5, 6])
+    assert framedIn.recv_turn() == [] # Answer before the first input
+    assert framedIn.recv_turn() == [6, 7]
+    framedOut.send_many([-1])
+    assert framedIn.recv_turn() == [0] and framedIn.closed()
+    process.join()
+    assert framedIn.framesReceived == 3
+    assert IOSession.load(str(tmp_path / "framed.session")).outputs() == [6, 7, 0]
+    
+    intcomIn, hostOut = Pipe(False)
+    hostIn, intcomOut = Pipe(False)
+    ic: Intcom = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), "Framed Intcom",
+                        inputMethod=IO_METHOD.FRAMED, outputMethod=IO_METHOD.FRAMED,
+                        inputSrc=FramedPipe(intcomIn), outputDest=FramedPipe(intcomOut))
+    framedOut, framedIn = FramedPipe(hostOut), FramedPipe(hostIn)
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    assert framedIn.recv_turn() == [] and ic.outputDest.framesSent == 1 # Answered once
+    framedOut.send_many([1, 2])
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    assert framedIn.recv_turn() == [2, 3]
+
+
+def test_shared_ring() -> None:
+    """Rings carry int64s in a slot, big ints in several, and fail reads once finished and empty"""
+    
+    with SharedRing(4) as ring:
+        assert not ring.poll()
+        ring.send(2**70) # Mark, number of limbs, then 2 limbs
+        assert ring.poll() and ring.recv() == 2**70
+        ring.send(RING_BIG_MARK) # Fills the ring, as 2**63 takes 2 limbs
+        assert ring.recv() == RING_BIG_MARK
+        ring.send(-1)
+        assert ring.recv() == -1
+        with raises(ValueError):
+            ring.send(2**200)
+            
+        ring.finish()
+        assert ring.poll() and ring.closed()
+        with raises(EOFError):
+            ring.recv()
+            
+    with raises(ValueError):
+        SharedRing(0)
+        
+        
+def test_ring_intcom() -> None:
+    """Intcoms run in another process through shared rings, finishing their output ring when they halt"""
+    
+    with SharedRing(2) as intcomIn, SharedRing(2) as intcomOut:
+        process: Process = ring_intcom_as_a_process(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]),
+                                                    intcomIn, intcomOut)
+        process.start()
+        for value in range(5):
+            intcomIn.send(value)
+            assert intcomOut.recv() == value + 1
+        intcomIn.send(-1)
+        assert intcomOut.recv() == 0
+        process.join()
+        assert intcomOut.poll(1.0) and intcomOut.closed()
+    
+
+def test_limits() -> None:
+    """Runaway programs are stopped by their instructions limit or their watchdog, in every engine"""
+    
+    for engine in ENGINE:
+        ic: Intcom = Intcom(list_to_dict([1101,0,0,7, 1105,1,0]), "Runaway Intcom", # Loops forever
+                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                            inputSrc=[], outputDest=[], engine=engine, maxInstructions=1000)
+        assert ic.run() == STATUS.LIMIT_REACHED
+        assert ic.instructionCount == 1000
+        assert ic.run_until(budget=10) == STATUS.LIMIT_REACHED
+        assert ic.instructionCount == 1000
+        
+        ic = Intcom(list_to_dict([1101,0,0,7, 1105,1,0]), "Runaway Intcom",
+                    inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                    inputSrc=[], outputDest=[], engine=engine, timeLimit=0.05)
+        assert ic.run() == STATUS.TIMED_OUT
+        assert ic.run_until(budget=10) == STATUS.BUDGET_EXHAUSTED # Every run gets its own time limit
+    
+    with raises(ValueError):
+        Intcom(list_to_dict([99]), inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+               inputSrc=[], outputDest=[], maxInstructions=0)
+        
+    intcomIn, intcomInFeeder = Pipe()
+    ic = Intcom(list_to_dict([3,9, 4,9, 99]), "Waiting Intcom",
+                inputMethod=IO_METHOD.PIPE, outputMethod=IO_METHOD.LIST,
+                inputSrc=intcomIn, outputDest=[], timeLimit=0.05)
+    assert ic.run() == STATUS.TIMED_OUT # Input was never sent
+    assert ic.instPtr == 0 and ic.instructionCount == 0
+    intcomInFeeder.send(7)
+    assert ic.run() == STATUS.HALTED
+    assert ic.outputDest == [7]
+    
+    with SharedRing(2) as intcomIn, SharedRing(2) as intcomOut: # Readers of a stopped process don't wait for it
+        process: Process = ring_intcom_as_a_process(list_to_dict([104,1, 1105,1,0]), intcomIn, intcomOut, maxInstructions=100)
+        process.start()
+        assert [intcomOut.recv() for _ in range(50)] == [1] * 50
+        with raises(EOFError):
+            intcomOut.recv()
+        process.join()
+    
+    
+def test_loop_detection() -> None:
+    """Programs are stopped once a state repeats at a backward jump, unless an input was read since"""
+    
+    # Counts cell 20 up to 3, then loops forever without writing anything
+    ic: Intcom = Intcom(list_to_dict([1001,20,1,20, 1007,20,3,21, 1005,21,0, 1105,1,11]), "Looping Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[], detectLoops=True)
+    assert ic.run() == STATUS.LOOPING
+    assert ic.instPtr == 11 and ic.ram.load(20) == 3
+    
+    # Outputs input+1 until input is -1 : the same state comes back, but after an input every time
+    inList: List[int] = [-1] + [5] * 50
+    ic = Intcom(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]), "Echoing Intcom",
+                inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                inputSrc=inList, outputDest=[], detectLoops=True)
+    assert ic.run() == STATUS.HALTED
+    assert ic.outputDest == [0] + [6] * 50
+    
+    # Counts forever : no state ever repeats
+    ic = Intcom(list_to_dict([1001,20,1,20, 1105,1,0]), "Counting Intcom",
+                inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                inputSrc=[], outputDest=[], detectLoops=True)
+    assert ic.run_until(budget=10000) == STATUS.BUDGET_EXHAUSTED
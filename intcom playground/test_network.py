@@ -0,0 +1,62 @@
+from network import *
+from typing import List, Dict
+from pytest import raises
+
+    ########################
+    # INTCOM NETWORK TESTS #
+    ########################
+
+def _amplifiers_topology(intcode: List[int], settings: List[int]) -> Topology:
+    """Day 7 - Part 2's amplifiers feedback loop : A -> B -> C -> D -> E -> A"""
+    
+    names: str = "ABCDE"
+    nodes: Dict[str, Dict[int, int]] = {name: list_to_dict(intcode) for name in names}
+    channels: List[Tuple[str, str]] = [(names[i], names[(i + 1) % 5]) for i in range(5)]
+    inputs: Dict[str, List[int]] = {name: [setting] for name, setting in zip(names, settings)}
+    inputs['A'].append(0)
+    
+    return nodes, channels, inputs
+
+
+def test_aoc_day7_part2_test1() -> None:
+    """Test 1 from Part 2 of Day 7 on AOC website, as a network"""
+    
+    intcode: List[int] = [3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5]
+    
+    assert run_topology(_amplifiers_topology(intcode, [9,8,7,6,5]))['E'][-1] == 139629729
+    assert run_topology(_amplifiers_topology(intcode, [9,8,7,6,5]), budget=1)['E'][-1] == 139629729
+    
+
+def test_network_deadlock() -> None:
+    """Two nodes waiting for each other's output"""
+    
+    echo: Dict[int, int] = list_to_dict([3,7,4,7,1105,1,0,0]) # Outputs every input, forever
+    
+    with raises(RuntimeError):
+        IntcomNetwork({'ping': echo, 'pong': echo}, [('ping', 'pong'), ('pong', 'ping')]).run()
+        
+
+def test_network_fairness() -> None:
+    """A node computing for long doesn't hold the others back, once it exhausted its budget"""
+    
+    nodes: Dict[str, Dict[int, int]] = {
+        'spinner': list_to_dict([1001,30,1,30,1007,30,500,31,1005,31,0,104,1,99]), # Counts to 500, then outputs 1
+        'printer': list_to_dict([104,42,99]),
+        'sink': list_to_dict([3,20,3,21,4,20,4,21,99]) # Outputs its two inputs
+    }
+    channels: List[Tuple[str, str]] = [('spinner', 'sink'), ('printer', 'sink')]
+    
+    assert IntcomNetwork(nodes, channels, budget=100).run()['sink'] == [42, 1]
+    assert IntcomNetwork(nodes, channels, budget=10**6).run()['sink'] == [1, 42]
+    
+
+def test_run_networks() -> None:
+    """Independent networks, sharded across a pool of processes"""
+    
+    intcode: List[int] = [3,26,1001,26,-4,26,3,27,1002,27,2,27,1,27,26,27,4,27,1001,28,-1,28,1005,28,6,99,0,0,5]
+    topologies: List[Topology] = [_amplifiers_topology(intcode, [9,8,7,6,5]), _amplifiers_topology(intcode, [5,6,7,8,9])]
+    
+    outputs: List[Dict[str, List[int]]] = run_networks(topologies, 2)
+    
+    assert [networkOutputs['E'][-1] for networkOutputs in outputs] == [139629729, 61696857]
+    assert outputs == run_networks(topologies)
@@ -0,0 +1,109 @@
+from optimizer import *
+from test_analysis import CALLING
+from typing import List, Dict
+from pytest import raises
+
+    ######################
+    # PEEPHOLE OPTIMIZER #
+    ######################
+
+# Counts down from 3 to 1 with a compare-and-branch loop
+COUNTDOWN: List[int] = [1101,3,0,18, 4,18, 1001,18,-1,18, 107,0,18,19, 1005,19,4, 99, 0,0]
+
+
+def _run(prog: List[int], intcomClass: type=Intcom) -> Intcom:
+    """Runs a program until it halts, with list channels"""
+
+    ic: Intcom = intcomClass(list_to_dict(prog), "Optimized Intcom",
+                             inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                             inputSrc=[], outputDest=[])
+    assert ic.run_until(STATUS.HALTED, 100) == STATUS.HALTED
+    return ic
+
+
+def test_find_fusions() -> None:
+    """Pairs are only fused when their rewritten cells are not read, and their cells are not written"""
+
+    assert find_fusions(list_to_dict(COUNTDOWN)) == {0: FUSED_OPCODE.STORE, 10: FUSED_OPCODE.BRANCH}
+    assert find_fusions(list_to_dict(CALLING)) == {2: FUSED_OPCODE.CALL, 19: FUSED_OPCODE.RETURN}
+
+    reading: List[int] = COUNTDOWN.copy()
+    reading[5] = 10 # Outputs the LT's opcode
+    assert find_fusions(list_to_dict(reading)) == {0: FUSED_OPCODE.STORE}
+
+    writing: List[int] = COUNTDOWN.copy()
+    writing[9] = 15 # Writes over the JIT's condition
+    assert find_fusions(list_to_dict(writing)) == {0: FUSED_OPCODE.STORE}
+
+    quine: List[int] = [109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99] # Reads itself through its relative base
+    assert find_fusions(list_to_dict(quine)) == {}
+
+
+def test_optimize() -> None:
+    """Optimized programs give the same outputs in fewer instructions, and still run on plain Intcoms"""
+
+    optimized: Dict[int, int] = optimize(list_to_dict(COUNTDOWN))
+    assert [optimized[addr] for addr in range(4)] == [101101, 3, 0, 18]
+    assert optimized[10] == 300107
+
+    for prog, counts in ((COUNTDOWN, (14, 11)), (CALLING, (9, 7))):
+        optimized = optimize(list_to_dict(prog))
+        plain: Intcom = _run(prog)
+        fused: Intcom = _run([optimized[addr] for addr in range(len(prog))], OptimizedIntcom)
+        assert _run([optimized[addr] for addr in range(len(prog))]).outputDest == fused.outputDest == plain.outputDest
+        assert (plain.instructionCount, fused.instructionCount) == counts
+
+
+def test_fused_instruction_rewritten() -> None:
+    """A fused pair rewritten at runtime gets decoded again"""
+
+    # LT, then JIT turned into a JIF by the ADD it jumps to : loops once
+    prog: List[int] = [1107,1,2,30, 1005,30,11, 104,7, 99, 0, 1101,0,6,4, 1105,1,0]
+    assert find_fusions(list_to_dict(prog)) == {11: FUSED_OPCODE.CALL}
+
+    optimized: Dict[int, int] = optimize(list_to_dict(prog), {0: FUSED_OPCODE.BRANCH})
+    ic: Intcom = _run([optimized[addr] for addr in range(len(prog))], OptimizedIntcom)
+    assert ic.outputDest == [7]
+    assert ic.instructionCount == 6
+
+    with raises(ValueError):
+        ic.start_tracing()
+
+
+def test_profiled_fusions() -> None:
+    """Fused instructions are profiled under their own pseudo-opcodes, apart from the real ones"""
+
+    ic: Intcom = OptimizedIntcom(optimize(list_to_dict(COUNTDOWN)), "Profiled Intcom",
+                                 inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                 inputSrc=[], outputDest=[])
+    profiler: IntcomProfiler = ic.start_profiling()
+    ic.run()
+    assert ic.outputDest == [1, 2, 3] # Newest first
+    assert profiler.by_opcode() == {FUSED_OPCODE.STORE: 1, OPCODE.OUT: 3, OPCODE.ADD: 3, FUSED_OPCODE.BRANCH: 3, OPCODE.HLT: 1}
+    assert profiler.by_form()["BRANCH"] == 3
+    assert profiler.inputSeconds == 0
+
+
+def test_optimized_limits() -> None:
+    """Optimized Intcoms take Intcom's limits, and detect loops on the plain instructions"""
+
+    ic: Intcom = OptimizedIntcom(optimize(list_to_dict([1101,0,0,7, 1105,1,0])), "Runaway Intcom",
+                                 inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                 inputSrc=[], outputDest=[], maxInstructions=1000)
+    assert ic.run() == STATUS.LIMIT_REACHED
+    assert ic.instructionCount == 1000
+
+    # Counts cell 20 up to 3 with a fused compare-and-branch, then loops forever without writing anything
+    prog: Dict[int, int] = list_to_dict([1001,20,1,20, 1007,20,3,21, 1005,21,0, 1105,1,11])
+    assert find_fusions(prog) == {4: FUSED_OPCODE.BRANCH}
+    ic = OptimizedIntcom(optimize(prog), "Looping Intcom",
+                         inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                         inputSrc=[], outputDest=[])
+    ic.step(2) # Fused instruction gets cached
+    ic.detectLoops = True
+    assert ic.run() == STATUS.LOOPING
+    assert ic.instPtr == 11 and ic.ram.load(20) == 3
+
+    with raises(ValueError):
+        OptimizedIntcom(prog, inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[], engine=ENGINE.BLOCK)
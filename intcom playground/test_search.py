@@ -0,0 +1,50 @@
+from search import *
+from typing import List, Dict
+from pytest import raises
+
+    ##########
+    # SEARCH #
+    ##########
+
+# Cell 0 becomes cell 13 * cell 14 + cell 15, then it outputs it
+PATCHED: List[int] = [2,13,14,0, 1,0,15,0, 4,0, 99, 0, 0, 3, 4, 5]
+
+
+def output_is_42(ic: Intcom) -> bool:
+    return ic.outputDest.drain() == [42]
+
+
+def test_patch_space() -> None:
+    """Patch sets are indexed as nested loops over the cells, in order"""
+
+    space: PatchSpace = {1: [0, 1, 2], 5: [7, 8]}
+    assert space_size(space) == 6
+    assert [nth_patches(space, index) for index in range(6)] == [{1: a, 5: b} for a in (0, 1, 2) for b in (7, 8)]
+
+
+def test_search_worker() -> None:
+    """Workers reset their Intcom between runs, patches included"""
+
+    worker: SearchWorker = SearchWorker(list_to_dict(PATCHED), output_is_42)
+    assert not worker.try_patches({13: 5})
+    assert worker.try_patches({13: 6, 14: 6, 15: 6})
+    assert not worker.try_patches({15: 6}) # Cells 13 and 14 are back to 3 and 4
+    assert worker.search_range({15: range(100)}, 0, 100) == (30, 31)
+
+    with raises(ValueError):
+        SearchWorker(list_to_dict([3,0, 99]), output_is_42).try_patches({})
+
+
+def test_search() -> None:
+    """Searches find the first match, in the current process or across a pool"""
+
+    space: PatchSpace = {13: range(10), 14: range(10), 15: range(10)}
+    first: Dict[int, int] = {13: 4, 14: 9, 15: 6} # Smaller products need cell 15 past 9
+
+    result: SearchResult = search(list_to_dict(PATCHED), space, output_is_42, 0, chunkSize=7)
+    assert result.patches == first
+    assert result.runs == 497 # Indices 0 to 496, in chunks of 7
+    assert result.runs_per_second() > 0
+
+    assert search(list_to_dict(PATCHED), space, output_is_42, 2).patches == first
+    assert search(list_to_dict(PATCHED), {15: range(10)}, output_is_42, 2).patches is None
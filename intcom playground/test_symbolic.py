@@ -0,0 +1,61 @@
+from symbolic import *
+from typing import List, Dict
+from pytest import raises
+
+    ######################
+    # SYMBOLIC EXECUTION #
+    ######################
+
+# Cell 0 becomes ((a * b) + input) * a, cell 24 gets a < b, a and b being cells 20 and 21
+POLY: List[int] = [2,20,21,22, 3,23, 1,22,23,22, 2,22,20,0, 7,20,21,24, 99, 0, 0, 0]
+
+
+def test_polynomial() -> None:
+    """Polynomials are simplified into ints when constant, and print as expected"""
+
+    x: Polynomial = Polynomial.variable("x")
+    y: Polynomial = Polynomial.variable("y")
+
+    assert x * x * -3 + y + -4 == Polynomial({("x", "x"): -3, ("y",): 1, (): -4})
+    assert repr(x * x * -3 + y + -4) == "-3*x^2 + y - 4"
+    assert (x + 1) * (x + -1) == x * x + -1
+    assert x + 5 + x * -1 == 5 and isinstance(x * 0, int)
+    assert (x * y * 2 + y).substitute({"x": 3}) == y * 7
+    assert (x * y).degree("x") == 1 and (x * x * y).variables() == {"x", "y"}
+
+
+def test_symbolic_run() -> None:
+    """Symbolic runs build polynomials, and stop when control flow depends on symbols"""
+
+    ic: SymbolicIntcom = SymbolicIntcom(list_to_dict(POLY), {20: "a", 21: "b"}, [3])
+    assert ic.run() and ic.reason is None
+    a, b = Polynomial.variable("a"), Polynomial.variable("b")
+    assert ic.memory[0] == (a * b + 3) * a
+    assert ic.memory[24] is UNKNOWN # Compares symbols, but nothing jumps on it
+    assert ic.instructionCount == 6
+
+    jumping: SymbolicIntcom = SymbolicIntcom(list_to_dict([1006,9,7, 104,1, 1105,1,99, 99, 0]), {9: "x"})
+    assert not jumping.run()
+    assert jumping.reason == "Jump depending on a symbolic value @ 0"
+
+    writing: SymbolicIntcom = SymbolicIntcom(list_to_dict([3,5, 99]), {1: "x"}, [1])
+    assert not writing.run() and writing.reason.startswith("Write to a symbolic address")
+    assert not SymbolicIntcom(list_to_dict([1105,1,0]), {}).run(budget=10)
+
+
+def test_solve() -> None:
+    """Solving inverts a symbolic run's polynomial, or falls back to concrete runs"""
+
+    prog: Dict[int, int] = list_to_dict(POLY)
+    domains: Dict[str, range] = {"a": range(10), "b": range(10)}
+    assert solve(prog, {20: "a", 21: "b"}, 0, (7 * 4 + 3) * 7, domains, [3]) == {"a": 7, "b": 4}
+    assert concrete_solve(prog, {20: "a", 21: "b"}, 0, (7 * 4 + 3) * 7, domains, [3]) == {"a": 7, "b": 4}
+    assert solve(prog, {20: "a", 21: "b"}, 0, 1, domains, [3]) is None
+    assert invert(Polynomial.variable("x") * Polynomial.variable("x"), 49, {"x": range(-10, 10)}) == {"x": -7}
+
+    # Counts down cell 12 (the variable) to 0, adding 3 to cell 13 each time : control flow depends on it
+    loop: Dict[int, int] = list_to_dict([101,3,13,13, 101,-1,12,12, 1005,12,0, 99, 0, 0])
+    assert not SymbolicIntcom(loop, {12: "n"}).run()
+    assert solve(loop, {12: "n"}, 13, 21, {"n": range(1, 10)}) == {"n": 7}
+    with raises(ValueError):
+        solve(list_to_dict([3,0, 99]), {1: "x"}, 0, 0, {"x": range(3)})
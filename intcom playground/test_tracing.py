@@ -0,0 +1,164 @@
+from tracing import *
+from typing import List, Dict
+from pytest import raises
+
+    ####################
+    # EXECUTION TRACES #
+    ####################
+
+# Outputs 0, 1 and 2 by incrementing its output instruction's operand
+SELF_MODIFYING: List[int] = [104,0,1001,1,1,1,1007,1,3,14,1005,14,0,99,0]
+
+
+def _traced_run(prog: List[int], capacity: int, tmp_path, engine: ENGINE=ENGINE.TABLE) -> Tuple[Intcom, TraceReader]:
+    """Runs a program with tracing on, and reads its trace back"""
+
+    ic: Intcom = Intcom(list_to_dict(prog), "Traced Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[], engine=engine)
+    ic.start_tracing(capacity).flush(str(tmp_path / "empty.trace"))
+    assert len(TraceReader(str(tmp_path / "empty.trace"))) == 0
+
+    ic.run()
+    ic.stop_tracing().flush(str(tmp_path / "run.trace"))
+    return ic, TraceReader(str(tmp_path / "run.trace"))
+
+
+def test_trace(tmp_path) -> None:
+    """Every instruction is traced with its writes, even when the program modifies itself"""
+
+    for engine in ENGINE:
+        ic, reader = _traced_run(SELF_MODIFYING, 100, tmp_path, engine)
+        assert ic.outputDest == [2, 1, 0]
+        assert ic.tracer is None
+
+        entries: List[TraceEntry] = list(reader)
+        assert len(entries) == reader.recorded == ic.instructionCount == 13
+        assert [entry.position for entry in entries] == list(range(13))
+        assert [entry.addr for entry in entries] == [0, 2, 6, 10] * 3 + [13]
+        assert [disassemble_instruction(entry.instr) for entry in reader.filter(opcode=OPCODE.OUT)] == ["OUT 0", "OUT 1", "OUT 2"]
+        assert [(entry.writeAddr, entry.writeValue) for entry in reader.filter(addr=6)] == [(14, 1), (14, 1), (14, 0)]
+        assert entries[3].writeAddr is None
+
+        memory: Dict[int, int] = list_to_dict(SELF_MODIFYING)
+        for entry in reader.replay(memory):
+            pass
+        assert ic.ram == memory
+
+
+def test_trace_ring_buffer(tmp_path) -> None:
+    """Only the last instructions are kept, with their own writes"""
+
+    ic, reader = _traced_run(SELF_MODIFYING, 5, tmp_path)
+
+    assert reader.recorded == 13
+    assert [repr(entry) for entry in reader] == ["#8 @0: OUT 2",
+                                                 "#9 @2: ADD [1], 1, [1] -> [1] = 3",
+                                                 "#10 @6: LT [1], 3, [14] -> [14] = 0",
+                                                 "#11 @10: JIT [14], 0",
+                                                 "#12 @13: HLT"]
+
+
+def test_trace_inputs(tmp_path) -> None:
+    """Inputs are traced as writes, starving ones are not traced"""
+
+    ic: Intcom = Intcom(list_to_dict([3,9,4,9,1105,1,0,99,0,0]), "Traced Intcom", # Echoes its inputs forever
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[7], outputDest=[])
+    tracer: IntcomTracer = ic.start_tracing(10)
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    ic.inputSrc.append(8)
+    assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    tracer.flush(str(tmp_path / "inputs.trace"))
+
+    assert [(entry.writeAddr, entry.writeValue) for entry in TraceReader(str(tmp_path / "inputs.trace")).filter(opcode=OPCODE.IN)] == [(9, 7), (9, 8)]
+
+
+def test_trace_errors(tmp_path) -> None:
+    """Capacities must be positive, and trace files must be traces"""
+
+    with raises(ValueError):
+        IntcomTracer(0)
+
+    (tmp_path / "not.trace").write_bytes(b"not a trace")
+    with raises(ValueError):
+        TraceReader(str(tmp_path / "not.trace"))
+
+
+def test_trace_transfers(tmp_path) -> None:
+    """Addresses are rebuilt from control transfers, the last ones only, and from moves of the pointer between runs"""
+
+    ic, reader = _traced_run(SELF_MODIFYING, 2, tmp_path) # Keeps the last two jumps back to 0
+    assert reader.recorded == 13
+    assert [repr(entry) for entry in reader] == ["#11 @10: JIT [14], 0",
+                                                 "#12 @13: HLT"]
+
+    ic = Intcom(list_to_dict(SELF_MODIFYING), "Traced Intcom",
+                inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                inputSrc=[], outputDest=[])
+    tracer: IntcomTracer = ic.start_tracing(100)
+    assert ic.run_until(STATUS.HAS_OUTPUT) == STATUS.HAS_OUTPUT
+    ic.instPtr = 0 # Outputs 0 again
+    ic.run()
+    tracer.flush(str(tmp_path / "moved.trace"))
+
+    entries: List[TraceEntry] = list(TraceReader(str(tmp_path / "moved.trace")))
+    assert [entry.addr for entry in entries] == [0] + [0, 2, 6, 10] * 3 + [13]
+    assert ic.outputDest == [2, 1, 0, 0]
+
+
+def test_trace_fork(tmp_path) -> None:
+    """Forks don't trace, so their runs stay out of the intcom's trace"""
+
+    ic: Intcom = Intcom(list_to_dict(SELF_MODIFYING), "Traced Intcom",
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=[], outputDest=[])
+    tracer: IntcomTracer = ic.start_tracing(100)
+    assert ic.run_until(STATUS.HAS_OUTPUT) == STATUS.HAS_OUTPUT
+
+    clone: Intcom = ic.fork("Clone")
+    assert clone.tracer is None and ic.tracer is tracer
+    clone.run()
+    assert clone.outputDest == [2, 1, 0]
+
+    ic.run()
+    tracer.flush(str(tmp_path / "forked.trace"))
+
+    entries: List[TraceEntry] = list(TraceReader(str(tmp_path / "forked.trace")))
+    assert len(entries) == ic.instructionCount == 13
+    assert [entry.addr for entry in entries] == [0, 2, 6, 10] * 3 + [13]
+
+
+def test_trace_checkpoints(tmp_path) -> None:
+    """Traced runs are replayed from checkpoints, taken every capacity instructions and when the host changed the intcom"""
+
+    ic: Intcom = Intcom(list_to_dict([3,9,4,9,1105,1,0,99,0,0]), "Traced Intcom", # Echoes its inputs forever
+                        inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                        inputSrc=IntcomChannel(), outputDest=IntcomChannel(), engine=ENGINE.BLOCK)
+    tracer: IntcomTracer = ic.start_tracing(4)
+    for value in range(100):
+        ic.inputSrc.feed(value)
+        assert ic.run_until(STATUS.NEEDS_INPUT) == STATUS.NEEDS_INPUT
+    assert ic.outputDest.drain() == list(range(100))
+    assert len(tracer.checkpoints) <= 3 # Only the ones replays still need are kept
+    tracer.flush(str(tmp_path / "echo.trace"))
+
+    reader: TraceReader = TraceReader(str(tmp_path / "echo.trace"))
+    assert reader.recorded == ic.instructionCount == 300
+    assert [repr(entry) for entry in reader] == ["#296 @4: JIT 1, 0",
+                                                 "#297 @0: IN [9] -> [9] = 99",
+                                                 "#298 @2: OUT [9]",
+                                                 "#299 @4: JIT 1, 0"]
+
+    ic = Intcom(list_to_dict(SELF_MODIFYING), "Traced Intcom",
+                inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                inputSrc=[], outputDest=[])
+    tracer = ic.start_tracing(100)
+    assert ic.run_until(STATUS.HAS_OUTPUT) == STATUS.HAS_OUTPUT
+    ic.ram[1] = 1 # Skips output 1
+    ic.run()
+    tracer.flush(str(tmp_path / "edited.trace"))
+
+    assert len(tracer.checkpoints) == 2
+    assert [disassemble_instruction(entry.instr) for entry in TraceReader(str(tmp_path / "edited.trace")).filter(opcode=OPCODE.OUT)] == ["OUT 0", "OUT 2"]
+    assert ic.outputDest == [2, 0]
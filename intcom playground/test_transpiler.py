@@ -0,0 +1,122 @@
+from transpiler import *
+from typing import List, Dict
+from os import listdir
+from multiprocessing import Pipe
+from pytest import raises
+
+    ####################
+    # TRANSPILER TESTS #
+    ####################
+
+def test_find_code() -> None:
+    """Simple static analysis test : data after the halt is not code"""
+    
+    instrs, entries = find_code(list_to_dict([3, 9, 1005, 9, 7, 104, 0, 4, 9, 99, 0]))
+    
+    assert sorted(instrs.keys()) == [0, 2, 5, 7, 9]
+    assert entries == {0, 2, 5, 7, 9}
+    
+    
+def test_transpile() -> None:
+    """Simple test to see if a transpiled module exposes its blocks"""
+    
+    source: str = transpile(list_to_dict([1101, 1, 3, 5, 99, 0]))
+    namespace: Dict[str, object] = dict()
+    exec(source, namespace)
+    
+    assert list(namespace['BLOCKS'].keys()) == [0]
+    assert namespace['BLOCKS'][0][1] == 4
+    assert namespace['UNCHECKED_WRITES'] == {5: [0]}
+    
+    ram: PagedMemory = PagedMemory()
+    assert namespace['BLOCKS'][0][0](ram.readPages, ram.writePages, ram, 0, {}) == (4, 0, None)
+    assert ram[5] == 4
+    
+    
+def test_transpiled_intcom(tmp_path) -> None:
+    """Day 9 quine, transpiled to a cached module"""
+    
+    intcode: List[int] = [109,1,204,-1,1001,100,1,100,1008,100,16,101,1006,101,0,99]
+    
+    out: List[int] = []
+    ic: TranspiledIntcom = TranspiledIntcom(list_to_dict(intcode), "Heaven's Door",
+                                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                            inputSrc=[], outputDest=out, cacheDir=str(tmp_path))
+    ic.run()
+    
+    assert out[::-1] == intcode
+    assert [f for f in listdir(tmp_path) if f.endswith(".py")] == [f"intcode_{program_hash(list_to_dict(intcode))[:24]}.py"]
+    
+    out2: List[int] = []
+    ic2: TranspiledIntcom = TranspiledIntcom(list_to_dict(intcode), "Heaven's Door Again",
+                                             inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                             inputSrc=[], outputDest=out2, cacheDir=str(tmp_path))
+    ic2.run()
+    
+    assert out2 == out
+    
+    
+def test_transpiled_intcom_deoptimization(tmp_path) -> None:
+    """Self-modifying test : cells static analysis took for data get run after a dynamic jump"""
+    
+    intcode: List[int] = [0] * 51
+    intcode[0:11] = [1101, 0, 104, 20, 1001, 41, 5, 21, 105, 1, 50] # ram[20] = OUT, ram[21] = ram[41] + 5, goto ram[50]
+    intcode[22:34] = [1001, 41, 1, 41, 1007, 41, 2, 42, 1005, 42, 0, 99] # Loops twice
+    intcode[50] = 20
+    
+    out: List[int] = []
+    ic: TranspiledIntcom = TranspiledIntcom(list_to_dict(intcode), "Echoes",
+                                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                            inputSrc=[], outputDest=out, cacheDir=str(tmp_path))
+    ic.run()
+    
+    assert out[::-1] == [5, 6]
+    assert ic.uncheckedWrites == {}
+    
+    
+def test_piped_transpiled_intcom(tmp_path) -> None:
+    """Piped transpiled intcoms take the same framing and recording arguments as piped ones"""
+    
+    intcomIn, hostOut = Pipe(False)
+    hostIn, intcomOut = Pipe(False)
+    process: Process = piped_transpiled_intcom_as_a_process(list_to_dict([3,20,1001,20,1,20,4,20,1005,20,0,99]),
+                                                            intcomIn, intcomOut, str(tmp_path / "framed.session"), framed=True)
+    framedOut: FramedPipe = FramedPipe(hostOut)
+    framedIn: FramedPipe = FramedPipe(hostIn)
+    process.start()
+    framedOut.send_many([5, 6])
+    assert framedIn.recv_turn() == [] # Answer before the first input
+    assert framedIn.recv_turn() == [6, 7]
+    framedOut.send_many([-1])
+    assert framedIn.recv_turn() == [0] and framedIn.closed()
+    process.join()
+    assert IOSession.load(str(tmp_path / "framed.session")).outputs() == [6, 7, 0]
+    
+    
+def test_transpiled_limits(tmp_path) -> None:
+    """Transpiled intcoms take Intcom's limits : runaway programs stop at them, in their process too"""
+    
+    runaway: Dict[int, int] = list_to_dict([1101,0,0,7, 1105,1,0]) # Loops forever
+    ic: TranspiledIntcom = TranspiledIntcom(runaway, "Runaway Intcom",
+                                            inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                                            inputSrc=[], outputDest=[], cacheDir=str(tmp_path), maxInstructions=1000)
+    assert ic.run() == STATUS.LIMIT_REACHED
+    assert ic.instructionCount == 1000
+    
+    ic = TranspiledIntcom(runaway, "Looping Intcom",
+                          inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                          inputSrc=[], outputDest=[], cacheDir=str(tmp_path), detectLoops=True)
+    assert ic.run() == STATUS.LOOPING
+    
+    intcomIn, hostOut = Pipe(False)
+    hostIn, intcomOut = Pipe(False)
+    process: Process = piped_transpiled_intcom_as_a_process(runaway, intcomIn, intcomOut, timeLimit=0.05)
+    process.start()
+    intcomOut.close() # Only the process holds it now
+    with raises(EOFError):
+        hostIn.recv()
+    process.join()
+    
+    with raises(ValueError):
+        TranspiledIntcom(runaway, inputMethod=IO_METHOD.LIST, outputMethod=IO_METHOD.LIST,
+                         inputSrc=[], outputDest=[], cacheDir=str(tmp_path), engine=ENGINE.TABLE)
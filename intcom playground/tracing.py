@@ -0,0 +1,172 @@
+from __future__ import annotations
+from intcom import *
+from typing import Dict, Iterator, List, Tuple
+from array import array
+from bisect import bisect_right
+
+    #####################
+    # TRACE ENTRY CLASS #
+    #####################
+
+class TraceEntry(object):
+    """An instruction of a trace, as read back from a trace file"""
+
+    __slots__ = ('position', 'addr', 'instr', 'writeAddr', 'writeValue')
+
+    def __init__(self, position: int, addr: int, instr: DecodedInstruction, writeAddr: int=None, writeValue: int=None) -> None:
+        """Initializes a trace entry
+
+        Arguments:
+            position {int} -- Position of the instruction in the run, from the start of the trace
+            addr {int} -- Address of the instruction
+            instr {DecodedInstruction} -- The instruction, as it was decoded
+
+        Keyword Arguments:
+            writeAddr {int} -- Address the instruction wrote to, None if it did not write (default: {None})
+            writeValue {int} -- Value it wrote (default: {None})
+        """
+
+        self.position: int = position
+        self.addr: int = addr
+        self.instr: DecodedInstruction = instr
+        self.writeAddr: int = writeAddr
+        self.writeValue: int = writeValue
+
+    @property
+    def opcode(self) -> OPCODE:
+        return self.instr.opcode
+
+    @property
+    def operands(self) -> Tuple[int, ...]:
+        return self.instr.operands
+
+    def __repr__(self) -> str:
+        written: str = f" -> [{self.writeAddr}] = {self.writeValue}" if self.writeAddr is not None else ""
+        return f"#{self.position} @{self.addr}: {disassemble_instruction(self.instr)}{written}"
+
+    ######################
+    # TRACE READER CLASS #
+    ######################
+
+class TraceReader(object):
+    """Reads a trace file written by IntcomTracer.flush. Recorded instructions are rebuilt from the
+    trace alone, without executing anything : starting from a recorded control transfer, every
+    instruction is the one defined last at its address, and the next one is either right after it or
+    at the next recorded transfer. Instructions that write get their recorded writes, in order. The
+    last ``capacity`` instructions are rebuilt, fewer if fewer were recorded."""
+
+    def __init__(self, filePath: str) -> None:
+        """Loads a trace file, and rebuilds its instructions' addresses
+
+        Arguments:
+            filePath {str} -- The trace file
+
+        Raises:
+            ValueError -- The file is not a trace
+        """
+
+        with open(filePath, "rb") as traceFile:
+            if traceFile.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+                raise ValueError(f"TRACE ERROR : Not a trace file ({filePath})")
+
+            header: array = array('q')
+            header.fromfile(traceFile, 5)
+            self.recorded, self.capacity, transferCount, writeCount, definitionCount = header
+
+            self.definitions: array = array('q')
+            self.definitions.fromfile(traceFile, definitionCount * TRACE_DEFINITION_SIZE)
+            self.transfers: array = array('q')
+            self.transfers.fromfile(traceFile, transferCount * TRACE_TRANSFER_SIZE)
+            self.writes: array = array('q')
+            self.writes.fromfile(traceFile, writeCount * TRACE_WRITE_SIZE)
+
+        self.addresses: array = array('q') # Address of every instruction of the trace, oldest first
+        self.instrs: List[DecodedInstruction] = [] # Every instruction of the trace, as decoded, oldest first
+        self._rebuild()
+        self.first: int = self.recorded - len(self.addresses) # Position of the first instruction in the trace
+
+    def _definition(self, index: int) -> Tuple[int, int, DecodedInstruction]:
+        """Returns a definition's position, address and decoded instruction"""
+
+        position, addr, rawOpcode, *operands = self.definitions[index * TRACE_DEFINITION_SIZE:(index + 1) * TRACE_DEFINITION_SIZE]
+        opcode, plan = decode_opcode(rawOpcode, addr)
+        operands = tuple(operands[:len(plan)])
+        return position, addr, DecodedInstruction(opcode, Intcom._EXECUTORS[opcode], operands, plan)
+
+    def _rebuild(self) -> None:
+        """Rebuilds the addresses and instructions of the last recorded instructions, walking the
+        program from the last control transfer before them"""
+
+        positions: array = self.transfers[0::TRACE_TRANSFER_SIZE]
+        targets: array = self.transfers[1::TRACE_TRANSFER_SIZE]
+        if len(positions) == 0:
+            return
+        first: int = max(self.recorded - self.capacity, positions[0]) # First position that can be rebuilt
+
+        definitionCount: int = len(self.definitions) // TRACE_DEFINITION_SIZE
+        nextDefinition: int = 0
+        code: Dict[int, DecodedInstruction] = dict() # Instruction defined last at each address
+
+        nextTransfer: int = bisect_right(positions, first) - 1 # Last transfer before the first rebuilt instruction
+        addr: int = None
+        for position in range(positions[nextTransfer], self.recorded):
+            while nextTransfer < len(positions) and positions[nextTransfer] == position: # Pointer moved twice : the last move counts
+                addr = targets[nextTransfer]
+                nextTransfer += 1
+            while nextDefinition < definitionCount and self.definitions[nextDefinition * TRACE_DEFINITION_SIZE] <= position:
+                _, definedAddr, instr = self._definition(nextDefinition)
+                code[definedAddr] = instr
+                nextDefinition += 1
+
+            instr = code[addr]
+            if position >= first:
+                self.addresses.append(addr)
+                self.instrs.append(instr)
+            addr += instr.length
+
+    def __len__(self) -> int:
+        """Number of instructions in the trace"""
+
+        return len(self.addresses)
+
+    def __iter__(self) -> Iterator[TraceEntry]:
+        """Iterates over the instructions of the trace, oldest first"""
+
+        writing: List[bool] = [OPCODE_KIND[instr.opcode] == OP_KIND.WRITE or instr.opcode == OPCODE.IN for instr in self.instrs]
+
+        # Last writes belong to the last writing instructions, older ones belong to instructions that can't be rebuilt anymore
+        write: int = len(self.writes) // TRACE_WRITE_SIZE - sum(writing)
+        for offset, (addr, instr) in enumerate(zip(self.addresses, self.instrs)):
+            if writing[offset]:
+                yield TraceEntry(self.first + offset, addr, instr, self.writes[2 * write], self.writes[2 * write + 1])
+                write += 1
+            else:
+                yield TraceEntry(self.first + offset, addr, instr)
+
+    def filter(self, addr: int=None, opcode: OPCODE=None, writeAddr: int=None) -> Iterator[TraceEntry]:
+        """Iterates over the instructions of the trace matching every given criterion, oldest first
+
+        Keyword Arguments:
+            addr {int} -- Address of the instruction (default: {None})
+            opcode {OPCODE} -- Its opcode (default: {None})
+            writeAddr {int} -- Address it wrote to (default: {None})
+        """
+
+        for entry in self:
+            if ((addr is None or entry.addr == addr) and (opcode is None or entry.opcode == opcode)
+                    and (writeAddr is None or entry.writeAddr == writeAddr)):
+                yield entry
+
+    def replay(self, memory: Dict[int, int]) -> Iterator[TraceEntry]:
+        """Replays the trace's writes on a memory, yielding every instruction of the trace once its
+        write is applied. Given the memory as it was when the trace starts, it goes through every
+        state the intcom's memory went through.
+
+        Arguments:
+            memory {Dict[int, int]} -- The memory to write to, updated in place
+        """
+
+        for entry in self:
+            if entry.writeAddr is not None:
+                memory[entry.writeAddr] = entry.writeValue
+            yield entry
@@ -0,0 +1,194 @@
+from __future__ import annotations
+from intcom import *
+from analysis import find_code
+from typing import Callable, Dict, List, Set, Tuple, Union
+from types import ModuleType
+from importlib.util import spec_from_file_location, module_from_spec
+from hashlib import sha256
+from os import path, makedirs, replace, getpid
+
+    #############
+    # CONSTANTS #
+    #############
+
+TRANSPILER_VERSION: int = 5 # Bump it whenever generated modules change, so that cached ones get regenerated
+
+DEFAULT_CACHE_DIR: str = path.join(path.dirname(path.abspath(__file__)), "__intcomcache__")
+
+    ##############
+    # TRANSPILER #
+    ##############
+
+def program_hash(prog: Dict[int, int]) -> str:
+    """Returns the hash keying a program's generated module"""
+
+    content: str = f"{TRANSPILER_VERSION}:" + ",".join(str(prog[i]) for i in sorted(prog))
+    return sha256(content.encode()).hexdigest()
+
+
+def transpile(prog: Dict[int, int]) -> str:
+    """Transpiles a whole program into the source of a standalone Python module. Every block found by
+    static analysis becomes a function, see CompiledBlock for their signature. The module exposes :
+
+    - ``BLOCKS`` : (function, end, ends) of every block, by entry address (see CompiledBlock)
+    - ``UNCHECKED_WRITES`` : block entries whose positional writes to a given cell are not checked,
+      as static analysis proved this cell is not code. If it ever becomes code, they must be dropped.
+
+    Arguments:
+        prog {Dict[int, int]} -- The program, as given by list_to_dict
+
+    Returns:
+        str -- The module's source
+    """
+
+    instrs, entries = find_code(prog)
+
+    codeCells: Set[int] = set()
+    for addr, instr in instrs.items():
+        codeCells.update(range(addr, addr + instr.length))
+    dataCells: Set[int] = {instr.c for instr in instrs.values()
+                           if OPCODE_KIND[instr.opcode] == OP_KIND.WRITE and instr.plan[2] == ARG_PLAN.POS_ADDRESS
+                           and instr.c not in codeCells}
+
+    lines: List[str] = [f"# Generated by transpiler.py (version {TRANSPILER_VERSION}), do not edit",
+                        f"# Program hash : {program_hash(prog)}",
+                        ""]
+    blocks: List[str] = []
+    uncheckedWrites: Dict[int, List[int]] = dict()
+
+    for entry in sorted(entries):
+        blockInstrs: List[Tuple[int, DecodedInstruction]] = []
+        addr: int = entry
+        while addr in instrs and len(blockInstrs) < BLOCK_MAX_LENGTH and instrs[addr].kind != OP_KIND.CYCLE:
+            blockInstrs.append((addr, instrs[addr]))
+            addr += instrs[addr].length
+            if blockInstrs[-1][1].kind == OP_KIND.JUMP:
+                break
+        if len(blockInstrs) == 0:
+            continue
+
+        lines.append("")
+        lines.append(block_source(blockInstrs, f"block_{entry}", dataCells))
+        ends: Tuple[int, ...] = tuple(instrAddr + instr.length for instrAddr, instr in blockInstrs)
+        blocks.append(f"    {entry}: (block_{entry}, {addr}, {ends!r}),")
+        for _, instr in blockInstrs:
+            if OPCODE_KIND[instr.opcode] == OP_KIND.WRITE and instr.c in dataCells and instr.plan[2] == ARG_PLAN.POS_ADDRESS:
+                uncheckedWrites.setdefault(instr.c, []).append(entry)
+
+    lines.append("")
+    lines.append("BLOCKS = {")
+    lines.extend(blocks)
+    lines.append("}")
+    lines.append("")
+    lines.append(f"UNCHECKED_WRITES = {uncheckedWrites!r}")
+
+    return "\n".join(lines) + "\n"
+
+
+def load_transpiled(prog: Dict[int, int], cacheDir: str=DEFAULT_CACHE_DIR) -> ModuleType:
+    """Returns a program's transpiled module, from the cache directory if it was already generated
+
+    Arguments:
+        prog {Dict[int, int]} -- The program, as given by list_to_dict
+
+    Keyword Arguments:
+        cacheDir {str} -- Where generated modules are stored (default: {DEFAULT_CACHE_DIR})
+    """
+
+    key: str = program_hash(prog)
+    modulePath: str = path.join(cacheDir, f"intcode_{key[:24]}.py")
+
+    if not path.exists(modulePath):
+        makedirs(cacheDir, exist_ok=True)
+        tempPath: str = f"{modulePath}.{getpid()}.tmp" # Other processes may be generating it too
+        with open(tempPath, "w") as moduleFile:
+            moduleFile.write(transpile(prog))
+        replace(tempPath, modulePath)
+
+    spec = spec_from_file_location(f"intcode_{key[:24]}", modulePath)
+    module: ModuleType = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+    ###########################
+    # TRANSPILED INTCOM CLASS #
+    ###########################
+
+class TranspiledIntcom(Intcom):
+    """An Intcom running its program's transpiled module with the block engine. Anything static
+    analysis missed (dynamic jumps targets, self-modified code) is compiled at runtime as usual."""
+
+    # Transpiled modules already loaded by this process, by program hash
+    _modules: Dict[str, ModuleType] = dict()
+    
+    _SNAPSHOT_CACHES: Tuple[str, ...] = Intcom._SNAPSHOT_CACHES + ('uncheckedWrites',)
+
+    def __init__(self, prog:Dict[int, int], name: str="Default Intcom", *,
+                 cacheDir: str=DEFAULT_CACHE_DIR, **kwargs) -> None:
+        """Initializes a transpiled Intcom. See Intcom for the arguments, its engine is always the block one.
+
+        Keyword Arguments:
+            cacheDir {str} -- Where generated modules are stored (default: {DEFAULT_CACHE_DIR})
+
+        Raises:
+            ValueError -- Transpiled Intcoms only run with the block engine
+        """
+
+        if kwargs.setdefault('engine', ENGINE.BLOCK) != ENGINE.BLOCK:
+            raise ValueError(f"CONSTRUCTION ERROR : Transpiled Intcoms only run with the block engine : {kwargs['engine']}")
+        super().__init__(prog, name, **kwargs)
+
+        key: str = program_hash(prog)
+        if key not in TranspiledIntcom._modules:
+            TranspiledIntcom._modules[key] = load_transpiled(prog, cacheDir)
+        module: ModuleType = TranspiledIntcom._modules[key]
+
+        self.uncheckedWrites: Dict[int, List[int]] = dict(module.UNCHECKED_WRITES)
+        for entry, (function, end, ends) in module.BLOCKS.items():
+            self.blockCache[entry] = CompiledBlock(entry, end, function=function, ends=ends)
+            super()._cache_cells(entry, end)
+
+    def _cache_cells(self, owner:int, end:int) -> None:
+        """Marks cells as covered by a cached instruction or block. Transpiled blocks whose writes to
+        these cells are not checked get dropped, to be compiled again with checks.
+
+        Arguments:
+            owner {int} -- Address of the cached instruction or block
+            end {int} -- Address right after the last covered cell
+        """
+
+        super()._cache_cells(owner, end)
+
+        for cell in range(owner, end):
+            for entry in self.uncheckedWrites.pop(cell, ()):
+                self._uncache(entry)
+
+
+def piped_transpiled_intcom_as_a_process(intcode: Dict[int, int], inPipe: PipeConnection, outPipe: PipeConnection,
+                                         recordPath: str=None, framed: bool=False, maxInstructions: int=None,
+                                         timeLimit: float=None) -> Process:
+    """Returns a process ready to run specified intcode transpiled, I/O made by passed pipes. Takes
+    the same arguments as piped_intcom_as_a_process, so that hosts can use either of them unchanged."""
+
+    return Process(target=_run_piped_transpiled_intcom, args=(intcode, inPipe, outPipe, recordPath, framed, maxInstructions, timeLimit))
+
+
+def _run_piped_transpiled_intcom(intcode: Dict[int, int], inPipe: PipeConnection, outPipe: PipeConnection,
+                                 recordPath: str=None, framed: bool=False, maxInstructions: int=None,
+                                 timeLimit: float=None) -> None:
+    """Runs a transpiled computer specifically created. If one of its limits stops it, its output
+    pipe is closed, so that readers stop waiting for it."""
+
+    method: IO_METHOD = IO_METHOD.FRAMED if framed else IO_METHOD.PIPE
+    ic: TranspiledIntcom = TranspiledIntcom(intcode, "Piped Transpiled Intcom",
+                                            inputMethod=method, outputMethod=method,
+                                            inputSrc=FramedPipe(inPipe) if framed else inPipe,
+                                            outputDest=FramedPipe(outPipe) if framed else outPipe,
+                                            maxInstructions=maxInstructions, timeLimit=timeLimit)
+    if recordPath is not None:
+        ic.start_recording(recordPath)
+    if ic.run() != STATUS.HALTED:
+        if framed:
+            ic.outputDest.flush(FRAME_FLAG.CLOSED)
+        outPipe.close()
+    ic.stop_recording()